@@ -0,0 +1,35 @@
+"""add_consultations_experiment_index
+
+Revision ID: c4e8a2d9f713
+Revises: 51d0e88085b3
+Create Date: 2026-10-18 09:12:31.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2d9f713'
+down_revision: Union[str, Sequence[str], None] = '51d0e88085b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Expression index so load_experiment_outcomes' metadata->>'experiment'
+    # filter uses an index scan instead of parsing JSON on every row
+    op.create_index(
+        'ix_consultations_experiment',
+        'consultations',
+        [sa.text("(metadata ->> 'experiment')")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_consultations_experiment', table_name='consultations')
@@ -0,0 +1,36 @@
+"""restore_embedding_hnsw_indexes
+
+Revision ID: c5ff211e83df
+Revises: c4e8a2d9f713
+Create Date: 2026-10-18 14:37:05.216904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5ff211e83df'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2d9f713'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose embedding HNSW index was dropped by the autogenerated
+# 51d0e88085b3 migration, leaving similarity search as a sequential scan
+EMBEDDING_TABLES = ('memories', 'cases', 'rules', 'fca_knowledge', 'pension_knowledge')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in EMBEDDING_TABLES:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_embedding_idx '
+            f'ON {table} USING hnsw (embedding vector_cosine_ops)'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(EMBEDDING_TABLES):
+        op.execute(f'DROP INDEX IF EXISTS {table}_embedding_idx')
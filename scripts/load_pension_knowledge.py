@@ -3,13 +3,14 @@ Load pension knowledge from structured Python module to database with embeddings
 """
 
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 from uuid import uuid4
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from guidance_agent.knowledge.pension_knowledge import PENSION_KNOWLEDGE
+from guidance_agent.knowledge.pension_knowledge import PENSION_KNOWLEDGE, thaw
 from guidance_agent.core.database import get_session, PensionKnowledge
 from guidance_agent.retrieval.embeddings import embed
 
@@ -34,7 +35,7 @@ def load_pension_knowledge_to_db():
             category="pension_type",
             subcategory=pension_type,
             embedding=embed(content),
-            meta=info
+            meta=thaw(info)
         )
         session.add(entry)
         count += 1
@@ -43,7 +44,7 @@ def load_pension_knowledge_to_db():
     # Process regulations
     print("\nProcessing regulations...")
     for regulation_name, info in PENSION_KNOWLEDGE["regulations"].items():
-        if isinstance(info, dict):
+        if isinstance(info, Mapping):
             content = f"{regulation_name}: "
             content += " ".join([f"{k}={v}" for k, v in info.items() if isinstance(v, (str, int, float))])
 
@@ -53,7 +54,7 @@ def load_pension_knowledge_to_db():
                 category="regulation",
                 subcategory=regulation_name,
                 embedding=embed(content),
-                meta=info
+                meta=thaw(info)
             )
             session.add(entry)
             count += 1
@@ -93,7 +94,7 @@ def load_pension_knowledge_to_db():
             category="typical_scenario",
             subcategory=scenario_name,
             embedding=embed(content),
-            meta=info
+            meta=thaw(info)
         )
         session.add(entry)
         count += 1
@@ -103,7 +104,7 @@ def load_pension_knowledge_to_db():
     print("\nProcessing fee structures...")
     for fee_category, info in PENSION_KNOWLEDGE["fee_structures"].items():
         content = f"Fee structure for {fee_category}: "
-        if isinstance(info, dict):
+        if isinstance(info, Mapping):
             content += " ".join([f"{k}={v}" for k, v in info.items()])
         
         entry = PensionKnowledge(
@@ -112,7 +113,7 @@ def load_pension_knowledge_to_db():
             category="fee_structure",
             subcategory=fee_category,
             embedding=embed(content),
-            meta=info
+            meta=thaw(info)
         )
         session.add(entry)
         count += 1
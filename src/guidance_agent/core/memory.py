@@ -283,17 +283,13 @@ class MemoryStream:
         Returns:
             Cosine similarity score between -1 and 1
         """
-        if len(vec1) != len(vec2):
-            return 0.0
+        # Imported here: embeddings imports guidance_agent.core, which imports this module
+        from guidance_agent.retrieval.embeddings import cosine_similarity
 
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
-
-        if magnitude1 == 0 or magnitude2 == 0:
+        if len(vec1) != len(vec2):
             return 0.0
 
-        return dot_product / (magnitude1 * magnitude2)
+        return cosine_similarity(vec1, vec2)
 
     def _load_from_database(self) -> None:
         """Load existing memories from database into stream."""
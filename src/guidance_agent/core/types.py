@@ -99,7 +99,7 @@ class CustomerProfile:
     created_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutcomeResult:
     """Result of a guidance consultation."""
 
@@ -150,6 +150,40 @@ class OutcomeResult:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "OutcomeResult":
+        """Create outcome from dictionary.
+
+        Missing keys fall back to the field defaults, so partially populated
+        outcome records can still be loaded.
+        """
+        kwargs = {
+            key: data[key]
+            for key in (
+                "successful",
+                "customer_satisfaction",
+                "comprehension",
+                "goal_alignment",
+                "risks_identified",
+                "guidance_appropriate",
+                "fca_compliant",
+                "understanding_checked",
+                "signposted_when_needed",
+                "has_db_pension",
+                "db_warning_given",
+                "reasoning",
+                "issues",
+            )
+            if key in data
+        }
+        if "outcome_id" in data:
+            kwargs["outcome_id"] = UUID(data["outcome_id"])
+        if "status" in data:
+            kwargs["status"] = OutcomeStatus(data["status"])
+        if "timestamp" in data:
+            kwargs["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return cls(**kwargs)
+
 
 @dataclass
 class Case:
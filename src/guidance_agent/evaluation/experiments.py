@@ -4,11 +4,18 @@ This module provides experiment tracking for training runs, with automatic
 tracing via Phoenix/OpenTelemetry and database storage for results.
 """
 
+import logging
 import os
-from typing import List, Optional
+import random
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, List, Optional
 from datetime import datetime, timezone
 from uuid import uuid4
 from opentelemetry import trace
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
 
 from guidance_agent.evaluation.evaluator import run_consultation
 from guidance_agent.evaluation.metrics import calculate_metrics, AdvisorMetrics
@@ -16,49 +23,131 @@ from guidance_agent.advisor.agent import AdvisorAgent
 from guidance_agent.customer.agent import CustomerAgent
 from guidance_agent.customer.generator import generate_customer_profile
 from guidance_agent.core.types import OutcomeResult
-from guidance_agent.core.database import get_session, Consultation
+from guidance_agent.core.database import (
+    CONSULTATION_EXPERIMENT,
+    Consultation,
+    get_session,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of customer profiles generated concurrently (LLM-bound)
+CUSTOMER_GENERATION_WORKERS = 4
+
+# Consultations always recorded on the experiment span before sampling starts
+SPAN_ALWAYS_KEEP = 20
+
+
+def _generate_customer(_: int) -> CustomerAgent:
+    """Generate a new simulated customer for an experiment run."""
+    return CustomerAgent(profile=generate_customer_profile())
+
+
+def _generate_customers(
+    pool: ThreadPoolExecutor, num_customers: int
+) -> Iterator[CustomerAgent]:
+    """Yield generated customers in order, keeping the pool's queue bounded.
+
+    At most CUSTOMER_GENERATION_WORKERS generations are in flight; another is
+    submitted as each customer is consumed, so an early stop leaves little
+    unstarted work behind.
+    """
+    pending: deque[Future] = deque()
+    for index in range(num_customers):
+        if len(pending) == CUSTOMER_GENERATION_WORKERS:
+            yield pending.popleft().result()
+        pending.append(pool.submit(_generate_customer, index))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _record_progress_checkpoint(
+    span: trace.Span, progress: int, checkpoint: Future
+) -> None:
+    """Add a progress_checkpoint event once checkpoint metrics are ready.
+
+    A failed metrics calculation is logged and recorded on the span rather
+    than raised, since it runs off the consultation loop.
+    """
+    error = checkpoint.exception()
+    if error is not None:
+        logger.error("Progress checkpoint at %d failed", progress, exc_info=error)
+        span.record_exception(error, attributes={"progress": progress})
+        return
+
+    current_metrics = checkpoint.result()
+    span.add_event(
+        "progress_checkpoint",
+        attributes={
+            "progress": progress,
+            "avg_satisfaction": current_metrics.satisfaction,
+            "compliance_rate": current_metrics.compliance_rate,
+            "overall_quality": current_metrics.overall_quality,
+        },
+    )
 
 
 def store_experiment_outcomes(
-    experiment_name: str, outcomes: List[OutcomeResult]
+    experiment_name: str,
+    outcomes: List[OutcomeResult],
+    session: Optional[Session] = None,
 ) -> None:
     """Store experiment outcomes in database for future analysis.
 
     Args:
         experiment_name: Name of the experiment
         outcomes: List of consultation outcomes to store
+        session: Optional existing session to reuse. The caller owns its
+            transaction, so rows are flushed but not committed. When omitted
+            a new session is opened, committed and closed.
 
     Example:
         >>> outcomes = [OutcomeResult(...), ...]
         >>> store_experiment_outcomes("baseline_v1", outcomes)
     """
-    session = get_session()
+    # Build all rows in one pass, then insert them in a single bulk statement
+    # rather than adding ORM objects one at a time
+    meta = {"experiment": experiment_name}
+    rows = [
+        {
+            "id": uuid4(),
+            "customer_id": uuid4(),  # Placeholder
+            "advisor_id": uuid4(),  # Placeholder
+            "conversation": [],  # Not storing full conversation here
+            "outcome": outcome.to_dict(),
+            "start_time": outcome.timestamp,
+            "end_time": outcome.timestamp,
+            "duration_seconds": 0,
+            "meta": meta,
+        }
+        for outcome in outcomes
+    ]
+
+    owns_session = session is None
+    if owns_session:
+        session = get_session()
     try:
-        for outcome in outcomes:
-            # Create consultation record
-            consultation = Consultation(
-                id=uuid4(),
-                customer_id=uuid4(),  # Placeholder
-                advisor_id=uuid4(),  # Placeholder
-                conversation=[],  # Not storing full conversation here
-                outcome=outcome.to_dict(),
-                start_time=outcome.timestamp,
-                end_time=outcome.timestamp,
-                duration_seconds=0,
-                meta={"experiment": experiment_name},
-            )
-            session.add(consultation)
+        if rows:
+            session.execute(insert(Consultation), rows)
 
-        session.commit()
+        if owns_session:
+            session.commit()
+        else:
+            session.flush()
     finally:
-        session.close()
+        if owns_session:
+            session.close()
 
 
-def load_experiment_outcomes(experiment_name: str) -> List[OutcomeResult]:
+def load_experiment_outcomes(
+    experiment_name: str, session: Optional[Session] = None
+) -> List[OutcomeResult]:
     """Load previously stored experiment outcomes from database.
 
     Args:
         experiment_name: Name of the experiment to load
+        session: Optional existing session to reuse (left open for the
+            caller). When omitted a new session is opened and closed.
 
     Returns:
         List of OutcomeResult instances from the experiment
@@ -67,28 +156,25 @@ def load_experiment_outcomes(experiment_name: str) -> List[OutcomeResult]:
         >>> outcomes = load_experiment_outcomes("baseline_v1")
         >>> metrics = calculate_metrics(outcomes)
     """
-    session = get_session()
+    owns_session = session is None
+    if owns_session:
+        session = get_session()
     try:
-        # Query consultations for this experiment
-        consultations = (
-            session.query(Consultation)
-            .filter(Consultation.meta["experiment"].astext == experiment_name)
-            .all()
+        # Select only the outcome JSON column and stream it in chunks rather
+        # than hydrating full Consultation rows (including conversations)
+        stmt = (
+            select(Consultation.outcome)
+            .where(CONSULTATION_EXPERIMENT == experiment_name)
+            .execution_options(yield_per=1000)
         )
 
-        # Convert to OutcomeResult instances
-        outcomes = []
-        for consultation in consultations:
-            # Note: This is a simplified conversion
-            # In production, you'd properly reconstruct OutcomeResult from dict
-            outcome_dict = consultation.outcome
-            # For now, just return empty list if no outcomes
-            # Real implementation would deserialize properly
-            pass
-
-        return outcomes
+        return [
+            OutcomeResult.from_dict(outcome_dict)
+            for outcome_dict in session.execute(stmt).scalars()
+        ]
     finally:
-        session.close()
+        if owns_session:
+            session.close()
 
 
 def run_training_experiment(
@@ -98,6 +184,8 @@ def run_training_experiment(
     num_customers: int = 100,
     progress_interval: int = 100,
     max_turns: int = 20,
+    span_sample_rate: float = 0.05,
+    session: Optional[Session] = None,
 ) -> AdvisorMetrics:
     """Run training experiment with Phoenix tracing and metrics tracking.
 
@@ -111,6 +199,11 @@ def run_training_experiment(
         num_customers: Number of customers to generate if test_customers empty
         progress_interval: Log progress every N consultations (default 100)
         max_turns: Maximum turns per consultation (default 20)
+        span_sample_rate: Fraction of consultations after the first
+            SPAN_ALWAYS_KEEP whose evaluations are recorded on the span
+            (non-compliant consultations are always recorded)
+        session: Optional existing session used to store the outcomes, so
+            the write joins the caller's transaction
 
     Returns:
         AdvisorMetrics with final performance metrics
@@ -140,48 +233,78 @@ def run_training_experiment(
         },
     ) as span:
         outcomes: List[OutcomeResult] = []
+        sampled_indices: List[int] = []
+        satisfactions: List[float] = []
+        compliances: List[float] = []
 
         # Use provided customers or generate new ones
+        generation_pool = None
         if test_customers:
             customers = test_customers[:num_customers]
         else:
-            # Generate customers on the fly
-            customers = []
-            for i in range(num_customers):
-                profile = generate_customer_profile()
-                customer = CustomerAgent(profile=profile)
-                customers.append(customer)
-
-        # Run consultations
-        for i, customer in enumerate(customers):
-            # Run consultation (automatically traced by LiteLLM instrumentation!)
-            outcome = run_consultation(advisor, customer, max_turns=max_turns)
-            outcomes.append(outcome)
-
-            # Add evaluations as span attributes for each consultation
-            span.set_attribute(
-                f"consultation.{i}.satisfaction", outcome.customer_satisfaction
-            )
-            span.set_attribute(
-                f"consultation.{i}.compliance", float(outcome.fca_compliant)
+            # Generate customers in the background so profile generation
+            # overlaps with consultations; each customer is consumed as soon
+            # as it is ready
+            generation_pool = ThreadPoolExecutor(
+                max_workers=CUSTOMER_GENERATION_WORKERS
             )
+            customers = _generate_customers(generation_pool, num_customers)
+
+        metrics_pool = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            # Run consultations
+            for i, customer in enumerate(customers):
+                # Run consultation (automatically traced by LiteLLM instrumentation!)
+                outcome = run_consultation(advisor, customer, max_turns=max_turns)
+                outcomes.append(outcome)
 
-            # Log progress at intervals
-            if i > 0 and i % progress_interval == 0:
-                current_metrics = calculate_metrics(outcomes)
-                span.add_event(
-                    "progress_checkpoint",
-                    attributes={
-                        "progress": i,
-                        "avg_satisfaction": current_metrics.satisfaction,
-                        "compliance_rate": current_metrics.compliance_rate,
-                        "overall_quality": current_metrics.overall_quality,
-                    },
-                )
+                # Always surface compliance failures as their own event
+                if not outcome.fca_compliant:
+                    span.add_event(
+                        "violation",
+                        attributes={
+                            "consultation": i,
+                            "satisfaction": outcome.customer_satisfaction,
+                            "issues": outcome.issues,
+                        },
+                    )
+
+                # Sample per-consultation evaluations to keep span payloads
+                # bounded: the first few, every violation, and a random slice
+                # of the rest. Emitted as array attributes after the loop
+                if (
+                    i < SPAN_ALWAYS_KEEP
+                    or not outcome.fca_compliant
+                    or random.random() < span_sample_rate
+                ):
+                    sampled_indices.append(i)
+                    satisfactions.append(outcome.customer_satisfaction)
+                    compliances.append(float(outcome.fca_compliant))
+
+                # Log progress at intervals; metrics are computed off the
+                # consultation loop on a snapshot of the outcomes so far
+                if i > 0 and i % progress_interval == 0:
+                    checkpoint = metrics_pool.submit(
+                        calculate_metrics, list(outcomes)
+                    )
+                    checkpoint.add_done_callback(
+                        partial(_record_progress_checkpoint, span, i)
+                    )
+        finally:
+            if generation_pool is not None:
+                generation_pool.shutdown(cancel_futures=True)
+            # Wait for outstanding checkpoints so their events land on the span
+            metrics_pool.shutdown(wait=True)
 
         # Calculate final metrics
         final_metrics = calculate_metrics(outcomes)
 
+        # Add sampled per-consultation evaluations as sequence-valued attributes
+        span.set_attribute("consultations.index", sampled_indices)
+        span.set_attribute("consultations.satisfaction", satisfactions)
+        span.set_attribute("consultations.compliance", compliances)
+
         # Add final results to span
         span.set_attribute("experiment.completed", True)
         span.set_attribute("results.satisfaction", final_metrics.satisfaction)
@@ -193,6 +316,6 @@ def run_training_experiment(
         )
 
         # Store outcomes in database for future evaluation
-        store_experiment_outcomes(experiment_name, outcomes)
+        store_experiment_outcomes(experiment_name, outcomes, session=session)
 
         return final_metrics
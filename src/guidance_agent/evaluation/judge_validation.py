@@ -4,14 +4,37 @@ This module validates the accuracy of LLM judges against expert-labeled
 consultations, computing inter-rater reliability and error rates.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import math
+import re
 
-from litellm import completion
+import numpy as np
+from litellm import batch_completion, completion
 
 
-@dataclass
+# Static evaluation prompt; only the transcript is inserted per call
+_PROMPT_HEAD = """Evaluate if this pension guidance consultation was FCA-compliant.
+
+Transcript:
+"""
+
+_PROMPT_TAIL = """
+
+Respond with:
+- PASS or FAIL
+- Confidence (0-1)
+- Brief reasoning
+
+Format: PASS|0.9|Reasoning here
+"""
+
+# Parses "PASS|0.9|Reasoning" style judge responses
+_RESPONSE_RE = re.compile(r"(PASS|FAIL)\s*\|\s*(\d+(?:\.\d+)?)\s*\|\s*(.*)", re.I | re.S)
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationReport:
     """Report from LLM-as-judge validation study.
 
@@ -49,6 +72,48 @@ class LLMJudge:
         self.model = model
         self.prompt_version = prompt_version
 
+    def _build_prompt(self, transcript: str) -> str:
+        """Build the evaluation prompt for a transcript."""
+        return _PROMPT_HEAD + transcript + _PROMPT_TAIL
+
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
+        """Parse a completion response into a judge result.
+
+        Args:
+            response: LiteLLM completion response, or the exception raised
+                while producing it
+
+        Returns:
+            Dictionary with passed, confidence and reasoning
+        """
+        try:
+            if isinstance(response, Exception):
+                raise response
+            content = response.choices[0].message.content.strip()
+        except Exception as e:
+            # Return conservative default on error, including replies with
+            # no choices or no content
+            return {
+                "passed": False,
+                "confidence": 0.5,
+                "reasoning": f"Error: {str(e)}",
+            }
+
+        match = _RESPONSE_RE.search(content)
+        if match:
+            return {
+                "passed": match.group(1).upper() == "PASS",
+                "confidence": min(max(float(match.group(2)), 0.0), 1.0),
+                "reasoning": match.group(3).strip(),
+            }
+
+        # Fall back to a keyword check when the format isn't followed
+        return {
+            "passed": "PASS" in content.upper(),
+            "confidence": 0.8,
+            "reasoning": content,
+        }
+
     def evaluate(
         self, transcript: str, customer_context: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -70,44 +135,86 @@ class LLMJudge:
             >>> if result["passed"]:
             ...     print("Compliant")
         """
-        # Simplified evaluation for testing
-        # In production, this would use sophisticated prompting
-        prompt = f"""Evaluate if this pension guidance consultation was FCA-compliant.
+        try:
+            response = completion(
+                model=self.model,
+                messages=[{"role": "user", "content": self._build_prompt(transcript)}],
+                temperature=0.3,
+            )
+        except Exception as e:
+            response = e
 
-Transcript:
-{transcript}
+        return self._parse_response(response)
 
-Respond with:
-- PASS or FAIL
-- Confidence (0-1)
-- Brief reasoning
+    def evaluate_many(self, transcripts: List[str]) -> List[Dict[str, Any]]:
+        """Evaluate several consultation transcripts concurrently.
 
-Format: PASS|0.9|Reasoning here
-"""
+        Uses LiteLLM batch completion so the requests are dispatched in
+        parallel rather than as sequential round-trips.
+
+        Args:
+            transcripts: Consultation transcripts to evaluate
+
+        Returns:
+            List of judge results (same shape as evaluate()), in input order
+
+        Example:
+            >>> judge = LLMJudge("gpt-4")
+            >>> results = judge.evaluate_many([transcript_a, transcript_b])
+        """
+        if not transcripts:
+            return []
 
         try:
-            response = completion(
+            responses = batch_completion(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=[
+                    [{"role": "user", "content": self._build_prompt(t)}]
+                    for t in transcripts
+                ],
                 temperature=0.3,
             )
+        except Exception as e:
+            responses = [e] * len(transcripts)
 
-            # Parse response (simplified)
-            content = response.choices[0].message.content.strip()
+        return [self._parse_response(r) for r in responses]
 
-            # Default response for testing
-            return {
-                "passed": "PASS" in content.upper(),
-                "confidence": 0.8,
-                "reasoning": content,
-            }
-        except Exception as e:
-            # Return conservative default on error
-            return {
-                "passed": False,
-                "confidence": 0.5,
-                "reasoning": f"Error: {str(e)}",
-            }
+
+# Judge panel used for validation; judges are stateless so one shared set
+# is reused across validation runs
+JUDGES = (
+    LLMJudge("gpt-4"),
+    LLMJudge("claude-3-5-sonnet"),
+    LLMJudge("gpt-4", prompt_version="v2"),
+)
+
+
+def _consensus_matrix(
+    per_judge: List[List[Dict[str, Any]]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute majority-vote consensus for many consultations at once.
+
+    Args:
+        per_judge: One list of evaluation results per judge, each aligned
+            with the same consultations
+
+    Returns:
+        Tuple of (consensus passed, average confidence) arrays, one entry
+        per consultation
+    """
+    num_judges = len(per_judge)
+    passed = np.array(
+        [[r["passed"] for r in judge_results] for judge_results in per_judge],
+        dtype=bool,
+    ).T
+    confidence = np.array(
+        [[r["confidence"] for r in judge_results] for judge_results in per_judge],
+        dtype=float,
+    ).T
+
+    # Strict majority, matching compute_consensus
+    consensus_passed = 2 * passed.sum(axis=1) > num_judges
+    return consensus_passed, confidence.mean(axis=1)
 
 
 def compute_consensus(judge_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -134,55 +241,65 @@ def compute_consensus(judge_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not judge_results:
         return {"passed": False, "confidence": 0.0}
 
-    # Majority vote for decision
-    passed_count = sum(1 for r in judge_results if r["passed"])
-    consensus_passed = passed_count > len(judge_results) / 2
+    # A single judge is its own consensus
+    if len(judge_results) == 1:
+        only = judge_results[0]
+        return {"passed": bool(only["passed"]), "confidence": only["confidence"]}
 
-    # Average confidence
-    avg_confidence = sum(r["confidence"] for r in judge_results) / len(judge_results)
+    # Count votes and total confidence in one pass
+    passed_count = 0
+    confidence_total = 0.0
+    for r in judge_results:
+        passed_count += bool(r["passed"])
+        confidence_total += r["confidence"]
 
     return {
-        "passed": consensus_passed,
-        "confidence": avg_confidence,
+        "passed": passed_count > len(judge_results) / 2,
+        "confidence": confidence_total / len(judge_results),
     }
 
 
-def calculate_cohens_kappa(results: List[Dict[str, Any]]) -> float:
-    """Calculate Cohen's kappa inter-rater reliability coefficient.
+def _label_arrays(results: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract expert labels and judge consensus as boolean arrays."""
+    n = len(results)
+    expert = np.fromiter((r["expert_label"] for r in results), dtype=bool, count=n)
+    judge = np.fromiter((r["judge_consensus"] for r in results), dtype=bool, count=n)
+    return expert, judge
 
-    Args:
-        results: List of validation results with expert_label and judge_consensus
 
-    Returns:
-        Cohen's kappa coefficient (-1 to 1, where 1 is perfect agreement)
+def _confidence_arrays(
+    results: List[Dict[str, Any]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract expert and judge confidences as float arrays (default 0.5)."""
+    n = len(results)
+    expert_conf = np.fromiter(
+        (r.get("expert_confidence", 0.5) for r in results), dtype=float, count=n
+    )
+    judge_conf = np.fromiter(
+        (r.get("judge_confidence", 0.5) for r in results), dtype=float, count=n
+    )
+    return expert_conf, judge_conf
 
-    Example:
-        >>> results = [
-        ...     {"expert_label": True, "judge_consensus": True},
-        ...     {"expert_label": False, "judge_consensus": False},
-        ... ]
-        >>> kappa = calculate_cohens_kappa(results)
-    """
-    if not results:
+
+def _cohens_kappa(expert: np.ndarray, judge: np.ndarray) -> float:
+    """Cohen's kappa from boolean label arrays."""
+    n = expert.size
+    if n < 2:
         return 0.0
 
-    n = len(results)
+    expert_true = int(np.count_nonzero(expert))
+    judge_true = int(np.count_nonzero(judge))
 
-    # Count agreements and disagreements
-    both_true = sum(
-        1 for r in results if r["expert_label"] and r["judge_consensus"]
-    )
-    both_false = sum(
-        1 for r in results if not r["expert_label"] and not r["judge_consensus"]
-    )
+    # Both raters gave the same single label throughout: perfect agreement
+    if expert_true == judge_true and expert_true in (0, n):
+        return 1.0
 
     # Observed agreement
+    both_true = int(np.count_nonzero(expert & judge))
+    both_false = int(np.count_nonzero(~expert & ~judge))
     p_o = (both_true + both_false) / n
 
     # Expected agreement by chance
-    expert_true = sum(1 for r in results if r["expert_label"])
-    judge_true = sum(1 for r in results if r["judge_consensus"])
-
     p_expert_true = expert_true / n
     p_expert_false = 1 - p_expert_true
     p_judge_true = judge_true / n
@@ -190,12 +307,65 @@ def calculate_cohens_kappa(results: List[Dict[str, Any]]) -> float:
 
     p_e = (p_expert_true * p_judge_true) + (p_expert_false * p_judge_false)
 
-    # Cohen's kappa
     if p_e == 1.0:
         return 0.0  # Avoid division by zero
 
-    kappa = (p_o - p_e) / (1 - p_e)
-    return kappa
+    return (p_o - p_e) / (1 - p_e)
+
+
+def _fn_rate(expert: np.ndarray, judge: np.ndarray) -> float:
+    """False negative rate from boolean label arrays."""
+    positives = int(np.count_nonzero(expert))
+    if not positives:
+        return 0.0
+    return int(np.count_nonzero(expert & ~judge)) / positives
+
+
+def _fp_rate(expert: np.ndarray, judge: np.ndarray) -> float:
+    """False positive rate from boolean label arrays."""
+    negatives = expert.size - int(np.count_nonzero(expert))
+    if not negatives:
+        return 0.0
+    return int(np.count_nonzero(~expert & judge)) / negatives
+
+
+def _calibration(expert_conf: np.ndarray, judge_conf: np.ndarray) -> Dict[str, float]:
+    """Confidence calibration metrics from float confidence arrays."""
+    if expert_conf.size == 0:
+        return {"mean_error": 0.0, "rmse": 0.0}
+
+    n = expert_conf.size
+    errors = np.abs(expert_conf - judge_conf)
+
+    # np.dot fuses square-and-sum into one pass without a temporary array
+    sum_sq = float(np.dot(errors, errors))
+
+    return {
+        "mean_error": float(errors.sum()) / n,
+        "rmse": math.sqrt(sum_sq / n),
+    }
+
+
+def calculate_cohens_kappa(results: List[Dict[str, Any]]) -> float:
+    """Calculate Cohen's kappa inter-rater reliability coefficient.
+
+    Args:
+        results: List of validation results with expert_label and judge_consensus
+
+    Returns:
+        Cohen's kappa coefficient (-1 to 1, where 1 is perfect agreement)
+
+    Example:
+        >>> results = [
+        ...     {"expert_label": True, "judge_consensus": True},
+        ...     {"expert_label": False, "judge_consensus": False},
+        ... ]
+        >>> kappa = calculate_cohens_kappa(results)
+    """
+    if not results:
+        return 0.0
+
+    return _cohens_kappa(*_label_arrays(results))
 
 
 def calculate_fn_rate(results: List[Dict[str, Any]]) -> float:
@@ -218,16 +388,7 @@ def calculate_fn_rate(results: List[Dict[str, Any]]) -> float:
         >>> fn_rate = calculate_fn_rate(results)
         0.5
     """
-    # Get all positive cases (expert says compliant)
-    positives = [r for r in results if r["expert_label"]]
-
-    if not positives:
-        return 0.0
-
-    # Count false negatives (expert True, judge False)
-    false_negatives = sum(1 for r in positives if not r["judge_consensus"])
-
-    return false_negatives / len(positives)
+    return _fn_rate(*_label_arrays(results))
 
 
 def calculate_fp_rate(results: List[Dict[str, Any]]) -> float:
@@ -250,16 +411,7 @@ def calculate_fp_rate(results: List[Dict[str, Any]]) -> float:
         >>> fp_rate = calculate_fp_rate(results)
         0.5
     """
-    # Get all negative cases (expert says non-compliant)
-    negatives = [r for r in results if not r["expert_label"]]
-
-    if not negatives:
-        return 0.0
-
-    # Count false positives (expert False, judge True)
-    false_positives = sum(1 for r in negatives if r["judge_consensus"])
-
-    return false_positives / len(negatives)
+    return _fp_rate(*_label_arrays(results))
 
 
 def analyse_confidence_calibration(
@@ -285,27 +437,7 @@ def analyse_confidence_calibration(
         ... ]
         >>> calibration = analyse_confidence_calibration(results)
     """
-    if not results:
-        return {"mean_error": 0.0, "rmse": 0.0}
-
-    errors = []
-    squared_errors = []
-
-    for r in results:
-        expert_conf = r.get("expert_confidence", 0.5)
-        judge_conf = r.get("judge_confidence", 0.5)
-
-        error = abs(expert_conf - judge_conf)
-        errors.append(error)
-        squared_errors.append(error**2)
-
-    mean_error = sum(errors) / len(errors)
-    rmse = math.sqrt(sum(squared_errors) / len(squared_errors))
-
-    return {
-        "mean_error": mean_error,
-        "rmse": rmse,
-    }
+    return _calibration(*_confidence_arrays(results))
 
 
 def validate_llm_judges(
@@ -352,45 +484,34 @@ def validate_llm_judges(
             confidence_calibration={"mean_error": 0.0, "rmse": 0.0},
         )
 
-    # Initialize judges
-    judges = [
-        LLMJudge("gpt-4"),
-        LLMJudge("claude-3-5-sonnet"),
-        LLMJudge("gpt-4", prompt_version="v2"),
-    ]
-
-    results = []
-
-    for consultation in expert_labeled_consultations:
-        # Get evaluations from all judges
-        judge_results = []
-        for judge in judges:
-            result = judge.evaluate(consultation.transcript)
-            judge_results.append(result)
-
-        # Compute consensus
-        consensus = compute_consensus(judge_results)
-
-        # Compare to expert label
-        agreement = consensus["passed"] == consultation.expert_label
-
-        results.append({
-            "consultation_id": consultation.consultation_id,
-            "expert_label": consultation.expert_label,
-            "expert_confidence": consultation.expert_confidence,
-            "judge_consensus": consensus["passed"],
-            "judge_confidence": consensus["confidence"],
-            "agreement": agreement,
-            "judge_details": judge_results,
-        })
+    # Evaluate all transcripts judge-by-judge; each judge batches its
+    # requests and the judges themselves run in parallel
+    transcripts = [c.transcript for c in expert_labeled_consultations]
+    with ThreadPoolExecutor(max_workers=len(JUDGES)) as executor:
+        per_judge = list(
+            executor.map(lambda judge: judge.evaluate_many(transcripts), JUDGES)
+        )
+
+    # Stack judge outputs into (consultations x judges) matrices and reduce
+    # to a per-consultation consensus in one pass
+    judge, judge_conf = _consensus_matrix(per_judge)
+
+    total = len(expert_labeled_consultations)
+    expert = np.fromiter(
+        (c.expert_label for c in expert_labeled_consultations), dtype=bool, count=total
+    )
+    expert_conf = np.fromiter(
+        (c.expert_confidence for c in expert_labeled_consultations),
+        dtype=float,
+        count=total,
+    )
 
     # Calculate validation metrics
-    total = len(results)
-    agreement_rate = sum(1 for r in results if r["agreement"]) / total
-    cohens_kappa = calculate_cohens_kappa(results)
-    fn_rate = calculate_fn_rate(results)
-    fp_rate = calculate_fp_rate(results)
-    calibration = analyse_confidence_calibration(results)
+    agreement_rate = int(np.count_nonzero(expert == judge)) / total
+    cohens_kappa = _cohens_kappa(expert, judge)
+    fn_rate = _fn_rate(expert, judge)
+    fp_rate = _fp_rate(expert, judge)
+    calibration = _calibration(expert_conf, judge_conf)
 
     return ValidationReport(
         total_consultations=total,
@@ -6,12 +6,29 @@ process quality.
 """
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List
 
 from guidance_agent.core.types import OutcomeResult
 
 
-@dataclass
+# Outcome fields read by calculate_metrics, fetched in one call per outcome
+_OUTCOME_FIELDS = attrgetter(
+    "risks_identified",
+    "guidance_appropriate",
+    "fca_compliant",
+    "customer_satisfaction",
+    "comprehension",
+    "goal_alignment",
+    "understanding_checked",
+    "signposted_when_needed",
+    "has_db_pension",
+    "db_warning_given",
+    "successful",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class AdvisorMetrics:
     """Comprehensive metrics for advisor performance evaluation.
 
@@ -84,44 +101,57 @@ def calculate_metrics(outcomes: List[OutcomeResult]) -> AdvisorMetrics:
 
     total = len(outcomes)
 
-    # Task Accuracy - proportion of boolean flags that are True
-    risk_assessment_accuracy = sum(
-        1 for o in outcomes if o.risks_identified
-    ) / total
-
-    guidance_appropriateness = sum(
-        1 for o in outcomes if o.guidance_appropriate
-    ) / total
+    # Single pass over outcomes, fetching all fields with one C-level call
+    risks = appropriate = compliant = 0
+    satisfaction_sum = comprehension_sum = goal_alignment_sum = 0.0
+    understanding = signposted = successful_count = 0
+    db_pensions = db_warnings = 0
+
+    for (
+        risks_identified,
+        guidance_appropriate,
+        fca_compliant,
+        customer_satisfaction,
+        comprehension,
+        goal_alignment,
+        understanding_checked,
+        signposted_when_needed,
+        has_db_pension,
+        db_warning_given,
+        successful,
+    ) in map(_OUTCOME_FIELDS, outcomes):
+        risks += bool(risks_identified)
+        appropriate += bool(guidance_appropriate)
+        compliant += bool(fca_compliant)
+        satisfaction_sum += customer_satisfaction
+        comprehension_sum += comprehension
+        goal_alignment_sum += goal_alignment
+        understanding += bool(understanding_checked)
+        signposted += bool(signposted_when_needed)
+        successful_count += bool(successful)
+        if has_db_pension:
+            db_pensions += 1
+            db_warnings += bool(db_warning_given)
 
-    compliance_rate = sum(
-        1 for o in outcomes if o.fca_compliant
-    ) / total
+    # Task Accuracy - proportion of boolean flags that are True
+    risk_assessment_accuracy = risks / total
+    guidance_appropriateness = appropriate / total
+    compliance_rate = compliant / total
 
     # Customer Outcomes - average of numeric scores
-    satisfaction = sum(o.customer_satisfaction for o in outcomes) / total
-    comprehension = sum(o.comprehension for o in outcomes) / total
-    goal_alignment = sum(o.goal_alignment for o in outcomes) / total
+    satisfaction = satisfaction_sum / total
+    comprehension = comprehension_sum / total
+    goal_alignment = goal_alignment_sum / total
 
     # Process Quality
-    understanding_verification_rate = sum(
-        1 for o in outcomes if o.understanding_checked
-    ) / total
-
-    signposting_rate = sum(
-        1 for o in outcomes if o.signposted_when_needed
-    ) / total
+    understanding_verification_rate = understanding / total
+    signposting_rate = signposted / total
 
     # DB warning rate - only count cases with DB pensions
-    db_pensions = [o for o in outcomes if o.has_db_pension]
-    if db_pensions:
-        db_warning_rate = sum(1 for o in db_pensions if o.db_warning_given) / len(
-            db_pensions
-        )
-    else:
-        db_warning_rate = 0.0
+    db_warning_rate = db_warnings / db_pensions if db_pensions else 0.0
 
     # Overall quality
-    overall_quality = sum(1 for o in outcomes if o.successful) / total
+    overall_quality = successful_count / total
 
     return AdvisorMetrics(
         risk_assessment_accuracy=risk_assessment_accuracy,
@@ -0,0 +1,72 @@
+"""Illustrative pension figures derived from the knowledge base."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from guidance_agent.knowledge.pension_knowledge import PENSION_KNOWLEDGE, get_cetv, get_fee_bounds
+
+_ANNUITY_RATE_KEY_RE = re.compile(r"age_(\d+)_male")
+
+
+@lru_cache(maxsize=None)
+def _annuity_rate_table() -> tuple[np.ndarray, np.ndarray]:
+    """(ages, rates) from the typical annuity rates, sorted by age."""
+    rates = PENSION_KNOWLEDGE["pension_access_options"]["annuities"]["typical_rates_2024"]
+    points = sorted(
+        (int(match.group(1)), rate)
+        for key, rate in rates.items()
+        if (match := _ANNUITY_RATE_KEY_RE.fullmatch(key))
+    )
+    return np.array([age for age, _ in points]), np.array([rate for _, rate in points])
+
+
+def estimate_annuity_income(pot: float, age: int) -> float:
+    """Estimate annual level annuity income for a pension pot.
+
+    Uses the typical 2024 single-life rates, interpolating between the listed
+    ages and holding the nearest rate outside them.
+
+    Args:
+        pot: Pension pot used to buy the annuity, in pounds
+        age: Age at purchase
+
+    Returns:
+        Estimated annual income in pounds
+    """
+    ages, rates = _annuity_rate_table()
+    return pot * float(np.interp(age, ages, rates))
+
+
+def estimate_cetv_range(annual_pension: float) -> tuple[float, float]:
+    """Estimate the typical transfer value range for a DB pension.
+
+    Args:
+        annual_pension: Annual DB pension in pounds
+
+    Returns:
+        (low, high) CETV in pounds from the typical transfer multiples
+    """
+    low, high = get_cetv().typical_multiples["range"]
+    return (float(annual_pension * low), float(annual_pension * high))
+
+
+def estimate_annual_fees(pot: float, pension_type: str) -> tuple[float, float] | None:
+    """Estimate the typical annual fee range for a pension pot.
+
+    Args:
+        pot: Pension pot value in pounds
+        pension_type: Type of pension (e.g., "defined_contribution")
+
+    Returns:
+        (low, high) annual fees in pounds, or None if the type has no
+        min/max typical fees
+    """
+    bounds = get_fee_bounds(pension_type)
+    if bounds is None:
+        return None
+    low, high = (bounds * pot).tolist()
+    return (low, high)
@@ -0,0 +1,82 @@
+"""Keyword search over the text of the pension knowledge base.
+
+Every string in the knowledge base, including list entries such as scam
+warning signs and asset classes, is tokenised once into an inverted index
+of word to entries, built on first use. A query then costs one dict lookup
+per word instead of a walk over the whole tree.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from guidance_agent.knowledge.pension_knowledge import PENSION_KNOWLEDGE
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class KeywordHit(NamedTuple):
+    """A knowledge text entry matching a keyword search."""
+
+    path: str  # Dotted path to the string, or to the list holding it
+    text: str
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_WORD_RE.findall(text.casefold()))
+
+
+def _collect_entries(node: Any, path: str, entries: list[KeywordHit]) -> None:
+    if isinstance(node, str):
+        entries.append(KeywordHit(path, node))
+    elif isinstance(node, Mapping):
+        for key, value in node.items():
+            _collect_entries(value, f"{path}.{key}", entries)
+    elif isinstance(node, (tuple, frozenset)):
+        for item in sorted(node) if isinstance(node, frozenset) else node:
+            if isinstance(item, str):
+                entries.append(KeywordHit(path, item))
+
+
+@lru_cache(maxsize=None)
+def _keyword_index() -> tuple[tuple[KeywordHit, ...], dict[str, frozenset[int]]]:
+    """Build (entries, word -> entry positions) over every section."""
+    entries: list[KeywordHit] = []
+    for section, content in PENSION_KNOWLEDGE.items():
+        _collect_entries(content, section, entries)
+    postings: dict[str, set[int]] = {}
+    for position, entry in enumerate(entries):
+        for token in _tokens(entry.text):
+            postings.setdefault(token, set()).add(position)
+    return tuple(entries), {token: frozenset(ids) for token, ids in postings.items()}
+
+
+@lru_cache(maxsize=4096)
+def search_knowledge(query: str) -> tuple[KeywordHit, ...]:
+    """Find knowledge text containing every word of a query.
+
+    Matching is case-insensitive and on whole words. Results are memoised
+    per query string, since a conversation tends to repeat the same lookups.
+
+    Args:
+        query: Words to look for, such as "cold calling"
+
+    Returns:
+        Matching entries in knowledge base order, or an empty tuple if the
+        query has no words
+    """
+    entries, postings = _keyword_index()
+    tokens = _tokens(query)
+    if not tokens:
+        return ()
+    # Intersect from the rarest word so the working set stays small
+    matches: frozenset[int] | None = None
+    for token in sorted(tokens, key=lambda token: len(postings.get(token, ()))):
+        ids = postings.get(token, frozenset())
+        matches = ids if matches is None else matches & ids
+        if not matches:
+            return ()
+    return tuple(entries[position] for position in sorted(matches))
@@ -0,0 +1,916 @@
+"""Pension knowledge module for UK pension system.
+
+This package contains structured knowledge about UK pension types, regulations,
+typical scenarios, and fee structures to support guidance conversations.
+
+Each top-level section of ``PENSION_KNOWLEDGE`` lives in a private submodule
+(``_pension_types``, ``_regulations``, ...) that is imported and built on
+first access and then frozen: every mapping is a read-only ``MappingProxyType`` and every list
+is a tuple, so it can be shared between threads and returned from the
+accessors without defensive copies. Use ``thaw`` to get a mutable,
+JSON-serialisable copy.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+
+from guidance_agent.knowledge.pension_knowledge._records import (
+    APTA,
+    CETV,
+    TVAS,
+    FeeRange,
+    NewStatePension,
+    OldStatePension,
+    Provider,
+    RiskLevel,
+    TaxBand,
+)
+
+__all__ = [
+    "PENSION_KNOWLEDGE",
+    "AgeBand",
+    "FeeRange",
+    "Provider",
+    "RiskLevel",
+    "TaxBand",
+    "NewStatePension",
+    "OldStatePension",
+    "CETV",
+    "TVAS",
+    "APTA",
+    "get_pension_knowledge",
+    "PROSE_KEYS",
+    "get_logic_view",
+    "get_value",
+    "get_path",
+    "get_description",
+    "thaw",
+    "get_pension_type_info",
+    "get_regulation_info",
+    "get_typical_scenario",
+    "get_fee_structure",
+    "get_new_state_pension",
+    "get_cetv",
+    "get_apta",
+    "PROVIDER_INDEX",
+    "FEATURE_INDEX",
+    "pension_types_for_provider",
+    "pension_types_with_feature",
+    "providers_for",
+    "get_fee_bounds",
+    "get_value_bounds",
+    "get_age_bands",
+    "get_numeric_ranges",
+    "get_range",
+    "get_numeric_constants",
+    "get_constant",
+    "parse_age_range",
+    "validate_pension_value_for_age",
+    "validate_many",
+    "validate_many_sql",
+]
+
+
+_FEE_RANGE_KEYS = frozenset(FeeRange._fields)
+_TAX_BAND_KEYS = frozenset(("rate", "bands"))
+
+# Keys whose lists are unordered vocabularies of snake_case tags, used for
+# membership tests rather than display; these freeze to frozensets.
+_SET_KEYS = frozenset((
+    "common_features",
+    "special_features",
+    "member_protections",
+    "restrictions",
+    "suitable_for",
+    "typical_users",
+    "typical_sectors",
+    "special_considerations",
+    "common_types",
+    "considerations",
+    "factors",
+    "increase_types",
+    "scenarios",
+))
+# One shared instance per distinct tag set, across all sections
+_CANONICAL_SETS: dict[frozenset[str], frozenset[str]] = {}
+# Keys whose lists name pension providers; these freeze to Provider members
+_PROVIDER_KEYS = frozenset(("typical_providers", "examples"))
+_PROVIDERS_BY_NAME = {provider.value: provider for provider in Provider}
+# Keys whose values are risk levels; labels in the RiskLevel vocabulary
+# freeze to members, other text such as "Varies - often high" stays as is
+_RISK_KEYS = frozenset(("risk",))
+_RISK_LEVELS_BY_LABEL = {level.value: level for level in RiskLevel}
+# Fixed-schema sub-trees, by key, that freeze to slotted records
+_RECORD_TYPES = {
+    "new_state_pension": NewStatePension,
+    "old_state_pension": OldStatePension,
+    "cetv": CETV,
+    "tvas": TVAS,
+    "apta": APTA,
+}
+
+
+def _freeze_tag_set(items: list[str]) -> frozenset[str]:
+    tags = frozenset(sys.intern(item) for item in items)
+    return _CANONICAL_SETS.setdefault(tags, tags)
+
+
+def _freeze_providers(names: list[str]) -> tuple[str, ...]:
+    return tuple(_PROVIDERS_BY_NAME.get(name) or sys.intern(name) for name in names)
+
+
+def _freeze_field(key: str, value: Any) -> Any:
+    if isinstance(value, str) and key in _RISK_KEYS:
+        level = _RISK_LEVELS_BY_LABEL.get(value)
+        return sys.intern(value) if level is None else level
+    if isinstance(value, dict) and key in _RECORD_TYPES:
+        return _RECORD_TYPES[key](**{
+            field: _freeze_field(field, item) for field, item in value.items()
+        })
+    if isinstance(value, list):
+        if key in _SET_KEYS:
+            return _freeze_tag_set(value)
+        if key in _PROVIDER_KEYS:
+            return _freeze_providers(value)
+    return _freeze(value)
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Two-key leaves with a fixed shape become records: {"min", "max"} dicts
+    become FeeRange and {"rate", "bands"} dicts become TaxBand, both of which
+    still support ``leaf["min"]`` style access.
+
+    Lists under the tag keys in _SET_KEYS become frozensets, shared between
+    sections when their contents match, so membership tests are O(1).
+
+    Dicts under the keys in _RECORD_TYPES become the matching slotted record,
+    which also reads as a mapping of its fields.
+
+    Names under the keys in _PROVIDER_KEYS become Provider members, falling
+    back to interned strings for providers the enum does not list. Likewise
+    risk labels under _RISK_KEYS become RiskLevel members.
+
+    Strings are interned, keys and values alike: lookups with interned names
+    (such as string literals in callers) match on identity before comparing
+    characters, and values repeated across sections ("NEST", "Aviva", ...)
+    share one object.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        if obj.keys() == _FEE_RANGE_KEYS:
+            return FeeRange(obj["min"], obj["max"])
+        if obj.keys() == _TAX_BAND_KEYS:
+            return TaxBand(obj["rate"], _freeze(obj["bands"]))
+        return MappingProxyType({
+            _freeze(key): _freeze_field(key, value) for key, value in obj.items()
+        })
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Return a mutable copy of frozen knowledge using plain dicts and lists.
+
+    Args:
+        obj: A value taken from PENSION_KNOWLEDGE
+
+    Returns:
+        The same data with mappings as dicts, and tuples and tag sets as
+        lists (tag sets sorted), suitable for JSON serialisation
+    """
+    if isinstance(obj, Mapping):
+        return {key: thaw(value) for key, value in obj.items()}
+    if isinstance(obj, FeeRange):
+        return obj._asdict()
+    if isinstance(obj, TaxBand):
+        return {"rate": obj.rate, "bands": thaw(obj.bands)}
+    if isinstance(obj, Provider):
+        return obj.value
+    if isinstance(obj, RiskLevel):
+        return obj.value
+    if isinstance(obj, tuple):
+        return [thaw(item) for item in obj]
+    if isinstance(obj, frozenset):
+        return sorted(obj)
+    return obj
+
+
+# Each section lives in its own private submodule and is only imported, built,
+# frozen and cached when first used, so callers touching one section skip the
+# rest.
+_SECTIONS: tuple[str, ...] = (
+    "pension_types",
+    "regulations",
+    "typical_scenarios",
+    "fee_structures",
+    "pension_access_options",
+    "tax_rules",
+    "state_pension",
+    "transfer_mechanics",
+    "death_benefits",
+    "contribution_rules",
+    "investment_concepts",
+    "consolidation",
+    "provider_landscape",
+    "regulatory_timeline",
+    "special_circumstances",
+    "protections",
+    "pension_wise",
+    "glossary",
+    "common_questions",
+)
+
+
+@lru_cache(maxsize=None)
+def _section(name: str) -> Mapping[str, Any]:
+    """Import, build and freeze one knowledge section on first use."""
+    return _freeze(import_module(f"{__name__}._{name}").build())
+
+
+# Section names are fixed, so lookups go through one dict probe: a hit
+# returns the built section, None means known but not built yet, and a miss
+# means the name is not a section at all.
+_BUILT_SECTIONS: dict[str, Mapping[str, Any] | None] = dict.fromkeys(_SECTIONS)
+
+
+class _KnowledgeSections(Mapping):
+    """Read-only mapping of section name to section, built on first access."""
+
+    __slots__ = ()
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        section = _BUILT_SECTIONS[name]
+        if section is None:
+            section = _BUILT_SECTIONS[name] = _section(name)
+        return section
+
+    def __contains__(self, name: object) -> bool:
+        return name in _BUILT_SECTIONS
+
+    def __iter__(self):
+        return iter(_SECTIONS)
+
+    def __len__(self) -> int:
+        return len(_SECTIONS)
+
+    def __repr__(self) -> str:
+        return f"<PENSION_KNOWLEDGE sections: {', '.join(_SECTIONS)}>"
+
+
+PENSION_KNOWLEDGE: Mapping[str, Any] = _KnowledgeSections()
+
+
+def __getattr__(name: str) -> Mapping[str, Any]:
+    # PEP 562: expose each section as a module attribute, built on first
+    # access and then bound as a global so later lookups skip this hook
+    if name in _SECTIONS:
+        section = globals()[name] = _section(name)
+        return section
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SECTIONS})
+
+
+@lru_cache(maxsize=None)
+def get_pension_knowledge() -> Mapping[str, Any]:
+    """Get the whole knowledge base with every section built.
+
+    Returns:
+        Read-only mapping of every section, built once per process
+    """
+    return MappingProxyType({name: _section(name) for name in _SECTIONS})
+
+
+# Prose fields used when rendering responses but never in calculations
+PROSE_KEYS = frozenset((
+    "description",
+    "fca_considerations",
+    "fca_warning",
+    "historical_context",
+    "typical_outcome",
+    "how_to_avoid",
+))
+
+
+def _strip_prose(node: Any) -> Any:
+    if isinstance(node, Mapping):
+        return MappingProxyType({
+            key: _strip_prose(value) for key, value in node.items() if key not in PROSE_KEYS
+        })
+    return node
+
+
+@lru_cache(maxsize=None)
+def get_logic_view(section: str) -> Mapping[str, Any]:
+    """Get a knowledge section without its prose fields.
+
+    Calculation code that walks a section can use this smaller view and
+    fetch prose separately with get_description when rendering.
+
+    Args:
+        section: Top-level section name (e.g., "pension_access_options")
+
+    Returns:
+        Read-only copy of the section with PROSE_KEYS fields removed
+
+    Raises:
+        KeyError: If the section does not exist
+    """
+    return _strip_prose(PENSION_KNOWLEDGE[section])
+
+
+# Resolved dotted paths, bounded since paths may come from free-form input.
+# Missing paths raise rather than return, so they are never cached.
+@lru_cache(maxsize=1024)
+def _resolve(path: str) -> Any:
+    section, _, rest = path.partition(".")
+    node: Any = PENSION_KNOWLEDGE[section]
+    for key in rest.split(".") if rest else ():
+        if not isinstance(node, Mapping):
+            raise KeyError(path)
+        node = node[key]
+    return node
+
+
+def get_value(path: str, default: Any = None) -> Any:
+    """Get any value from the knowledge base by dotted path.
+
+    The walk from section to leaf is done once per path and memoised, so
+    hot lookups such as "pension_types.sipp.typical_fees.platform_fee" cost
+    a single cache hit rather than a chain of string-keyed lookups.
+
+    Args:
+        path: Dotted path such as "transfer_mechanics.cetv.typical_multiples"
+        default: Value returned when the path does not exist
+
+    Returns:
+        The frozen value at that path, or default
+    """
+    try:
+        return _resolve(path)
+    except KeyError:
+        return default
+
+
+def _flatten(node: Any, prefix: tuple[str, ...], flat: dict[tuple[str, ...], Any]) -> None:
+    flat[prefix] = node
+    if isinstance(node, Mapping):
+        for key, value in node.items():
+            _flatten(value, (*prefix, key), flat)
+
+
+@lru_cache(maxsize=None)
+def _flat_index() -> Mapping[tuple[str, ...], Any]:
+    """Map every key path in the knowledge base to its value."""
+    flat: dict[tuple[str, ...], Any] = {}
+    for section in _SECTIONS:
+        _flatten(_section(section), (section,), flat)
+    return MappingProxyType(flat)
+
+
+def get_path(*parts: str) -> Any:
+    """Get a value from the knowledge base by its key path in one lookup.
+
+    The first call flattens every section into a single path-keyed index,
+    so each later lookup is one hash of the key tuple however deep the
+    value sits.
+
+    Args:
+        *parts: Keys from the section down, e.g.
+            get_path("transfer_mechanics", "cetv", "typical_multiples", "range")
+
+    Returns:
+        The frozen value at that path
+
+    Raises:
+        KeyError: If the path does not exist
+    """
+    return _flat_index()[parts]
+
+
+def get_description(path: str) -> str | None:
+    """Get a prose field from the knowledge base by dotted path.
+
+    Args:
+        path: Dotted path such as "pension_types.defined_benefit.fca_warning"
+
+    Returns:
+        The text at that path, or None if the path does not lead to text
+    """
+    try:
+        value = _resolve(path)
+    except KeyError:
+        return None
+    return value if isinstance(value, str) else None
+
+
+# Pension types feed the validation tables below, so that section is built at
+# import. The other sections stay lazy. The accessors are memoised, which is safe
+# because the values are frozen; the cache is bounded since lookup keys may
+# come from free-form input.
+_PENSION_TYPES = _section("pension_types")
+
+
+@lru_cache(maxsize=128)
+def get_pension_type_info(pension_type: str) -> Mapping | None:
+    """Get information about a specific pension type.
+
+    Args:
+        pension_type: The pension type to look up (e.g., "defined_contribution", "defined_benefit")
+
+    Returns:
+        Read-only mapping containing pension type information, or None if not found
+    """
+    return _PENSION_TYPES.get(pension_type)
+
+
+@lru_cache(maxsize=128)
+def get_regulation_info(regulation_name: str) -> Mapping | None:
+    """Get regulatory information.
+
+    Args:
+        regulation_name: The regulation to look up (e.g., "auto_enrollment", "db_transfers")
+
+    Returns:
+        Read-only mapping containing regulation information, or None if not found
+    """
+    return _section("regulations").get(regulation_name)
+
+
+@lru_cache(maxsize=128)
+def get_typical_scenario(scenario_name: str) -> Mapping | None:
+    """Get typical customer scenario information.
+
+    Args:
+        scenario_name: The scenario to look up (e.g., "young_worker_22_30")
+
+    Returns:
+        Read-only mapping containing scenario information, or None if not found
+    """
+    return _section("typical_scenarios").get(scenario_name)
+
+
+@lru_cache(maxsize=128)
+def get_fee_structure(pension_category: str) -> Mapping | None:
+    """Get typical fee structure for pension category.
+
+    Args:
+        pension_category: The category to look up (e.g., "workplace_dc", "personal_pensions")
+
+    Returns:
+        Read-only mapping containing fee structure information, or None if not found
+    """
+    return _section("fee_structures").get(pension_category)
+
+
+# Fixed-record accessors take no arguments, so an unbounded cache holds one
+# entry each and later calls skip the section walk entirely.
+@cache
+def get_new_state_pension() -> NewStatePension:
+    """Get the new State Pension amounts and qualifying rules."""
+    return _section("state_pension")["new_state_pension"]
+
+
+@cache
+def get_cetv() -> CETV:
+    """Get how Cash Equivalent Transfer Values are quoted and valued."""
+    return _section("transfer_mechanics")["cetv"]
+
+
+@cache
+def get_apta() -> APTA:
+    """Get the Appropriate Pension Transfer Analysis requirements."""
+    return _section("transfer_mechanics")["apta"]
+
+
+def _build_type_index(field: str) -> Mapping[str, frozenset[str]]:
+    """Map each value listed under a pension type field to the types listing it."""
+    index: dict[str, set[str]] = {}
+    for pension_type, info in _PENSION_TYPES.items():
+        for value in info.get(field, ()):
+            index.setdefault(value, set()).add(pension_type)
+    return MappingProxyType({value: frozenset(types) for value, types in index.items()})
+
+
+# Reverse lookups over the pension types section
+PROVIDER_INDEX: Mapping[str, frozenset[str]] = _build_type_index("typical_providers")
+FEATURE_INDEX: Mapping[str, frozenset[str]] = _build_type_index("common_features")
+
+
+def pension_types_for_provider(provider: str) -> frozenset[str]:
+    """Get the pension types that list a provider among their typical providers.
+
+    Args:
+        provider: Provider name as written in the knowledge base (e.g., "NEST")
+
+    Returns:
+        Pension type names, empty if no type lists the provider
+    """
+    return PROVIDER_INDEX.get(provider, frozenset())
+
+
+def pension_types_with_feature(feature: str) -> frozenset[str]:
+    """Get the pension types that list a feature among their common features.
+
+    Args:
+        feature: Feature name (e.g., "employer_contributions")
+
+    Returns:
+        Pension type names, empty if no type lists the feature
+    """
+    return FEATURE_INDEX.get(feature, frozenset())
+
+
+def providers_for(category: str) -> tuple[str, ...]:
+    """Get the example providers for a provider landscape category.
+
+    Args:
+        category: Provider category (e.g., "platforms", "master_trusts")
+
+    Returns:
+        Provider names, mostly Provider members, or an empty tuple if the
+        category lists no examples
+    """
+    info = PENSION_KNOWLEDGE["provider_landscape"].get(category)
+    return info.get("examples", ()) if isinstance(info, Mapping) else ()
+
+
+# Words allowed as the upper bound of an age range key
+_NAMED_AGES: dict[str, int] = {"retirement": 67}  # UK state pension age
+
+
+@lru_cache(maxsize=None)
+def _parse_age_range_slow(age_range_str: str) -> tuple[int, int]:
+    parts = age_range_str.split('-')
+    min_age = int(parts[0])
+    max_age = _NAMED_AGES[parts[1]] if parts[1] in _NAMED_AGES else int(parts[1])
+    return (min_age, max_age)
+
+
+# Every age range key in the knowledge base, parsed once at import
+_AGE_RANGE_TABLE: dict[str, tuple[int, int]] = {
+    age_range: _parse_age_range_slow(age_range)
+    for info in _PENSION_TYPES.values()
+    for age_range in info.get("typical_by_age", ())
+}
+
+
+def parse_age_range(age_range_str: str) -> tuple[int, int]:
+    """Parse age range string into tuple of integers.
+
+    Args:
+        age_range_str: Age range string like "25-35" or "55-retirement"
+
+    Returns:
+        Tuple of (min_age, max_age). "retirement" is converted to 67 (UK state pension age)
+    """
+    return _AGE_RANGE_TABLE.get(age_range_str) or _parse_age_range_slow(age_range_str)
+
+
+@dataclass(frozen=True, slots=True)
+class AgeBand:
+    """Typical pension value range for one parsed typical_by_age bucket."""
+
+    min_age: int
+    max_age: int
+    min_value: float
+    max_value: float
+
+
+# Age bands per pension type, parsed once at import and ordered by max_age so
+# validation can bisect on the band end ages.
+_TYPICAL_BY_AGE_PARSED: dict[str, tuple[AgeBand, ...]] = {
+    pension_type: tuple(sorted(
+        (AgeBand(*parse_age_range(age_range), min_val, max_val)
+         for age_range, (min_val, max_val) in info["typical_by_age"].items()),
+        key=lambda band: band.max_age,
+    ))
+    for pension_type, info in _PENSION_TYPES.items()
+    if "typical_by_age" in info
+}
+_AGE_ENDS: dict[str, tuple[int, ...]] = {
+    pension_type: tuple(band.max_age for band in bands)
+    for pension_type, bands in _TYPICAL_BY_AGE_PARSED.items()
+}
+_TYPES_WITH_AGE_DATA = frozenset(_TYPICAL_BY_AGE_PARSED)
+
+
+def _readonly_array(values, dtype) -> np.ndarray:
+    """Build a NumPy array that raises on accidental writes."""
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+def _band_arrays(bands: tuple[AgeBand, ...]) -> tuple[np.ndarray, ...]:
+    """Build read-only (min_ages, max_ages, min_values, max_allowed) arrays."""
+    return (
+        _readonly_array([band.min_age for band in bands], np.int64),
+        _readonly_array([band.max_age for band in bands], np.int64),
+        _readonly_array([band.min_value for band in bands], np.float64),
+        # Allow 2x typical max for edge cases (high earners, etc.)
+        _readonly_array([band.max_value * 2 for band in bands], np.float64),
+    )
+
+
+_AGE_BAND_ARRAYS: dict[str, tuple[np.ndarray, ...]] = {
+    pension_type: _band_arrays(bands)
+    for pension_type, bands in _TYPICAL_BY_AGE_PARSED.items()
+}
+
+
+# [min, max] bounds as shared read-only arrays for vectorised consumers. Only
+# types whose typical_fees is a plain min/max pair have fee bounds.
+_FEE_BOUNDS_NP: dict[str, np.ndarray] = {
+    pension_type: _readonly_array(info["typical_fees"], np.float64)
+    for pension_type, info in _PENSION_TYPES.items()
+    if isinstance(info.get("typical_fees"), FeeRange)
+}
+_VALUE_BOUNDS_NP: dict[str, np.ndarray] = {
+    pension_type: _readonly_array(info["min_value_range"], np.float64)
+    for pension_type, info in _PENSION_TYPES.items()
+    if "min_value_range" in info
+}
+
+
+def get_fee_bounds(pension_type: str) -> np.ndarray | None:
+    """Get typical annual fee bounds for a pension type as an array.
+
+    Args:
+        pension_type: The pension type to look up (e.g., "defined_contribution")
+
+    Returns:
+        Read-only float64 array of [min, max] fee rates, or None if the type
+        has no min/max typical_fees
+    """
+    return _FEE_BOUNDS_NP.get(pension_type)
+
+
+def get_value_bounds(pension_type: str) -> np.ndarray | None:
+    """Get the min_value_range for a pension type as an array.
+
+    Args:
+        pension_type: The pension type to look up (e.g., "defined_contribution")
+
+    Returns:
+        Read-only float64 array of [min, max] pension values in pounds, or
+        None if the type has no min_value_range
+    """
+    return _VALUE_BOUNDS_NP.get(pension_type)
+
+
+def get_age_bands(pension_type: str) -> tuple[AgeBand, ...]:
+    """Get the parsed typical value bands by age for a pension type.
+
+    Args:
+        pension_type: The pension type to look up (e.g., "defined_contribution")
+
+    Returns:
+        Age bands ordered by max_age, or an empty tuple if the type has no
+        typical_by_age data
+    """
+    return _TYPICAL_BY_AGE_PARSED.get(pension_type, ())
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_numeric_pair(value: Any) -> bool:
+    return isinstance(value, tuple) and len(value) == 2 and all(map(_is_number, value))
+
+
+def _collect_leaves(node: Any, path: str, keep, leaves: list[tuple[str, Any]]) -> None:
+    """Append (dotted path, value) for every leaf where keep(value) is true."""
+    if isinstance(node, Mapping):
+        for key, value in node.items():
+            _collect_leaves(value, f"{path}.{key}", keep, leaves)
+    elif keep(node):
+        leaves.append((path, node))
+
+
+def _leaf_registry(keep) -> tuple[Mapping[str, int], list[Any]]:
+    leaves: list[tuple[str, Any]] = []
+    for section in _SECTIONS:
+        _collect_leaves(_section(section), section, keep, leaves)
+    index = MappingProxyType({path: row for row, (path, _) in enumerate(leaves)})
+    return index, [value for _, value in leaves]
+
+
+@lru_cache(maxsize=None)
+def get_numeric_ranges() -> tuple[Mapping[str, int], np.ndarray]:
+    """Get every numeric (low, high) pair in the knowledge base as one array.
+
+    Fee ranges, value ranges, cost ranges and the like are gathered into a
+    single contiguous array, so they can be checked or scaled together
+    without walking the tree. Built on first call, which builds every section.
+
+    Returns:
+        (index, ranges): a read-only mapping of dotted path to row, and a
+        read-only (n, 2) float64 array of the pairs in knowledge base order
+    """
+    index, pairs = _leaf_registry(_is_numeric_pair)
+    return index, _readonly_array(pairs, np.float64).reshape(-1, 2)
+
+
+def get_range(path: str) -> np.ndarray | None:
+    """Get one numeric (low, high) pair by dotted path as an array.
+
+    Args:
+        path: Dotted path such as "transfer_mechanics.cetv.typical_multiples.range"
+
+    Returns:
+        Read-only float64 [low, high] view into get_numeric_ranges, or None
+        if the path is not a numeric pair
+    """
+    index, ranges = get_numeric_ranges()
+    row = index.get(path)
+    return None if row is None else ranges[row]
+
+
+@lru_cache(maxsize=None)
+def get_numeric_constants() -> tuple[Mapping[str, int], np.ndarray]:
+    """Get every scalar number in the knowledge base as one array.
+
+    Amounts, rates, limits and counts such as
+    "state_pension.new_state_pension.full_amount_2024_25" are gathered into
+    one contiguous array, so projections like an uplift to all amounts are a
+    single vectorised operation. Built on first call, which builds every
+    section.
+
+    Returns:
+        (index, values): a read-only mapping of dotted path to position, and
+        a read-only float64 array of the values in knowledge base order
+    """
+    index, values = _leaf_registry(_is_number)
+    return index, _readonly_array(values, np.float64)
+
+
+def get_constant(path: str) -> float:
+    """Get one scalar number from the knowledge base by dotted path.
+
+    Args:
+        path: Dotted path such as "state_pension.new_state_pension.annual_amount"
+
+    Returns:
+        The value as a float
+
+    Raises:
+        KeyError: If the path is not a scalar number
+    """
+    index, values = get_numeric_constants()
+    return float(values[index[path]])
+
+
+def validate_pension_value_for_age(age: int, total_value: float, pension_type: str) -> bool:
+    """Validate if pension value is realistic for customer age.
+
+    This function checks if a given pension value is within reasonable bounds
+    for a person of the given age, based on typical pension values by age range.
+
+    Args:
+        age: Customer's age
+        total_value: Total pension value in pounds
+        pension_type: Type of pension (e.g., "defined_contribution")
+
+    Returns:
+        True if the value is realistic or if validation cannot be performed,
+        False if the value is clearly unrealistic for the age
+    """
+    if pension_type not in _TYPES_WITH_AGE_DATA:
+        return True  # Unknown type or no age data, skip validation
+
+    bands = _TYPICAL_BY_AGE_PARSED[pension_type]
+
+    # Find the first range ending at or after this age; ranges share their
+    # boundary ages, so bisect_left keeps a boundary age in the earlier range
+    idx = bisect_left(_AGE_ENDS[pension_type], age)
+    if idx < len(bands):
+        band = bands[idx]
+        if band.min_age <= age:
+            # Allow 2x typical max for edge cases (high earners, etc.)
+            return band.min_value <= total_value <= band.max_value * 2
+
+    return True  # Age outside known ranges, skip validation
+
+
+def validate_many(ages: np.ndarray, values: np.ndarray, pension_type: str) -> np.ndarray:
+    """Validate many pension values against customer ages in one pass.
+
+    Vectorised equivalent of calling validate_pension_value_for_age for each
+    (age, value) pair, for batch checks over generated customers.
+
+    Args:
+        ages: Customer ages
+        values: Total pension values in pounds, broadcastable against ages
+        pension_type: Type of pension (e.g., "defined_contribution")
+
+    Returns:
+        Boolean array, True where the value is realistic or cannot be validated
+    """
+    ages = np.asarray(ages)
+    values = np.asarray(values, dtype=np.float64)
+    if pension_type not in _TYPES_WITH_AGE_DATA:
+        return np.ones(np.broadcast_shapes(ages.shape, values.shape), dtype=bool)
+
+    min_ages, max_ages, min_values, max_allowed = _AGE_BAND_ARRAYS[pension_type]
+    # Same first-match rule as the scalar path: bisect_left on the end ages
+    idx = np.searchsorted(max_ages, ages, side="left")
+    known = idx < len(max_ages)
+    idx = np.minimum(idx, len(max_ages) - 1)
+    known &= min_ages[idx] <= ages
+    return ~known | ((values >= min_values[idx]) & (values <= max_allowed[idx]))
+
+
+# Tables behind validate_many_sql only: a copy of the parsed age bands and a
+# scratch table for each batch. The knowledge accessors never read from here.
+_KNOWLEDGE_DB_SCHEMA = """
+CREATE TABLE typical_by_age (
+    pension_type TEXT NOT NULL,
+    min_age INTEGER NOT NULL,
+    max_age INTEGER NOT NULL,
+    min_value REAL NOT NULL,
+    max_value REAL NOT NULL
+);
+CREATE INDEX ix_typical_by_age_type_age ON typical_by_age (pension_type, min_age);
+CREATE TABLE validation_batch (
+    age INTEGER NOT NULL,
+    value REAL NOT NULL,
+    pension_type TEXT NOT NULL
+);
+"""
+
+# First band ordered by max_age wins, matching validate_pension_value_for_age;
+# rows with no matching band cannot be validated and count as valid.
+_VALIDATE_BATCH_SQL = """
+SELECT COALESCE(
+    (SELECT b.value BETWEEN t.min_value AND t.max_value * 2
+     FROM typical_by_age t
+     WHERE t.pension_type = b.pension_type AND b.age BETWEEN t.min_age AND t.max_age
+     ORDER BY t.max_age
+     LIMIT 1),
+    1
+)
+FROM validation_batch b
+ORDER BY b.rowid
+"""
+
+_KNOWLEDGE_DB_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _knowledge_db() -> sqlite3.Connection:
+    """Build the in-memory SQLite copy of the typical-by-age bands."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.executescript(_KNOWLEDGE_DB_SCHEMA)
+    conn.executemany(
+        "INSERT INTO typical_by_age VALUES (?, ?, ?, ?, ?)",
+        [
+            (pension_type, band.min_age, band.max_age, band.min_value, band.max_value)
+            for pension_type, bands in _TYPICAL_BY_AGE_PARSED.items()
+            for band in bands
+        ],
+    )
+    conn.commit()
+    return conn
+
+
+def validate_many_sql(rows: Iterable[tuple[int, float, str]]) -> list[bool]:
+    """Validate (age, total_value, pension_type) rows with a single SQL join.
+
+    Gives the same result as validate_many run per pension type, but
+    mixed pension types are resolved in one query rather than one Python
+    lookup per row.
+
+    Args:
+        rows: (age, total_value, pension_type) tuples
+
+    Returns:
+        One bool per input row, in input order
+    """
+    with _KNOWLEDGE_DB_LOCK:
+        conn = _knowledge_db()
+        try:
+            conn.executemany("INSERT INTO validation_batch VALUES (?, ?, ?)", rows)
+            return [bool(valid) for (valid,) in conn.execute(_VALIDATE_BATCH_SQL)]
+        finally:
+            conn.execute("DELETE FROM validation_batch")
+            conn.commit()
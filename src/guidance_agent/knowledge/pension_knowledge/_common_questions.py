@@ -0,0 +1,104 @@
+"""Common questions section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "when_can_access": {
+            "question": "When can I access my pension?",
+            "answer": "Usually age 55 (rising to 57 from April 2028). Exceptions: serious ill health at any age, protected pension age below 55 for some individuals."
+        },
+        "how_much_tax_free": {
+            "question": "How much tax-free cash can I take?",
+            "answer": "Usually 25% of pension pot, maximum £268,275 (Lump Sum Allowance). Some people have protected higher amounts."
+        },
+        "state_pension_amount": {
+            "question": "How much is the State Pension?",
+            "answer": "Full new State Pension is £221.20/week (£11,502.40/year) for 2024/25. Need 35 qualifying years for full amount, minimum 10 years for any payment."
+        },
+        "do_i_have_to_buy_annuity": {
+            "question": "Do I have to buy an annuity?",
+            "answer": "No. Since 2015 pension freedoms, can choose drawdown, UFPLS, annuity, or combination. Annuity provides guaranteed income but irreversible."
+        },
+        "should_i_consolidate": {
+            "question": "Should I consolidate my pensions?",
+            "answer": "Often beneficial (easier management, potentially lower fees) but check for valuable features: guaranteed annuity rates, protected tax-free cash, exit penalties. Never consolidate DB pensions without advice."
+        },
+        "what_happens_when_i_die": {
+            "question": "What happens to my pension when I die?",
+            "answer": "DC pension: tax-free to beneficiaries if you die before 75, taxed at their rate if after 75. DB pension: depends on scheme, typically spouse's pension. Usually outside estate for inheritance tax."
+        },
+        "can_i_access_before_55": {
+            "question": "Can I access my pension before 55?",
+            "answer": "Only for serious ill health (life expectancy under 12 months). Any other offer to access before 55 is likely a scam. 55% unauthorised payment tax charge applies."
+        },
+        "how_much_should_i_save": {
+            "question": "How much should I save into my pension?",
+            "answer": "Common rule: half your age as percentage when start saving. E.g., start at 30, save 15%. Depends on circumstances, existing pensions, state pension, retirement plans."
+        },
+        "what_fees_do_i_pay": {
+            "question": "What fees do I pay on my pension?",
+            "answer": "Typically: platform/provider fee (0.3-1%), fund management fee (0.1-1.5%), plus transaction costs. Total often 0.5-2.5%. Check annual statement for exact costs."
+        },
+        "can_i_still_contribute_when_not_working": {
+            "question": "Can I still contribute to a pension when not working?",
+            "answer": "Yes. Can contribute up to £3,600 gross per year (£2,880 net) and receive tax relief even with no earnings. May qualify for NI credits for State Pension."
+        },
+        "should_i_transfer_db_pension": {
+            "question": "Should I transfer my DB pension?",
+            "answer": "Usually no. FCA presumes DB transfer not in best interest. Guarantees usually very valuable. Must have regulated advice if over £30k. Only consider if exceptional circumstances."
+        },
+        "what_is_mpaa": {
+            "question": "What is MPAA and how do I trigger it?",
+            "answer": "Money Purchase Annual Allowance - reduces contribution limit to £10k after flexible access. Triggered by taking drawdown income or UFPLS. NOT triggered by tax-free cash only, annuities, or DB pensions."
+        },
+        "how_much_income_can_i_take": {
+            "question": "How much income can I take in retirement?",
+            "answer": "Drawdown: take any amount but risk running out. Rule of thumb: 4% per year sustainable. Depends on pot size, other income, state pension, life expectancy, investment returns."
+        },
+        "what_is_emergency_tax": {
+            "question": "What is emergency tax and can I avoid it?",
+            "answer": "HMRC taxes first pension withdrawal assuming repeated monthly - often over-taxes. Usually corrected by year end or reclaim using P55/P50Z/P53Z forms (4-8 weeks). Hard to avoid."
+        },
+        "can_i_claim_state_pension_overseas": {
+            "question": "Can I claim State Pension if I move abroad?",
+            "answer": "Yes, can claim UK State Pension overseas. However, frozen (no annual increases) in many countries. Still increases in EU/EEA, Gibraltar, Switzerland, countries with agreements."
+        },
+        "what_is_pension_wise": {
+            "question": "What is Pension Wise?",
+            "answer": "Free impartial government guidance for over-50s with DC pensions. Covers options, tax, scams. Guidance only, not personal advice. Book via MoneyHelper."
+        },
+        "do_pensions_count_for_inheritance_tax": {
+            "question": "Do pensions count for inheritance tax?",
+            "answer": "Usually no - pensions normally outside estate if trustees have discretion. Expression of wish guides but doesn't bind trustees. Helps avoid IHT but income tax may apply to beneficiaries."
+        },
+        "can_i_opt_out_of_workplace_pension": {
+            "question": "Can I opt out of workplace pension?",
+            "answer": "Yes. If opt out within 1 month, get contributions refunded. After 1 month, contributions stay in pension. Lose employer contributions and tax relief. Re-enrolled every 3 years."
+        },
+        "what_is_carry_forward": {
+            "question": "What is pension carry forward?",
+            "answer": "Can use unused annual allowance from previous 3 tax years. Must have been UK tax resident and pension scheme member. Use current year first, then previous years oldest first."
+        },
+        "how_do_i_find_lost_pensions": {
+            "question": "How do I find lost pensions?",
+            "answer": "Use government's Pension Tracing Service (free). Searches database of pension schemes. Need employer name and rough dates. Can also check old payslips, P60s, letters."
+        },
+        "what_is_db_vs_dc": {
+            "question": "What is the difference between DB and DC pensions?",
+            "answer": "DB (Defined Benefit): guaranteed income based on salary and service. DC (Defined Contribution): pot built from contributions, value depends on investments. DB generally more valuable but rare for new pensions."
+        },
+        "can_i_take_small_pensions": {
+            "question": "Can I take small pension pots as cash?",
+            "answer": "Yes. Pensions under £10k can use small pots rule - take up to 3 per year, 25% tax-free, 75% taxed. Doesn't trigger MPAA. Useful for consolidating old pots."
+        },
+        "what_is_tapered_annual_allowance": {
+            "question": "What is tapered annual allowance?",
+            "answer": "Reduced annual allowance for high earners. Threshold income over £260k and adjusted income over £360k. Reduces by £1 for every £2, minimum £10k. Affects doctors, lawyers, executives."
+        },
+        "how_pension_tax_relief_works": {
+            "question": "How does pension tax relief work?",
+            "answer": "Get tax relief at highest rate you pay. Basic rate: £80 contribution becomes £100. Higher rate: claim extra 20% via self-assessment. Additional rate: claim extra 25%. Relief at source or net pay arrangements."
+        }
+    }
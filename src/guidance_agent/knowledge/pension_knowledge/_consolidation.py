@@ -0,0 +1,43 @@
+"""Consolidation section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "benefits": {
+            "easier_management": "One pot easier to track than many",
+            "potentially_lower_fees": "Modern schemes often cheaper than old pensions",
+            "simpler_death_benefits": "Easier for beneficiaries",
+            "better_investment_choice": "May get better options in new scheme"
+        },
+        "risks": {
+            "loss_of_guarantees": "GAR, protected TFC, enhanced transfer values",
+            "exit_penalties": "Some old pensions have exit charges",
+            "loss_of_death_benefits": "Some old pensions have valuable death benefits",
+            "employer_contributions": "Can't consolidate current workplace pension while still contributing"
+        },
+        "when_not_to": {
+            "guaranteed_annuity_rates": "GAR extremely valuable - rarely worth giving up",
+            "protected_retirement_age": "Below age 55 - very valuable",
+            "db_pensions": "Almost never consolidate DB pensions",
+            "with_profits_funds": "May have MVR penalties",
+            "final_salary_schemes": "Keep DB schemes separate"
+        },
+        "process": {
+            "steps": [
+                "Gather information on all pensions",
+                "Check for valuable features/penalties",
+                "Compare fees old vs new",
+                "Request transfer pack from old scheme",
+                "Complete transfer forms",
+                "Transfer typically takes 4-8 weeks"
+            ],
+            "pension_finding_service": "Use govt service to find lost pensions"
+        },
+        "partial_consolidation": {
+            "description": "Consolidate some pensions but keep others",
+            "example": "Consolidate old workplace DC pensions, keep DB schemes separate",
+            "pragmatic": "Balance benefits of consolidation with risks"
+        }
+    }
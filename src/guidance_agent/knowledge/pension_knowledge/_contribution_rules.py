@@ -0,0 +1,56 @@
+"""Contribution rules section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "tax_relief_mechanisms": {
+            "relief_at_source": {
+                "description": "Scheme claims basic rate relief, added to pension pot",
+                "member_pays": "Net of basic rate",
+                "higher_rate_relief": "Higher rate taxpayers claim extra via self-assessment",
+                "example": "Pay £80, gets topped up to £100 in pension"
+            },
+            "net_pay": {
+                "description": "Contributions taken before tax calculated",
+                "member_pays": "Gross amount minus tax saving",
+                "automatic": "Get full relief automatically",
+                "low_earners_lose_out": "Those earning under personal allowance get no relief"
+            },
+            "maximum_relievable": "100% of UK earnings or £3,600 if not earning"
+        },
+        "salary_sacrifice": {
+            "description": "Exchange salary for employer pension contribution",
+            "benefits": {
+                "employee": "Saves NI as well as income tax",
+                "employer": "Saves employer NI (13.8%)",
+                "typical_saving": (0.12, 0.15)  # 12-15% for basic rate taxpayer
+            },
+            "affects": [
+                "Salary-based benefits (life insurance, mortgage applications)",
+                "Statutory benefits (SMP, SSP)",
+                "Income-based benefit claims"
+            ],
+            "restrictions": "Must not take below National Minimum Wage",
+            "reversibility": "Usually can opt out but check scheme rules"
+        },
+        "employer_contributions": {
+            "auto_enrollment_minimum": 0.03,  # 3% of qualifying earnings
+            "do_not_count_towards_40k": False,  # They DO count
+            "triggers_tapered_aa": "Included in adjusted income calculation",
+            "no_earnings_limit": "Employer can contribute even if member has no earnings"
+        },
+        "contribution_limits": {
+            "annual_allowance": 60000,
+            "tapered_aa_minimum": 10000,
+            "mpaa": 10000,
+            "no_lifetime_limit": "LTA abolished April 2024"
+        },
+        "opt_out_rules": {
+            "notice_period": "1 month from enrollment",
+            "refund": "If opt out in first month, get contributions refunded",
+            "after_first_month": "Can still opt out but contributions stay in pension",
+            "re_enrollment": "Employer must re-enroll every 3 years"
+        }
+    }
@@ -0,0 +1,60 @@
+"""Death benefits section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "dc_before_75": {
+            "lump_sum": "Tax-free if paid within 2 years of scheme being notified",
+            "drawdown": "Beneficiary can take income tax-free",
+            "annuity": "Can be purchased tax-free for beneficiary",
+            "leave_invested": "Beneficiary can leave invested and take later tax-free",
+            "two_year_rule": "Must be designated within 2 years of scheme informed of death"
+        },
+        "dc_after_75": {
+            "lump_sum": "Taxed at beneficiary's marginal income tax rate",
+            "drawdown": "Income taxed at beneficiary's marginal rate",
+            "annuity": "Annuity income taxed at beneficiary's marginal rate",
+            "no_iht": "Usually no inheritance tax, but income tax applies"
+        },
+        "db_death_benefits": {
+            "death_before_retirement": {
+                "lump_sum": "Multiple of salary, e.g. 2-4 times",
+                "spouse_pension": "Often 50-66% of member's prospective pension",
+                "dependent_children": "May receive pension until adulthood"
+            },
+            "death_after_retirement": {
+                "spouse_pension": "Typically 50-66% of member's pension",
+                "guarantee_period": "Some schemes guarantee payments for 5 years",
+                "lump_sum": "May be balance of guarantee period"
+            }
+        },
+        "expression_of_wish": {
+            "purpose": "Indicates to trustees who should receive benefits",
+            "not_binding": "Trustees have discretion - helps keep benefits outside estate",
+            "should_update": "Update after major life events (marriage, divorce, children)",
+            "iht_benefit": "Non-binding nature helps avoid IHT",
+            "nomination_vs_expression": "Nomination may be binding (less common), expression is guidance"
+        },
+        "beneficiary_options": {
+            "lump_sum": "Take entire amount as lump sum",
+            "drawdown": "Move into beneficiary's drawdown to take income flexibly",
+            "annuity": "Use to purchase annuity for guaranteed income",
+            "leave_invested": "Keep invested in original pension wrapper",
+            "tax_considerations": "Choice affects tax timing and amount"
+        },
+        "iht_treatment": {
+            "generally_exempt": "Pensions usually outside estate for IHT",
+            "scheme_discretion": "Must be under scheme discretion, not member's estate",
+            "expression_of_wish_helps": "Non-binding expression helps maintain exemption",
+            "hmrc_challenge": "HMRC may challenge if pension clearly used to avoid IHT",
+            "age_75_difference": "No IHT but different income tax treatment"
+        },
+        "small_pots_beneficiary": {
+            "limit": 30000,
+            "max_payments": 2,
+            "tax_treatment": "As per normal death benefit rules based on age",
+            "separate_from_member_small_pots": "Different rule from member's 3x £10k small pots"
+        }
+    }
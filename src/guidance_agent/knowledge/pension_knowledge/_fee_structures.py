@@ -0,0 +1,70 @@
+"""Fee structures section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "workplace_dc": {
+            "nest": 0.003,  # 0.3%
+            "now_pensions": 0.003,
+            "peoples_pension": 0.005,
+            "provider_default": 0.01  # Typical 1%
+        },
+        "personal_pensions": {
+            "platform_fee": (0.002, 0.0045),  # 0.2% - 0.45%
+            "fund_fees": (0.001, 0.015),  # 0.1% - 1.5%
+            "total_typical": 0.01  # 1% combined
+        },
+        "sipp_fees": {
+            "hargreaves_lansdown": {
+                "platform_fee": 0.0045,  # 0.45%, capped at £200
+                "dealing_charge": 11.95,
+                "annual_cap": 200
+            },
+            "aj_bell": {
+                "platform_fee_up_to_250k": 0.0025,  # 0.25%
+                "platform_fee_over_250k": 0.002,  # 0.20%
+                "dealing_charge": 9.95
+            },
+            "interactive_investor": {
+                "monthly_fee": 12.99,
+                "dealing_charge": 5.99,
+                "percentage_fee": 0  # Flat fee model
+            },
+            "fidelity": {
+                "platform_fee": 0.0035,  # 0.35%
+                "dealing_charge": 10,
+                "no_account_fee": True
+            }
+        },
+        "exit_penalties": {
+            "market_value_reduction": {
+                "description": "MVR applied if withdrawing from with-profits fund in poor conditions",
+                "typical_impact": (0, 0.20),  # Can be 0-20%
+                "when_applies": "Typically not applied at retirement age"
+            },
+            "early_exit_charges": {
+                "legacy_pensions": "Pre-2001 pensions may have exit charges",
+                "post_2001": "Charges capped at 1% if over 55",
+                "typical_range": (0, 0.05)  # 0-5%
+            },
+            "guaranteed_annuity_rate": {
+                "description": "Valuable guarantee lost if transfer out",
+                "typical_value": "Can be worth tens of thousands",
+                "fca_warning": "Requires regulated advice, high risk to transfer"
+            }
+        },
+        "ongoing_costs": {
+            "annual_management_charge": (0.003, 0.015),  # 0.3% - 1.5%
+            "transaction_costs": (0.001, 0.01),  # 0.1% - 1%
+            "fund_specific_costs": "OCF (Ongoing Charges Figure) includes AMC plus other costs",
+            "total_cost_range": (0.005, 0.025)  # 0.5% - 2.5% typical total
+        },
+        "advice_costs": {
+            "initial_advice": (500, 3000),
+            "db_transfer_advice": (1500, 5000),
+            "ongoing_percentage": (0.005, 0.01),  # 0.5% - 1% annual
+            "hourly_rate": (150, 300)
+        }
+    }
@@ -0,0 +1,43 @@
+"""Glossary section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "crystallisation": "Converting uncrystallised pension funds to provide benefits - triggers ability to take tax-free cash and income",
+        "uncrystallised": "Pension savings not yet accessed - still in accumulation phase",
+        "gmp": "Guaranteed Minimum Pension from contracting out - minimum pension contracted-out scheme must pay",
+        "pcls": "Pension Commencement Lump Sum - the tax-free cash taken when crystallise benefits (usually 25%)",
+        "ufpls": "Uncrystallised Funds Pension Lump Sum - taking ad-hoc lump sums, each 25% tax-free, 75% taxed",
+        "mpaa": "Money Purchase Annual Allowance - £10k limit on DC contributions after flexible access",
+        "cetv": "Cash Equivalent Transfer Value - lump sum offered by DB scheme to transfer out",
+        "tvas": "Transfer Value Analysis System - compares DB benefits with potential DC outcomes",
+        "apta": "Appropriate Pension Transfer Analysis - required for DB transfers over £30k",
+        "care": "Career Average Revalued Earnings - DB scheme based on average salary over career, not final salary",
+        "gar": "Guaranteed Annuity Rate - protected rate for buying annuity, often valuable",
+        "ppf": "Pension Protection Fund - protects DB pensions if employer becomes insolvent",
+        "fscs": "Financial Services Compensation Scheme - protects if provider goes bust",
+        "fos": "Financial Ombudsman Service - free dispute resolution",
+        "tpr": "The Pensions Regulator - regulates workplace pensions",
+        "nest": "National Employment Savings Trust - master trust for auto-enrollment",
+        "sipp": "Self-Invested Personal Pension - pension with wide investment choice",
+        "ssas": "Small Self-Administered Scheme - occupational pension for directors, max 11 members",
+        "gpp": "Group Personal Pension - personal pensions arranged by employer",
+        "ocf": "Ongoing Charges Figure - total annual costs of fund including AMC",
+        "amc": "Annual Management Charge - fee for managing investments",
+        "drawdown": "Taking income directly from pension while remaining invested",
+        "annuity": "Insurance product providing guaranteed income for life in exchange for pension pot",
+        "lsa": "Lump Sum Allowance - £268,275 limit on tax-free cash from April 2024",
+        "lsdba": "Lump Sum and Death Benefit Allowance - £1,073,100 limit on all lump sums from April 2024",
+        "lta": "Lifetime Allowance - abolished April 2024, previously £1,073,100 limit on total pension savings",
+        "aa": "Annual Allowance - £60k limit on tax-relieved contributions",
+        "tapered_aa": "Reduced annual allowance for high earners - minimum £10k",
+        "qrops": "Qualifying Recognised Overseas Pension Scheme - overseas pension that can receive UK transfers",
+        "ni": "National Insurance - contributions that build State Pension entitlement",
+        "serps": "State Earnings Related Pension Scheme - additional state pension 1978-2002",
+        "s2p": "State Second Pension - replaced SERPS 2002-2016",
+        "spa": "State Pension Age - age can claim State Pension (currently 66)",
+        "mvr": "Market Value Reduction - penalty applied when exit with-profits fund in poor conditions",
+        "protected_rights": "Rights from contracting out - restrictions abolished 2006"
+    }
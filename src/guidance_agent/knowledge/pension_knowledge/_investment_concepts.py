@@ -0,0 +1,79 @@
+"""Investment concepts section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "default_funds": {
+            "description": "Pre-selected investment option for those who don't choose",
+            "typical_structure": "Lifestyle or target date fund",
+            "regulation": "Must be appropriate for typical member",
+            "majority_use": "80%+ of members stay in default",
+            "charge_cap": "0.75% for default funds in auto-enrollment schemes"
+        },
+        "risk_grading": {
+            "typical_scale": (1, 10),  # 1 = lowest risk, 10 = highest risk
+            "factors": ["asset_allocation", "volatility", "expected_returns"],
+            "lower_risk": "More bonds, cash - lower returns, lower volatility",
+            "higher_risk": "More equities - higher potential returns, higher volatility",
+            "time_horizon": "Longer time = can take more risk"
+        },
+        "asset_classes": {
+            "cash": {
+                "description": "Money market funds, cash deposits",
+                "risk": "Very low",
+                "returns": "Low - typically below inflation",
+                "suitable_for": "Short-term, capital preservation"
+            },
+            "bonds_gilts": {
+                "description": "Government and corporate bonds",
+                "risk": "Low to medium",
+                "returns": "Modest - above cash, below equities long-term",
+                "types": ["government_gilts", "corporate_bonds", "index_linked"]
+            },
+            "equities": {
+                "description": "Shares in companies",
+                "risk": "Medium to high",
+                "returns": "Higher long-term, volatile short-term",
+                "types": ["uk", "global", "emerging_markets"]
+            },
+            "property": {
+                "description": "Commercial property funds",
+                "risk": "Medium",
+                "returns": "Moderate with income element",
+                "liquidity_risk": "Can suspend trading in market stress"
+            },
+            "alternatives": {
+                "description": "Hedge funds, private equity, infrastructure",
+                "risk": "Varies - often high",
+                "access": "Mainly in larger schemes or SIPPs"
+            }
+        },
+        "lifestyling": {
+            "description": "Automatically switches to lower risk as approach retirement",
+            "typical_switching": "Starts 5-15 years before retirement",
+            "target": "Move from equities to bonds/cash",
+            "purpose": "Reduce risk of market crash close to retirement",
+            "limitations": "Assumes taking cash/annuity - may not suit drawdown",
+            "modern_approach": "Some target different retirement outcomes (drawdown vs annuity)"
+        },
+        "fund_types": {
+            "active_funds": {
+                "description": "Fund manager selects investments trying to beat market",
+                "higher_fees": (0.005, 0.015),  # 0.5% - 1.5%
+                "risk": "May underperform or outperform market"
+            },
+            "passive_tracker": {
+                "description": "Tracks market index (e.g. FTSE 100)",
+                "lower_fees": (0.001, 0.005),  # 0.1% - 0.5%
+                "return": "Market return minus small fee"
+            }
+        },
+        "passive_vs_active": {
+            "passive_benefits": "Lower fees, consistent market returns, transparency",
+            "active_benefits": "Potential to beat market, active risk management",
+            "evidence": "Most active funds underperform after fees over long term",
+            "trend": "Growing shift to passive in workplace pensions"
+        }
+    }
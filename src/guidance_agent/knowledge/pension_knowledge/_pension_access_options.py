@@ -0,0 +1,112 @@
+"""Pension access options section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "minimum_pension_age": {
+            "current": 55,
+            "from_april_2028": 57,
+            "protected_ages": "Some individuals have protected pension age below 55",
+            "ill_health": "No minimum age for serious ill health",
+            "exceptions": [
+                "Professional sportspeople may have lower age",
+                "Those with protected rights from before 2006",
+                "Serious ill health at any age"
+            ]
+        },
+        "flexi_access_drawdown": {
+            "description": "Take income directly from pension pot while remaining invested",
+            "tax_free_cash": "Usually take 25% PCLS first",
+            "ongoing_income": "Flexible amounts, taxed as income",
+            "mpaa_trigger": "Taking income triggers MPAA (£10k limit on future contributions)",
+            "sustainability": {
+                "rule_of_thumb": "4% withdrawal rate often suggested",
+                "risk": "Pot can run out if withdrawals too high or poor investment returns",
+                "flexibility": "Can increase, decrease or stop withdrawals"
+            },
+            "death_benefits": {
+                "before_75": "Beneficiaries receive tax-free",
+                "after_75": "Beneficiaries pay tax at their marginal rate"
+            },
+            "investment_risk": "Remains invested - can go up or down",
+            "fca_considerations": "Need to understand investment risk and sustainability"
+        },
+        "ufpls": {
+            "description": "Uncrystallised Funds Pension Lump Sum - take lump sums as needed",
+            "tax_treatment": "Each payment: 25% tax-free, 75% taxed as income",
+            "mpaa_trigger": "Taking UFPLS triggers MPAA",
+            "emergency_tax_risk": "Often emergency taxed on first payment - can reclaim",
+            "flexibility": "Don't need to commit to drawdown, take ad-hoc amounts",
+            "suitable_for": "One-off needs, testing pension access, small pots",
+            "not_suitable_for": "Regular income (drawdown better for tax efficiency)"
+        },
+        "annuities": {
+            "description": "Exchange pension pot for guaranteed income for life",
+            "types": {
+                "level_annuity": {
+                    "description": "Fixed income, no increases",
+                    "highest_income": "Provides highest starting income",
+                    "inflation_risk": "Income eroded by inflation over time"
+                },
+                "escalating_annuity": {
+                    "description": "Income increases each year",
+                    "increase_types": ["fixed_percentage", "rpi_linked", "cpi_linked"],
+                    "lower_starting_income": "Starts lower than level annuity"
+                },
+                "enhanced_annuity": {
+                    "description": "Higher income for health conditions or lifestyle factors",
+                    "factors": ["smoking", "high_bmi", "medical_conditions", "postcode"],
+                    "typical_enhancement": (0.10, 0.50)  # 10-50% higher income
+                },
+                "joint_life_annuity": {
+                    "description": "Continues paying to spouse/partner after death",
+                    "spouse_percentage": (0.50, 1.0),  # 50-100% of original
+                    "cost": "Lower starting income than single life"
+                },
+                "value_protected_annuity": {
+                    "description": "Guarantees minimum payments (return of capital)",
+                    "guarantee_periods": [5, 10],  # Years
+                    "lump_sum_on_death": "If die before pot exhausted, balance paid to beneficiaries"
+                }
+            },
+            "rates_context": "Annuity rates vary with interest rates - higher interest rates = higher annuity income",
+            "irreversible": "Cannot be undone once purchased",
+            "open_market_option": "Can shop around for best rates, not restricted to existing provider",
+            "typical_rates_2024": {
+                "age_60_male": 0.055,  # £5,500 per year per £100k
+                "age_65_male": 0.065,  # £6,500 per year per £100k
+                "age_70_male": 0.078   # £7,800 per year per £100k
+            }
+        },
+        "phased_retirement": {
+            "description": "Crystallise pension in stages over time",
+            "benefits": [
+                "Spread tax-free cash over multiple years",
+                "Manage income tax liability",
+                "Remain invested longer",
+                "Flexibility to adjust to circumstances"
+            ],
+            "tax_efficiency": "Can keep income below higher rate threshold",
+            "mpaa_considerations": "Need to avoid triggering MPAA if want to continue high contributions",
+            "suitable_for": "Those reducing work hours gradually, phased retirement"
+        },
+        "tax_free_cash": {
+            "also_known_as": "PCLS - Pension Commencement Lump Sum",
+            "standard_amount": 0.25,  # 25% of crystallised fund
+            "maximum_2024_25": 268275,  # Lump Sum Allowance
+            "protected_amounts": "Some individuals have protected higher amounts from before 2024",
+            "how_taken": "When crystallise benefits, can take up to 25% as tax-free lump sum",
+            "remainder": "Remaining 75% must provide taxable income",
+            "no_obligation": "Can take less than 25% or nothing if prefer",
+            "one_off_or_staged": "Can take in stages if crystallise pension in phases"
+        },
+        "capped_drawdown": {
+            "status": "Legacy option - no new capped drawdown since April 2015",
+            "description": "Pre-2015 drawdown with income capped at 150% of GAD rate",
+            "can_convert": "Can convert to flexi-access drawdown",
+            "benefits_if_stay": "Doesn't trigger MPAA - can keep contributing full annual allowance",
+            "reviews": "Income cap recalculated every 3 years (or annually if over 75)"
+        }
+    }
@@ -0,0 +1,91 @@
+"""Pension types section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "defined_contribution": {
+            "description": "Pension pot built from contributions, value depends on investment growth",
+            "typical_providers": ["NEST", "Aviva", "Royal London", "Standard Life"],
+            "common_features": ["flexible_access", "investment_choice", "death_benefits"],
+            "typical_fees": {"min": 0.003, "max": 0.015},
+            "fca_considerations": "No guaranteed income, investment risk borne by member",
+            "min_value_range": (100, 500000),
+            "typical_by_age": {
+                "25-35": (1000, 15000),
+                "35-50": (10000, 100000),
+                "50-retirement": (50000, 300000)
+            }
+        },
+        "defined_benefit": {
+            "description": "Guaranteed income based on salary and years of service",
+            "calculation": "accrual_rate × years_service × final_salary",
+            "typical_accrual_rates": (0.016666666666666666, 0.0125),  # 1/60ths, 1/80ths
+            "typical_sectors": ["public_sector", "large_employers_pre_2000", "local_government"],
+            "fca_warning": "Valuable guarantees lost if transferred out - requires regulated advice if >£30k",
+            "special_features": ["guaranteed_income", "inflation_protection", "survivor_benefits", "early_retirement_factors"],
+            "transfer_value_multiple": {"min": 20, "max": 40}  # Typical CETV as multiple of annual income
+        },
+        "sipp": {
+            "description": "Self-Invested Personal Pension - offers wider investment choice than standard pensions",
+            "typical_providers": ["Hargreaves Lansdown", "AJ Bell", "Interactive Investor", "Fidelity"],
+            "common_features": ["wide_investment_choice", "commercial_property", "individual_shares", "etfs", "funds"],
+            "typical_fees": {
+                "platform_fee": (0.0025, 0.0045),  # 0.25% - 0.45%
+                "dealing_charges": (5, 12),  # Per trade
+                "annual_fee_cap": (0, 200)  # Some providers cap fees
+            },
+            "fca_considerations": "Greater investment freedom requires understanding of investment risks",
+            "min_value_range": (1000, 10000000),
+            "suitable_for": ["experienced_investors", "high_value_pensions", "business_owners"],
+            "restrictions": ["no_residential_property", "arm_length_transactions", "prohibited_assets"]
+        },
+        "stakeholder": {
+            "description": "Low-cost pension with capped charges, introduced 2001 to encourage pension saving",
+            "max_annual_charge": 0.015,  # 1.5% maximum
+            "min_contribution": 20,
+            "common_features": ["low_fees", "flexible_contributions", "default_investment", "no_penalties"],
+            "typical_providers": ["NEST", "Aviva", "Standard Life", "Legal & General"],
+            "fca_considerations": "Designed as accessible, affordable option with consumer protections",
+            "status": "Less common since auto-enrollment introduction, replaced by workplace schemes"
+        },
+        "group_personal_pension": {
+            "description": "Personal pensions arranged by employer, each member has individual contract",
+            "typical_providers": ["Aviva", "Scottish Widows", "Legal & General", "Aegon"],
+            "common_features": ["employer_contributions", "group_negotiated_fees", "individual_ownership", "portability"],
+            "typical_fees": {"min": 0.005, "max": 0.01},
+            "fca_considerations": "Individual contracts mean pension stays with member if they leave employer",
+            "vs_master_trust": "GPP = individual contracts, Master Trust = single trust-based scheme"
+        },
+        "ssas": {
+            "description": "Small Self-Administered Scheme - occupational pension for company directors and key employees",
+            "max_members": 11,
+            "typical_users": ["company_directors", "family_businesses", "senior_executives"],
+            "common_features": ["commercial_property_purchase", "loan_to_employer", "wider_investments", "trustee_control"],
+            "typical_setup_costs": (2000, 5000),
+            "typical_annual_costs": (1500, 3000),
+            "fca_considerations": "Requires professional trustees, complex administration, suitable for sophisticated users only",
+            "investment_limits": {
+                "employer_loan": 0.50,  # Max 50% of fund
+                "commercial_property": "No limit if arm's length transaction"
+            }
+        },
+        "master_trust": {
+            "description": "Trust-based multi-employer workplace pension scheme",
+            "typical_providers": ["NEST", "The People's Pension", "NOW: Pensions", "Smart Pension"],
+            "governance": "Independent trustees oversee scheme",
+            "common_features": ["auto_enrollment_compliant", "low_cost", "default_investment", "scale_benefits"],
+            "typical_fees": {"min": 0.003, "max": 0.008},
+            "fca_considerations": "TPR authorized, subject to additional regulatory oversight",
+            "member_protections": ["trustee_oversight", "tpr_authorization", "governance_requirements"]
+        },
+        "executive_pension_plan": {
+            "description": "Pension arrangement for senior employees with employer funding above standard contributions",
+            "typical_contribution": (0.15, 0.30),  # 15-30% of salary
+            "common_features": ["high_employer_contributions", "flexible_benefits", "death_in_service", "income_protection"],
+            "typical_users": ["directors", "senior_management", "key_employees"],
+            "fca_considerations": "Often includes additional benefits beyond pension savings",
+            "tax_treatment": "Subject to annual allowance, may trigger tapered AA for high earners"
+        }
+    }
@@ -0,0 +1,31 @@
+"""Pension wise section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "description": "Free, impartial government pension guidance",
+        "eligibility": "Anyone over 50 with DC pension",
+        "cost": "Free",
+        "format": ["Phone appointment", "Face to face appointment", "Online guidance"],
+        "covers": {
+            "topics": [
+                "Pension options at retirement",
+                "Tax implications",
+                "Pension scams",
+                "Next steps"
+            ],
+            "what_it_is_not": "Not personal recommendation - guidance only"
+        },
+        "vs_regulated_advice": {
+            "pension_wise": "Free, impartial guidance, no personal recommendation",
+            "regulated_advice": "Paid, personal recommendation, FCA regulated"
+        },
+        "moneyhelper_integration": {
+            "description": "Pension Wise now part of MoneyHelper service",
+            "booking": "Book through moneyhelper.org.uk",
+            "other_services": "MoneyHelper also offers debt, money and pension guidance"
+        },
+        "duty_to_refer": "Providers must refer members considering drawdown/annuity to Pension Wise"
+    }
@@ -0,0 +1,47 @@
+"""Protections section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "ppf": {
+            "full_name": "Pension Protection Fund",
+            "protects": "DB pension schemes if employer becomes insolvent",
+            "coverage": {
+                "not_yet_retired": "90% of expected pension, capped",
+                "already_retired": "100% of pension in payment, capped",
+                "cap_2024_25": 41461  # Annual cap for 65 year old
+            },
+            "funding": "Levy on all eligible DB schemes",
+            "does_not_cover": "DC schemes"
+        },
+        "fscs": {
+            "full_name": "Financial Services Compensation Scheme",
+            "protects": "If pension provider goes bust",
+            "coverage": {
+                "investments": "Up to £85,000 per person per firm for deposits",
+                "pensions": "100% of value if provider fails",
+                "advice": "May compensate for bad advice"
+            }
+        },
+        "fos": {
+            "full_name": "Financial Ombudsman Service",
+            "purpose": "Free dispute resolution for financial complaints",
+            "covers": "Complaints about pension providers and advisers",
+            "process": "Must complain to provider first, then can escalate to FOS",
+            "awards": "Can award up to £430,000",
+            "time_limit": "Usually must complain within 6 years"
+        },
+        "pension_regulator": {
+            "role": "Regulates workplace pension schemes",
+            "powers": [
+                "Auto-enrollment compliance",
+                "DB scheme funding",
+                "Master trust authorization",
+                "Pension scam prevention"
+            ],
+            "whistleblowing": "Can report employer non-compliance",
+            "enforcement": "Can issue penalties for non-compliance"
+        }
+    }
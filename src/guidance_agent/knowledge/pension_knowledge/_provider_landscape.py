@@ -0,0 +1,41 @@
+"""Provider landscape section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "platforms": {
+            "description": "Online investment platforms offering SIPPs and personal pensions",
+            "examples": ["Hargreaves Lansdown", "AJ Bell", "Interactive Investor", "Fidelity"],
+            "typical_fees": (0.0025, 0.0045),  # 0.25% - 0.45%
+            "benefits": "Wide investment choice, online access, consolidated view",
+            "suitable_for": "Those comfortable with investment decisions"
+        },
+        "insurance_companies": {
+            "description": "Traditional insurers offering pensions",
+            "examples": ["Aviva", "Standard Life", "Legal & General", "Scottish Widows"],
+            "typical_fees": (0.005, 0.01),  # 0.5% - 1%
+            "products": ["Workplace pensions", "Personal pensions", "Stakeholder"],
+            "suitable_for": "Workplace schemes, those wanting guided options"
+        },
+        "master_trusts": {
+            "description": "Multi-employer trust-based schemes",
+            "examples": ["NEST", "The People's Pension", "NOW: Pensions", "Smart Pension"],
+            "typical_fees": (0.003, 0.008),  # 0.3% - 0.8%
+            "governance": "Independent trustees oversee scheme",
+            "suitable_for": "Auto-enrollment, small employers",
+            "tpr_authorization": "Must be authorized by The Pensions Regulator"
+        },
+        "workplace_schemes": {
+            "types": ["Master trust", "Group personal pension", "Occupational scheme"],
+            "choice": "Employer chooses, employee enrolled",
+            "portability": "GPP moves with member, trust schemes don't"
+        },
+        "fee_comparison": {
+            "master_trusts_lowest": (0.003, 0.008),
+            "insurance_company": (0.005, 0.01),
+            "platforms": (0.0025, 0.0045),  # Plus fund fees
+            "impact_over_time": "1% extra fee = ~25% less pot over 40 years"
+        }
+    }
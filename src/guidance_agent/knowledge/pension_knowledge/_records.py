@@ -0,0 +1,202 @@
+"""Fixed-field record types for small, regularly shaped knowledge leaves."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from enum import StrEnum
+from functools import cache
+from typing import Any, NamedTuple
+
+
+class FeeRange(NamedTuple):
+    """A {"min", "max"} range, such as a pension type's typical fees."""
+
+    min: float
+    max: float
+
+    def __getitem__(self, key):
+        # Keep cfg["min"] working for callers written against the dict form
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+@dataclass(frozen=True, slots=True)
+class TaxBand:
+    """An income tax band: the rate and its (lower, upper) income bounds."""
+
+    rate: float
+    bands: tuple[int, int | None]
+
+    def __getitem__(self, key: str):
+        # Keep band["rate"] working for callers written against the dict form
+        if key not in _TAX_BAND_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+_TAX_BAND_FIELDS = frozenset(field.name for field in fields(TaxBand))
+
+
+class _MappingRecord(Mapping):
+    """Base for slotted records that also read as a mapping of their fields.
+
+    Subclasses are frozen, slotted dataclasses, so attribute access is a slot
+    lookup, while ``record["field"]``, iteration and ``thaw`` still treat them
+    like the dicts they replace.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class NewStatePension(_MappingRecord):
+    """The new (post-2016) State Pension and its 2024/25 amounts."""
+
+    started: str
+    eligible: str
+    full_amount_2024_25: float  # Per week
+    annual_amount: float
+    qualifying_years_needed: int
+    minimum_qualifying_years: int
+    triple_lock: str
+    calculation: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class OldStatePension(_MappingRecord):
+    """The basic State Pension for those reaching state pension age before 2016."""
+
+    applies_to: str
+    basic_state_pension_2024_25: float  # Per week
+    additional_pension: str
+    graduated_retirement_benefit: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CETV(_MappingRecord):
+    """Cash Equivalent Transfer Value quoted by a DB scheme."""
+
+    full_name: str
+    description: str
+    validity: str
+    calculation: str
+    typical_multiples: Mapping[str, Any]
+    factors_affecting: tuple[str, ...]
+    guarantee_period: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TVAS(_MappingRecord):
+    """Transfer Value Analysis System comparing DB and DC outcomes."""
+
+    full_name: str
+    description: str
+    critical_yield: Mapping[str, Any]
+    discount_rate: str
+    required_for: str
+    limitations: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class APTA(_MappingRecord):
+    """Appropriate Pension Transfer Analysis required for large DB transfers."""
+
+    full_name: str
+    required_for: str
+    who_can_provide: str
+    cost: tuple[int, int]
+    fca_presumption: str
+    must_cover: tuple[str, ...]
+    insistent_client: str
+
+
+class Provider(StrEnum):
+    """A pension provider named in a typical_providers or examples list.
+
+    Members are str subclasses, so they compare equal to and serialise as
+    their names; each name is a single shared object across all sections.
+    """
+
+    NEST = "NEST"
+    AVIVA = "Aviva"
+    STANDARD_LIFE = "Standard Life"
+    ROYAL_LONDON = "Royal London"
+    LEGAL_AND_GENERAL = "Legal & General"
+    SCOTTISH_WIDOWS = "Scottish Widows"
+    AEGON = "Aegon"
+    PRUDENTIAL = "Prudential"
+    THE_PEOPLES_PENSION = "The People's Pension"
+    NOW_PENSIONS = "NOW: Pensions"
+    SMART_PENSION = "Smart Pension"
+    HARGREAVES_LANSDOWN = "Hargreaves Lansdown"
+    AJ_BELL = "AJ Bell"
+    INTERACTIVE_INVESTOR = "Interactive Investor"
+    FIDELITY = "Fidelity"
+
+    @classmethod
+    @cache
+    def from_str(cls, name: str) -> "Provider":
+        """Look up a provider by its exact name.
+
+        Raises:
+            ValueError: If the name is not a known provider
+        """
+        return cls(name)
+
+
+class RiskLevel(StrEnum):
+    """An investment risk level, ordered from lowest to highest.
+
+    Each member's value is the display label used in the knowledge base, such
+    as "Low to medium", so members still compare equal to those strings.
+    Comparisons between members follow ``level`` rather than the labels'
+    alphabetical order.
+    """
+
+    VERY_LOW = "Very low"
+    LOW = "Low"
+    LOW_TO_MEDIUM = "Low to medium"
+    MEDIUM = "Medium"
+    MEDIUM_TO_HIGH = "Medium to high"
+    HIGH = "High"
+
+    @property
+    def level(self) -> int:
+        """Position on the scale, from 0 for VERY_LOW up to 5 for HIGH."""
+        return _RISK_LEVEL_ORDER[self]
+
+    def __lt__(self, other):
+        if isinstance(other, RiskLevel):
+            return self.level < other.level
+        return super().__lt__(other)
+
+    def __le__(self, other):
+        if isinstance(other, RiskLevel):
+            return self.level <= other.level
+        return super().__le__(other)
+
+    def __gt__(self, other):
+        if isinstance(other, RiskLevel):
+            return self.level > other.level
+        return super().__gt__(other)
+
+    def __ge__(self, other):
+        if isinstance(other, RiskLevel):
+            return self.level >= other.level
+        return super().__ge__(other)
+
+
+_RISK_LEVEL_ORDER = {level: index for index, level in enumerate(RiskLevel)}
@@ -0,0 +1,86 @@
+"""Regulations section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "auto_enrollment": {
+            "started": 2012,
+            "phased_rollout": "2012-2018, largest to smallest employers",
+            "minimum_total_contribution": 0.08,  # 8% total
+            "employer_minimum": 0.03,  # 3% minimum from employer
+            "employee_minimum": 0.05,  # 5% minimum from employee
+            "earnings_trigger_2024_25": 10000,  # Annual earnings threshold
+            "lower_qualifying_earnings": 6240,  # Lower limit for qualifying earnings
+            "upper_qualifying_earnings": 50270,  # Upper limit for qualifying earnings
+            "age_range": (22, "state_pension_age"),
+            "eligible_jobholders": "Automatically enrolled",
+            "non_eligible_jobholders": "Can opt in, no employer obligation",
+            "entitled_workers": "Can opt in, no employer contribution required",
+            "opt_out_period": "1 month from enrollment",
+            "re_enrollment": "Every 3 years for those who opted out",
+            "postponement": "Up to 3 months allowed for employers",
+            "penalties": {
+                "non_compliance": (400, 10000),  # Daily penalties possible
+                "enforcement": "The Pensions Regulator can issue compliance notices"
+            }
+        },
+        "db_transfers": {
+            "advice_threshold": 30000,
+            "fca_requirement": "Regulated financial advice mandatory for transfers over £30,000",
+            "typical_outcome": "FCA presumption that DB transfer not in client's best interest",
+            "tvas_requirement": "Transfer Value Analysis System required for DB transfers",
+            "appropriate_pension_transfer_analysis": "APTA required from FCA authorized adviser with pension transfer permissions",
+            "critical_yield": "Investment return needed to match DB benefits",
+            "scheme_consent": "DB scheme trustees may refuse transfer in some circumstances",
+            "statutory_discharge": "Trustees discharged of liability once CETV paid",
+            "safeguarded_benefits": "DB schemes, GARs, protected TFC all require advice",
+            "transfer_restrictions": {
+                "public_sector": "Many public sector schemes restrict transfers",
+                "unfunded_schemes": "Some unfunded schemes cannot transfer",
+                "in_payment": "Pensions already in payment generally cannot transfer"
+            },
+            "advice_costs": (1500, 5000),  # Typical cost for DB transfer advice
+            "fca_high_risk": "DB transfers are high risk - most people better staying in DB"
+        },
+        "small_pots": {
+            "definition": "Pension pot worth less than £10,000",
+            "limit_per_year": 3,  # Maximum 3 small pots can be taken per year
+            "no_advice_needed": True,
+            "common_scenario": "Consolidation of old workplace pensions from multiple jobs",
+            "tax_treatment": "25% tax-free, 75% taxed as income",
+            "not_trigger_mpaa": "Small pots rule does not trigger MPAA",
+            "beneficiary_small_pots": {
+                "limit": 30000,  # Higher limit for inherited pensions
+                "max_allowed": 2  # Maximum 2 inherited small pots
+            },
+            "process": "Scheme can pay out without member needing to take other benefits"
+        },
+        "pension_freedoms_2015": {
+            "introduced": "April 2015",
+            "key_changes": [
+                "Removed requirement to buy annuity",
+                "Introduced flexi-access drawdown",
+                "UFPLS introduced",
+                "Removed 55% death tax",
+                "Pension Wise guidance introduced"
+            ],
+            "age_restriction": 55,  # Minimum age for accessing benefits
+            "future_change": "Minimum age rising to 57 from April 2028"
+        },
+        "pension_scams_regulations": {
+            "cold_calling_ban": "Introduced 2019, illegal to cold call about pensions",
+            "early_access_warning": "Any offer to access pension before 55 is likely a scam",
+            "transfer_restrictions": "Restrictions on transferring to unregulated schemes",
+            "scamsmart_campaign": "FCA campaign warning of pension scams",
+            "red_flags": [
+                "Unsolicited contact",
+                "Time pressure",
+                "Unusual investments",
+                "Upfront fees",
+                "Overseas transfers",
+                "Promise of guaranteed returns"
+            ]
+        }
+    }
@@ -0,0 +1,52 @@
+"""Regulatory timeline section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "a_day_2006": {
+            "date": "6 April 2006",
+            "changes": [
+                "Simplified pension regime introduced",
+                "Lifetime allowance introduced (£1.5m initially)",
+                "Annual allowance introduced (£215k initially)",
+                "Most restrictions on contributions removed",
+                "Protected rights abolished"
+            ]
+        },
+        "auto_enrollment_2012": {
+            "date": "October 2012 onwards",
+            "changes": [
+                "Auto-enrollment phased in largest employers first",
+                "Minimum contributions initially 2%, rising to 8% by 2019",
+                "NEST launched",
+                "Transformed pension coverage - millions enrolled"
+            ]
+        },
+        "pension_freedoms_2015": {
+            "date": "6 April 2015",
+            "changes": [
+                "Removed requirement to buy annuity",
+                "Introduced flexi-access drawdown",
+                "UFPLS introduced",
+                "Pension Wise guidance service launched",
+                "55% death tax removed"
+            ]
+        },
+        "pension_dashboard_2025": {
+            "date": "Expected 2025",
+            "description": "Online service to see all pensions in one place",
+            "status": "Delayed multiple times, staging from 2024-2026",
+            "benefits": "Find lost pensions, consolidated view, better planning"
+        },
+        "lta_abolition_2024": {
+            "date": "6 April 2024",
+            "changes": [
+                "Lifetime allowance abolished",
+                "Lump sum allowances introduced (LSA £268,275, LSDBA £1,073,100)",
+                "No limit on pension pots",
+                "Protections still relevant for lump sums"
+            ]
+        }
+    }
@@ -0,0 +1,65 @@
+"""Special circumstances section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "divorce": {
+            "pension_sharing_order": {
+                "description": "Court orders pension split between spouses",
+                "clean_break": "Creates separate pension for ex-spouse",
+                "typical_percentage": (0.30, 0.50),
+                "implementation": "Each pension valued, percentage applied"
+            },
+            "pension_attachment_order": {
+                "description": "Ex-spouse receives portion when benefits taken",
+                "ongoing_link": "Maintains connection between parties",
+                "less_common": "Courts prefer sharing orders"
+            },
+            "offsetting": {
+                "description": "Keep pension, give up other assets",
+                "example": "Keep pension, ex-spouse keeps more of house",
+                "valuation_issues": "Comparing pension to property value difficult"
+            }
+        },
+        "redundancy": {
+            "pension_access": "Can access pension if over 55, even if redundant earlier",
+            "continuing_contributions": "Stop employer contributions, consider personal contributions",
+            "consolidation_opportunity": "Good time to review and consolidate",
+            "early_retirement": "Some DB schemes offer early retirement on redundancy"
+        },
+        "ill_health": {
+            "serious_ill_health": {
+                "criteria": "Life expectancy less than 12 months",
+                "benefit": "100% tax-free lump sum if under 75",
+                "no_age_limit": "Can access at any age"
+            },
+            "ill_health_early_retirement": {
+                "criteria": "Unable to work in own occupation",
+                "db_schemes": "Often enhanced benefits",
+                "dc_schemes": "Normal benefits but can access before 55",
+                "medical_evidence": "Requires medical certification"
+            }
+        },
+        "overseas": {
+            "uk_pensions_accessible": "Can access UK pensions while living overseas",
+            "tax_implications": "May be taxed in UK and overseas",
+            "state_pension_frozen": "Frozen in some countries (not EU/EEA)",
+            "qrops": {
+                "description": "Qualifying Recognised Overseas Pension Scheme",
+                "transfer_charge": "25% unless exceptions apply",
+                "scam_risk": "High risk area, regulated advice essential"
+            }
+        },
+        "career_breaks": {
+            "state_pension_credits": "May qualify for NI credits",
+            "contribution_gap": "Period without pension contributions",
+            "catch_up": "Use carry forward when return to work"
+        },
+        "multiple_employment": {
+            "multiple_pensions": "Can have pension from each employer",
+            "annual_allowance": "All contributions count towards single allowance",
+            "consolidation": "May want to consolidate when change jobs"
+        }
+    }
@@ -0,0 +1,83 @@
+"""State pension section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "new_state_pension": {
+            "started": "6 April 2016",
+            "eligible": "Men born on or after 6 April 1951, women born on or after 6 April 1953",
+            "full_amount_2024_25": 221.20,  # Per week
+            "annual_amount": 11502.40,  # 52 weeks
+            "qualifying_years_needed": 35,
+            "minimum_qualifying_years": 10,
+            "triple_lock": "Increases by highest of earnings growth, inflation (CPI), or 2.5%",
+            "calculation": "Based on NI record, not previous earnings"
+        },
+        "old_state_pension": {
+            "applies_to": "Those who reached state pension age before 6 April 2016",
+            "basic_state_pension_2024_25": 169.50,  # Per week
+            "additional_pension": "SERPS or State Second Pension (S2P) on top",
+            "graduated_retirement_benefit": "Small additional amount for NI paid 1961-1975"
+        },
+        "ni_qualifying_years": {
+            "how_to_qualify": [
+                "Working and paying NI contributions",
+                "Receiving NI credits (unemployment, sickness, caring)",
+                "Paying voluntary Class 2 or Class 3 contributions"
+            ],
+            "credits_available": {
+                "child_benefit": "For parent claiming child benefit",
+                "caring": "Carer's allowance or caring 20+ hours per week",
+                "unemployment": "Claiming JSA or UC",
+                "sickness": "First 28 weeks of ESA"
+            },
+            "check_record": "Use 'Check your State Pension' online service",
+            "gaps": "Can have gaps filled by voluntary contributions if recent enough"
+        },
+        "state_pension_age": {
+            "current_2024": 66,  # For both men and women
+            "rising_to_67": "Between 2026 and 2028",
+            "rising_to_68": "Proposed for 2044-2046",
+            "check_yours": "Use State Pension age calculator on gov.uk",
+            "gender_equalisation": "Completed in 2018, both now the same"
+        },
+        "deferral": {
+            "can_defer": "Don't have to claim State Pension at state pension age",
+            "increase_rate": "5.8% for every 52 weeks deferred",
+            "no_lump_sum": "Option for lump sum removed from April 2016",
+            "when_claimed": "Can claim at any point after deferring",
+            "inherited": "Spouse may inherit some of the increase"
+        },
+        "contracting_out": {
+            "ended": "April 2016",
+            "what_it_was": "Paid lower NI in exchange for giving up part of additional state pension",
+            "gmp": {
+                "full_name": "Guaranteed Minimum Pension",
+                "description": "Minimum pension that contracted-out scheme must pay",
+                "affects": "Reduces state pension entitlement but should be matched by occupational pension"
+            },
+            "impact_on_entitlement": "Reduces starting amount for new state pension calculation"
+        },
+        "protected_payments": {
+            "description": "Extra amount if entitled to more under old rules than new rules",
+            "who_gets": "Those with over 35 qualifying years under old system",
+            "how_paid": "Added on top of new state pension flat rate",
+            "not_increased": "Protected payment not increased by triple lock"
+        },
+        "voluntary_contributions": {
+            "class_2": {
+                "who_for": "Self-employed with profits under small profits threshold",
+                "cost_2024_25": 3.45,  # Per week
+                "benefit": "Builds qualifying year for state pension"
+            },
+            "class_3": {
+                "who_for": "Filling gaps in NI record",
+                "cost_2024_25": 17.45,  # Per week
+                "time_limit": "Usually can go back 6 years, sometimes more",
+                "worth_checking": "Not always worth it - check with DWP or use online checker"
+            },
+            "deadline": "Usually 6 years to fill gaps, but check extensions for specific years"
+        }
+    }
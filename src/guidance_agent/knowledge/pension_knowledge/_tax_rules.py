@@ -0,0 +1,114 @@
+"""Tax rules section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "annual_allowance": {
+            "standard_2024_25": 60000,
+            "includes": "All pension contributions (employee + employer + tax relief)",
+            "carry_forward": {
+                "description": "Can use unused allowance from previous 3 tax years",
+                "conditions": "Must have been UK tax resident and member of pension scheme",
+                "order": "Use current year first, then previous years oldest first"
+            },
+            "excess_charge": "Contributions over allowance taxed at marginal rate",
+            "claiming_relief": "Tax charge claimed via self-assessment"
+        },
+        "tapered_annual_allowance": {
+            "threshold_income_2024_25": 260000,
+            "adjusted_income_2024_25": 360000,
+            "reduction_rate": "£1 reduction for every £2 over threshold",
+            "minimum_allowance": 10000,
+            "calculation": {
+                "threshold_income": "Income excluding employer pension contributions",
+                "adjusted_income": "Income including employer pension contributions",
+                "both_must_exceed": "Both thresholds must be exceeded for taper to apply"
+            },
+            "affects": "High earners - doctors, lawyers, executives commonly affected"
+        },
+        "mpaa": {
+            "full_name": "Money Purchase Annual Allowance",
+            "amount_2024_25": 10000,
+            "triggered_by": [
+                "Taking flexi-access drawdown income",
+                "Taking UFPLS",
+                "Taking capped drawdown over cap",
+                "Taking scheme pension from small pension"
+            ],
+            "not_triggered_by": [
+                "Taking tax-free cash only",
+                "Buying annuity",
+                "Taking small pots",
+                "Serious ill health lump sum",
+                "DB scheme pensions"
+            ],
+            "irreversible": "Once triggered, applies for rest of life",
+            "affects": "Future money purchase (DC) contributions only, not DB",
+            "excess_charge": "Contributions over £10k subject to tax charge"
+        },
+        "lifetime_allowance": {
+            "status": "Abolished from April 2024",
+            "historical_context": "Previously £1,073,100 limit on total pension savings",
+            "replaced_by": "Lump sum allowances (LSA and LSDBA)",
+            "protections_remain": "LTA protections still relevant for lump sum allowances"
+        },
+        "lump_sum_allowances": {
+            "lsa": {
+                "full_name": "Lump Sum Allowance",
+                "amount_2024_25": 268275,  # 25% of old LTA
+                "covers": "Tax-free cash (PCLS) and some other tax-free lump sums",
+                "excess": "Amounts over LSA taxed at marginal rate"
+            },
+            "lsdba": {
+                "full_name": "Lump Sum and Death Benefit Allowance",
+                "amount_2024_25": 1073100,  # Old LTA amount
+                "covers": "All lump sums including death benefits paid as lump sums",
+                "excess": "Amounts over LSDBA taxed at marginal rate"
+            }
+        },
+        "emergency_tax": {
+            "description": "HMRC taxes first pension withdrawal on Month 1 basis assuming repeated monthly",
+            "affects": "UFPLS, first drawdown payments, one-off large withdrawals",
+            "codes": {
+                "month_1_basis": "Assumes income repeated every month",
+                "br_code": "Basic rate (20%) deducted from everything",
+                "0t_code": "No personal allowance applied"
+            },
+            "reclaim": {
+                "automatic": "Usually corrected by year end through PAYE coding",
+                "manual": "Can reclaim immediately using P55, P50Z or P53Z forms",
+                "timeframe": "Manual reclaims take 4-8 weeks"
+            },
+            "how_to_avoid": "Difficult to avoid on first withdrawal, inform provider of tax code if possible"
+        },
+        "income_tax_on_pensions": {
+            "treatment": "Pension income taxed as earned income",
+            "personal_allowance_2024_25": 12570,
+            "rates_england_wales_ni": {
+                "basic_rate": {"rate": 0.20, "bands": (12571, 50270)},
+                "higher_rate": {"rate": 0.40, "bands": (50271, 125140)},
+                "additional_rate": {"rate": 0.45, "bands": (125141, None)}
+            },
+            "rates_scotland": {
+                "starter_rate": {"rate": 0.19, "bands": (12571, 14876)},
+                "basic_rate": {"rate": 0.20, "bands": (14877, 26561)},
+                "intermediate_rate": {"rate": 0.21, "bands": (26562, 43662)},
+                "higher_rate": {"rate": 0.42, "bands": (43663, 75000)},
+                "advanced_rate": {"rate": 0.45, "bands": (75001, 125140)},
+                "top_rate": {"rate": 0.48, "bands": (125141, None)}
+            },
+            "state_pension_interaction": "State pension counts as income, uses up personal allowance"
+        },
+        "inheritance_tax": {
+            "general_treatment": "Pensions normally outside estate for IHT",
+            "discretionary_benefit": "Trustees have discretion over beneficiaries - helps avoid IHT",
+            "expression_of_wish": "Guides trustees but not binding",
+            "exceptions": {
+                "death_after_75": "No IHT but income tax on beneficiary withdrawals",
+                "deliberate_deprivation": "If pension used to avoid IHT, HMRC may challenge"
+            },
+            "planning_benefit": "Pensions are IHT-efficient way to pass wealth"
+        }
+    }
@@ -0,0 +1,106 @@
+"""Transfer mechanics section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "cetv": {
+            "full_name": "Cash Equivalent Transfer Value",
+            "description": "Lump sum offered by DB scheme in exchange for giving up benefits",
+            "validity": "Usually 3 months from quote date",
+            "calculation": "Based on actuarial assumptions about future benefits",
+            "typical_multiples": {
+                "range": (20, 40),  # Times annual pension
+                "high_multiples": "High multiples may indicate generous transfer, but still may not be appropriate"
+            },
+            "factors_affecting": [
+                "Age",
+                "Years to retirement",
+                "Gilt yields",
+                "Scheme funding level",
+                "Inflation assumptions"
+            ],
+            "guarantee_period": "Must be guaranteed for at least 3 months"
+        },
+        "tvas": {
+            "full_name": "Transfer Value Analysis System",
+            "description": "Compares DB benefits with potential DC outcomes",
+            "critical_yield": {
+                "description": "Investment return needed to match DB benefits",
+                "interpretation": "High critical yield = hard to match DB benefits"
+            },
+            "discount_rate": "Rate used to value DB benefits in present terms",
+            "required_for": "All DB transfers over £30k",
+            "limitations": "Based on assumptions - actual outcomes may differ"
+        },
+        "apta": {
+            "full_name": "Appropriate Pension Transfer Analysis",
+            "required_for": "DB transfers over £30k",
+            "who_can_provide": "FCA authorised advisers with pension transfer permissions",
+            "cost": (1500, 5000),
+            "fca_presumption": "Presumption that DB transfer not in client's best interest",
+            "must_cover": [
+                "Comparison of benefits",
+                "Risk analysis",
+                "Critical yield",
+                "Death benefits comparison",
+                "Sustainability of income"
+            ],
+            "insistent_client": "If client insists on transfer against advice, special procedures apply"
+        },
+        "transfer_timeline": {
+            "quote_request": "1-2 weeks for DB CETV quote",
+            "advice_process": "2-6 weeks for adviser to complete APTA",
+            "implementation": "4-8 weeks for transfer to complete once approved",
+            "total_typical": "8-16 weeks from start to finish",
+            "delays_possible": "Can be longer if scheme delays or queries arise"
+        },
+        "exit_penalties": {
+            "market_value_reduction": {
+                "description": "MVR applied to with-profits funds in poor conditions",
+                "when_applied": "More likely in poor market conditions, less likely at retirement age"
+            },
+            "early_exit_charges": {
+                "pre_2001_pensions": "May have substantial exit charges",
+                "post_2001_over_55": "Capped at 1% for those over 55",
+                "check_required": "Always check for exit penalties before transferring"
+            },
+            "loss_of_guarantees": "Often most significant 'penalty' is loss of valuable guarantees"
+        },
+        "loss_of_guarantees": {
+            "types": [
+                "DB guaranteed income",
+                "Guaranteed annuity rates (GAR)",
+                "Protected tax-free cash",
+                "Inflation protection",
+                "Spouse's benefits"
+            ],
+            "irreversible": "Cannot get guarantees back once transferred",
+            "valuation_difficulty": "Hard to put monetary value on guarantees",
+            "fca_position": "Guarantees usually more valuable than they appear"
+        },
+        "pension_scams": {
+            "warning_signs": [
+                "Unsolicited contact about pension",
+                "Pressure to transfer quickly",
+                "Offers of 'free pension review'",
+                "Access to pension before 55",
+                "Overseas investments",
+                "Upfront fees",
+                "Promises of high guaranteed returns"
+            ],
+            "common_scam_types": {
+                "pension_liberation": "Accessing pension before 55 - leads to 55% tax charge",
+                "high_risk_investments": "Pension transferred to SIPP then into high-risk/worthless assets",
+                "overseas_scams": "Transfer to overseas scheme, assets disappear"
+            },
+            "protection": {
+                "scamsmart": "FCA ScamSmart campaign provides information",
+                "cold_calling_ban": "Cold calling about pensions is illegal since 2019",
+                "check_authorisation": "Always check FCA register for adviser authorisation",
+                "take_time": "Never rush - legitimate offers won't expire in days"
+            },
+            "if_scammed": "Report to Action Fraud and FCA, seek legal advice"
+        }
+    }
@@ -0,0 +1,113 @@
+"""Typical scenarios section of the UK pension knowledge base."""
+
+from typing import Any
+
+
+def build() -> dict[str, Any]:
+    return {
+        "young_worker_22_30": {
+            "age_range": (22, 30),
+            "pension_count_range": (1, 2),
+            "total_value_range": (1000, 15000),
+            "common_types": ["defined_contribution"],
+            "common_goals": ["understand_basics", "check_on_track", "consolidate_old_pots"],
+            "typical_providers": ["NEST", "NOW: Pensions", "The People's Pension"]
+        },
+        "mid_career_35_50": {
+            "age_range": (35, 50),
+            "pension_count_range": (2, 5),
+            "total_value_range": (20000, 150000),
+            "common_types": ["defined_contribution", "small_db_from_early_career"],
+            "common_goals": ["consolidation", "reduce_fees", "check_on_track", "boost_savings"],
+            "typical_providers": ["Aviva", "Standard Life", "Royal London", "Prudential"]
+        },
+        "pre_retirement_55_67": {
+            "age_range": (55, 67),
+            "pension_count_range": (3, 8),
+            "total_value_range": (50000, 400000),
+            "common_types": ["defined_contribution", "defined_benefit", "personal_pensions"],
+            "common_goals": ["consolidation", "access_planning", "understand_options", "maximise_income"],
+            "special_considerations": ["protected_tax_free_cash", "guaranteed_annuity_rates", "db_safeguarded_benefits"]
+        },
+        "divorce_pension_sharing": {
+            "typical_age_range": (35, 55),
+            "mechanism": "Pension sharing order or pension attachment order",
+            "pension_sharing_order": {
+                "description": "Clean break - creates new pension for ex-spouse",
+                "typical_split": (0.30, 0.50),  # 30-50% common
+                "implementation": "Creates separate pension rights"
+            },
+            "pension_attachment": {
+                "description": "Ex-spouse receives share when benefits taken",
+                "ongoing_dependency": "Continues link between parties",
+                "less_common": "Generally less favoured than sharing orders"
+            },
+            "considerations": ["cetv_valuation", "offsetting_vs_sharing", "tax_implications", "remarriage_impact"]
+        },
+        "redundancy": {
+            "typical_age": (45, 60),
+            "pension_implications": [
+                "Loss of employer contributions",
+                "Possible early access if over 55",
+                "Consideration of consolidation during transition",
+                "Impact on retirement planning"
+            ],
+            "options": {
+                "continue_contributions": "Via personal pension if new job",
+                "pause_contributions": "No requirement to contribute when not working",
+                "early_access": "If over 55, can access existing pensions",
+                "consolidation": "Good time to review and consolidate"
+            },
+            "tax_relief_loss": "Loss of tax relief on employer contributions"
+        },
+        "ill_health_early_retirement": {
+            "minimum_age": None,  # No minimum age for ill health
+            "criteria": "Serious ill health preventing work",
+            "scheme_specific": "Each pension scheme has own rules",
+            "types": {
+                "serious_ill_health_lump_sum": {
+                    "criteria": "Life expectancy less than 12 months",
+                    "tax_treatment": "100% tax free if under 75",
+                    "lump_sum_allowance": "Tested against LSDBA (£1,073,100)"
+                },
+                "ill_health_early_retirement": {
+                    "criteria": "Unable to work in own occupation",
+                    "db_schemes": "Often enhanced benefits",
+                    "dc_schemes": "Normal benefits but earlier access"
+                }
+            },
+            "medical_evidence": "Requires medical certification"
+        },
+        "career_break": {
+            "scenarios": ["parenting", "education", "caring", "sabbatical", "unemployment"],
+            "pension_impact": {
+                "contribution_gap": "Period without pension contributions",
+                "state_pension_credits": "May qualify for NI credits",
+                "employer_contributions_lost": "Loss of employer matching"
+            },
+            "options": {
+                "maintain_personal_contributions": "Continue paying into personal pension if affordable",
+                "ni_credits": "Claim child benefit for NI credits, caring credits available",
+                "return_to_work": "Catch up with carry forward annual allowance"
+            }
+        },
+        "overseas_worker": {
+            "scenarios": ["expat", "returning_to_uk", "short_term_overseas", "retiring_abroad"],
+            "uk_pensions_overseas": {
+                "access_rights": "UK pensions can be accessed from overseas",
+                "tax_treatment": "UK tax may apply, plus overseas tax",
+                "state_pension_frozen": "State pension frozen in some countries (not EU/EEA)"
+            },
+            "qrops": {
+                "description": "Qualifying Recognised Overseas Pension Scheme",
+                "tax_charge": "25% overseas transfer charge unless exceptions apply",
+                "exceptions": [
+                    "Moving to same country as QROPS",
+                    "Remaining UK tax resident for 5 full tax years",
+                    "QROPS in EEA country"
+                ],
+                "fca_warning": "High risk of scams, regulated advice essential"
+            },
+            "double_taxation": "May be covered by double taxation treaties"
+        }
+    }
@@ -0,0 +1,69 @@
+"""Scan free text for pension providers and scam warning phrases.
+
+Every phrase listed under the scanned knowledge fields is compiled into one
+case-insensitive regular expression, built on first use, so a message is
+scanned in a single pass rather than once per phrase.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from guidance_agent.knowledge.pension_knowledge import PENSION_KNOWLEDGE
+
+# Knowledge fields whose entries are phrases likely to appear verbatim in messages
+SCANNED_FIELDS = frozenset(("typical_providers", "red_flags", "warning_signs"))
+
+
+class PhraseHit(NamedTuple):
+    """A knowledge phrase found in scanned text."""
+
+    start: int
+    end: int
+    phrase: str
+    sources: tuple[str, ...]  # Dotted knowledge paths listing the phrase
+
+
+def _collect_phrases(node: Any, path: str, phrases: dict[str, list[str]]) -> None:
+    if not isinstance(node, Mapping):
+        return
+    for key, value in node.items():
+        child_path = f"{path}.{key}"
+        if key in SCANNED_FIELDS:
+            for phrase in value:
+                phrases.setdefault(phrase, []).append(child_path)
+        else:
+            _collect_phrases(value, child_path, phrases)
+
+
+@lru_cache(maxsize=None)
+def _phrase_matcher() -> tuple[re.Pattern, dict[str, tuple[str, tuple[str, ...]]]]:
+    """Compile the phrase pattern and map lower-cased matches to (phrase, sources)."""
+    phrases: dict[str, list[str]] = {}
+    for section, content in PENSION_KNOWLEDGE.items():
+        _collect_phrases(content, section, phrases)
+    lookup = {phrase.lower(): (phrase, tuple(sources)) for phrase, sources in phrases.items()}
+    # Longest first, so "Unsolicited contact about pension" wins over "Unsolicited contact"
+    alternation = "|".join(re.escape(phrase) for phrase in sorted(lookup, key=len, reverse=True))
+    pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+    return pattern, lookup
+
+
+def scan_text(text: str) -> list[PhraseHit]:
+    """Find knowledge phrases mentioned in a message.
+
+    Args:
+        text: Free text such as a customer message
+
+    Returns:
+        Non-overlapping hits in order of appearance
+    """
+    pattern, lookup = _phrase_matcher()
+    hits = []
+    for match in pattern.finditer(text):
+        phrase, sources = lookup[match.group(0).lower()]
+        hits.append(PhraseHit(match.start(), match.end(), phrase, sources))
+    return hits
@@ -0,0 +1,63 @@
+"""Vectorised income tax on pension income.
+
+Band thresholds and rates are read from ``PENSION_KNOWLEDGE["tax_rules"]``
+and laid out as NumPy arrays (one of thresholds, one of rates, one of the
+cumulative tax due at each threshold) so tax on many incomes is computed
+with a single ``np.searchsorted`` rather than a Python loop over bands.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from guidance_agent.knowledge.pension_knowledge import PENSION_KNOWLEDGE
+
+TAX_JURISDICTIONS = ("england_wales_ni", "scotland")
+
+
+@lru_cache(maxsize=None)
+def _band_arrays(jurisdiction: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build read-only (thresholds, rates, tax_at_threshold) arrays.
+
+    The first band is the tax-free personal allowance. Each later band starts
+    where the previous one ends, so a band listed as (12571, 50270) covers
+    income above £12,570.
+    """
+    if jurisdiction not in TAX_JURISDICTIONS:
+        raise ValueError(
+            f"Unknown tax jurisdiction {jurisdiction!r}, expected one of {TAX_JURISDICTIONS}"
+        )
+    income_tax = PENSION_KNOWLEDGE["tax_rules"]["income_tax_on_pensions"]
+    bands = sorted(
+        income_tax[f"rates_{jurisdiction}"].values(), key=lambda band: band.bands[0]
+    )
+    thresholds = np.array([0] + [band.bands[0] - 1 for band in bands], dtype=np.float64)
+    rates = np.array([0.0] + [band.rate for band in bands], dtype=np.float64)
+    tax_at_threshold = np.concatenate(([0.0], np.cumsum(rates[:-1] * np.diff(thresholds))))
+    for array in (thresholds, rates, tax_at_threshold):
+        array.setflags(write=False)
+    return thresholds, rates, tax_at_threshold
+
+
+def apply_income_tax(incomes: np.ndarray, jurisdiction: str = "england_wales_ni") -> np.ndarray:
+    """Calculate marginal income tax due on annual pension incomes.
+
+    Uses the 2024/25 bands from the knowledge base. The personal allowance
+    taper for incomes over £100,000 is not applied.
+
+    Args:
+        incomes: Annual taxable incomes in pounds
+        jurisdiction: "england_wales_ni" or "scotland"
+
+    Returns:
+        Float array of tax due, the same shape as incomes
+
+    Raises:
+        ValueError: If the jurisdiction is not recognised
+    """
+    thresholds, rates, tax_at_threshold = _band_arrays(jurisdiction)
+    incomes = np.maximum(np.asarray(incomes, dtype=np.float64), 0.0)
+    idx = np.searchsorted(thresholds, incomes, side="right") - 1
+    return tax_at_threshold[idx] + rates[idx] * (incomes - thresholds[idx])
@@ -9,12 +9,14 @@ This module implements the learning mechanisms for the agent, including:
 
 from guidance_agent.learning.case_learning import (
     learn_from_successful_consultation,
+    learn_from_successful_consultations,
     extract_case_from_consultation,
     classify_task_type,
     summarise_customer_situation,
 )
 from guidance_agent.learning.reflection import (
     learn_from_failure,
+    learn_from_failures,
     reflect_on_failure,
     validate_principle,
     refine_principle,
@@ -31,11 +33,13 @@ from guidance_agent.learning.validation import (
 __all__ = [
     # Case learning
     "learn_from_successful_consultation",
+    "learn_from_successful_consultations",
     "extract_case_from_consultation",
     "classify_task_type",
     "summarise_customer_situation",
     # Reflection learning
     "learn_from_failure",
+    "learn_from_failures",
     "reflect_on_failure",
     "validate_principle",
     "refine_principle",
@@ -5,12 +5,51 @@ When a consultation succeeds, we extract a case that can be used as a template
 for similar future situations.
 """
 
+import re
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from itertools import accumulate
 from typing import Any
 from uuid import uuid4
 
 from guidance_agent.core.types import OutcomeResult, CustomerProfile, TaskType
 from guidance_agent.retrieval.retriever import CaseBase
-from guidance_agent.retrieval.embeddings import embed
+from guidance_agent.retrieval.embeddings import embed, embed_batch
+
+
+# Keyword groups in priority order: the first group with a keyword in the
+# question decides the task type (specific before general). Keywords match as
+# plain substrings of the lower-cased question.
+_TASK_KEYWORDS: tuple[tuple[TaskType, tuple[str, ...]], ...] = (
+    (TaskType.TAX_IMPLICATIONS, ("tax", "taxation")),
+    (TaskType.RETIREMENT_PLANNING, ("how much", "need for retirement", "retirement planning")),
+    (TaskType.PENSION_TRANSFER, ("transfer", "move pension", "consolidate")),
+    (TaskType.WITHDRAWAL_OPTIONS, ("withdrawal", "access", "take out", "take money", "options")),
+    (TaskType.ANNUITY_OPTIONS, ("annuity", "guaranteed income")),
+    (TaskType.DRAWDOWN_STRATEGY, ("drawdown", "flexible")),
+)
+# A DB keyword together with "transfer" outranks every group above
+_DB_KEYWORDS = frozenset(("defined benefit", "db pension"))
+
+# Members returned outside the table, bound once to skip the enum lookups
+_DB_TRANSFER = TaskType.DEFINED_BENEFIT_TRANSFER
+_GENERAL_INQUIRY = TaskType.GENERAL_INQUIRY
+
+# All keywords in one pattern, so a question is scanned once rather than once
+# per keyword. The lookahead reports a keyword at every position, including
+# keywords that overlap another match; longest first at a shared start.
+_TASK_KEYWORD_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(keyword)
+            for keyword in sorted(
+                {*_DB_KEYWORDS, *(kw for _, keywords in _TASK_KEYWORDS for kw in keywords)},
+                key=len,
+                reverse=True,
+            )
+        )
+    )
+)
 
 
 def classify_task_type(question: str) -> TaskType:
@@ -30,47 +69,26 @@ def classify_task_type(question: str) -> TaskType:
         >>> task_type = classify_task_type("What are my pension withdrawal options?")
         >>> assert task_type == TaskType.WITHDRAWAL_OPTIONS
     """
-    question_lower = question.lower()
-
-    # Keyword-based classification (order matters - check specific before general)
+    found = {match.group(1) for match in _TASK_KEYWORD_RE.finditer(question.lower())}
+    if not found:
+        return _GENERAL_INQUIRY
 
     # Check for DB transfer specifically first
-    if "defined benefit" in question_lower or "db pension" in question_lower:
-        if "transfer" in question_lower:
-            return TaskType.DEFINED_BENEFIT_TRANSFER
-
-    # Check for tax first (very specific)
-    if any(keyword in question_lower for keyword in ["tax", "taxation"]):
-        return TaskType.TAX_IMPLICATIONS
-
-    # Check for retirement planning
-    if any(keyword in question_lower for keyword in ["how much", "need for retirement", "retirement planning"]):
-        return TaskType.RETIREMENT_PLANNING
-
-    # Check for transfer (not DB)
-    if any(
-        keyword in question_lower
-        for keyword in ["transfer", "move pension", "consolidate"]
-    ):
-        return TaskType.PENSION_TRANSFER
-
-    # Check for withdrawal/access
-    if any(
-        keyword in question_lower
-        for keyword in ["withdrawal", "access", "take out", "take money", "options"]
-    ):
-        return TaskType.WITHDRAWAL_OPTIONS
-
-    # Check for annuity
-    if any(keyword in question_lower for keyword in ["annuity", "guaranteed income"]):
-        return TaskType.ANNUITY_OPTIONS
-
-    # Check for drawdown
-    if any(keyword in question_lower for keyword in ["drawdown", "flexible"]):
-        return TaskType.DRAWDOWN_STRATEGY
+    if "transfer" in found and not _DB_KEYWORDS.isdisjoint(found):
+        return _DB_TRANSFER
+
+    for task_type, keywords in _TASK_KEYWORDS:
+        if not found.isdisjoint(keywords):
+            return task_type
 
     # Default to general inquiry
-    return TaskType.GENERAL_INQUIRY
+    return _GENERAL_INQUIRY
+
+
+def _money(amount: float) -> str:
+    """Format a pound amount to whole pounds with thousands separators."""
+    # round() matches the half-even rounding of the ",.0f" format it replaces
+    return format(round(amount), ",d")
 
 
 def summarise_customer_situation(customer_profile: CustomerProfile) -> str:
@@ -104,24 +122,28 @@ def summarise_customer_situation(customer_profile: CustomerProfile) -> str:
     if customer_profile.financial:
         fin = customer_profile.financial
         parts.append(
-            f"Annual income £{fin.annual_income:,.0f}, "
-            f"total assets £{fin.total_assets:,.0f}, "
+            f"Annual income £{_money(fin.annual_income)}, "
+            f"total assets £{_money(fin.total_assets)}, "
             f"{fin.dependents} dependents, "
             f"{fin.risk_tolerance} risk tolerance"
         )
 
     # Pension details
-    if customer_profile.pensions:
-        total_pension_value = sum(p.current_value for p in customer_profile.pensions)
-        pension_count = len(customer_profile.pensions)
+    pensions = customer_profile.pensions
+    if pensions:
+        # Total value and DB scheme count in a single pass over the pots
+        total_pension_value = 0.0
+        db_count = 0
+        for pension in pensions:
+            total_pension_value += pension.current_value
+            db_count += pension.is_db_scheme
         parts.append(
-            f"{pension_count} pension pot(s) worth £{total_pension_value:,.0f} total"
+            f"{len(pensions)} pension pot(s) worth £{_money(total_pension_value)} total"
         )
 
         # Check for DB pensions
-        db_pensions = [p for p in customer_profile.pensions if p.is_db_scheme]
-        if db_pensions:
-            parts.append(f"Includes {len(db_pensions)} defined benefit pension(s)")
+        if db_count:
+            parts.append(f"Includes {db_count} defined benefit pension(s)")
 
     # Goals
     if customer_profile.goals:
@@ -160,15 +182,35 @@ def extract_case_from_consultation(
         >>> assert "embedding" in case_data
         >>> assert "task_type" in case_data
     """
-    # Classify the task type
-    task_type = classify_task_type(customer_profile.presenting_question)
-
     # Summarize customer situation
     customer_situation = summarise_customer_situation(customer_profile)
 
+    case_data = _build_case(
+        customer_profile,
+        customer_situation,
+        guidance_provided,
+        outcome,
+        conversational_quality,
+        conversation_history,
+    )
+
     # Create embedding for similarity search
-    # Embed the customer situation for matching similar cases
-    embedding = embed(customer_situation)
+    case_data["embedding"] = embed(customer_situation)
+
+    return case_data
+
+
+def _build_case(
+    customer_profile: CustomerProfile,
+    customer_situation: str,
+    guidance_provided: str,
+    outcome: OutcomeResult,
+    conversational_quality: float = None,
+    conversation_history: list = None,
+) -> dict[str, Any]:
+    """Build a case record without its embedding."""
+    # Classify the task type
+    task_type = classify_task_type(customer_profile.presenting_question)
 
     # Create case data
     case_data = {
@@ -177,7 +219,6 @@ def extract_case_from_consultation(
         "customer_situation": customer_situation,
         "guidance_provided": guidance_provided,
         "outcome": outcome.to_dict(),
-        "embedding": embedding,
     }
 
     # Capture dialogue techniques for high-quality consultations (Phase 2)
@@ -188,6 +229,51 @@ def extract_case_from_consultation(
     return case_data
 
 
+def _case_metadata(case_data: dict[str, Any]) -> dict[str, Any]:
+    """Select the case fields stored as case base metadata."""
+    metadata = {
+        "task_type": case_data["task_type"],
+        "customer_situation": case_data["customer_situation"],
+        "guidance_provided": case_data["guidance_provided"],
+        "outcome": case_data["outcome"],
+    }
+
+    # Include dialogue techniques if available
+    if "dialogue_techniques" in case_data:
+        metadata["dialogue_techniques"] = case_data["dialogue_techniques"]
+
+    return metadata
+
+
+# Signposting phrases used
+_SIGNPOST_PHRASES = (
+    "let me break this down", "let me explain", "let me help",
+    "here's what this means", "here's what", "building on",
+    "before we", "first,", "let's explore", "let's look",
+    "here's how", "one option", "one approach",
+    "some people find", "it's worth", "it depends",
+)
+# One pattern over all phrases, so each sentence is scanned once. The
+# lookahead reports the longest phrase at every position; shorter phrases
+# starting at the same place are inside it, so each phrase maps to every
+# phrase it contains ("here's what this means" also counts "here's what").
+_SIGNPOST_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(re.escape(phrase) for phrase in sorted(_SIGNPOST_PHRASES, key=len, reverse=True))
+    )
+)
+_SIGNPOSTS_WITHIN = {
+    phrase: tuple(other for other in _SIGNPOST_PHRASES if other in phrase)
+    for phrase in _SIGNPOST_PHRASES
+}
+_GREETINGS = ("Hi ", "Hello ", "Thank you ")
+
+# Examples kept per technique (top N, in conversation order)
+_MAX_SIGNPOSTING_EXAMPLES = 3
+_MAX_ENGAGEMENT_QUESTIONS = 3
+_MAX_PERSONALIZATION_EXAMPLES = 2
+
+
 def _extract_dialogue_techniques(conversation_history: list, quality_score: float) -> dict[str, Any]:
     """Extract successful dialogue techniques from a high-quality consultation.
 
@@ -202,62 +288,78 @@ def _extract_dialogue_techniques(conversation_history: list, quality_score: floa
         >>> techniques = _extract_dialogue_techniques(history, 0.85)
         >>> assert "signposting_examples" in techniques
     """
-    # Extract advisor messages only
-    advisor_messages = [
-        msg["content"]
-        for msg in conversation_history
-        if msg.get("role") == "advisor"
-    ]
+    # Extract advisor messages only, totalling their length on the way since
+    # the technique scan below may stop before reaching every message
+    advisor_messages = []
+    total_length = 0
+    for msg in conversation_history:
+        if msg.get("role") == "advisor":
+            content = msg["content"]
+            advisor_messages.append(content)
+            total_length += len(content)
 
     if not advisor_messages:
         return {}
 
-    # Signposting phrases used
-    signpost_phrases = [
-        "let me break this down", "let me explain", "let me help",
-        "here's what this means", "here's what", "building on",
-        "before we", "first,", "let's explore", "let's look",
-        "here's how", "one option", "one approach",
-        "some people find", "it's worth", "it depends"
-    ]
-
     signposting_examples = []
-    for msg in advisor_messages:
-        for phrase in signpost_phrases:
-            if phrase in msg.lower():
-                # Extract sentence containing the phrase
-                sentences = msg.split(". ")
-                for sentence in sentences:
-                    if phrase in sentence.lower():
-                        signposting_examples.append(sentence.strip())
-                        break
-
-    # Engagement questions (examples)
     engagement_questions = []
+    personalization_examples = []
     for msg in advisor_messages:
+        # Only as many examples as are kept are needed, so stop once all are full
+        need_signposts = len(signposting_examples) < _MAX_SIGNPOSTING_EXAMPLES
+        need_questions = len(engagement_questions) < _MAX_ENGAGEMENT_QUESTIONS
+        need_greetings = len(personalization_examples) < _MAX_PERSONALIZATION_EXAMPLES
+        if not (need_signposts or need_questions or need_greetings):
+            break
+
+        # Split each message once for all three checks
         sentences = msg.split(". ")
-        for sentence in sentences:
-            if "?" in sentence:
-                engagement_questions.append(sentence.strip())
 
-    # Personalization examples (name usage)
-    personalization_examples = []
-    for msg in advisor_messages:
+        # Signposting: for each phrase used, the first sentence containing it.
+        # The message is lower-cased and scanned whole, then each match is
+        # mapped back to its sentence by offset; no phrase contains ". ", so
+        # none can span two sentences.
+        if need_signposts:
+            lowered = msg.lower()
+            sentence_starts = list(
+                accumulate((len(sentence) + 2 for sentence in lowered.split(". ")[:-1]), initial=0)
+            )
+            first_sentence: dict[str, int] = {}
+            for match in _SIGNPOST_RE.finditer(lowered):
+                index = bisect_right(sentence_starts, match.start()) - 1
+                for phrase in _SIGNPOSTS_WITHIN[match.group(1)]:
+                    first_sentence.setdefault(phrase, index)
+            # A sentence with several phrases is kept once, at its first phrase
+            signposting_examples.extend(
+                sentences[index].strip()
+                for index in dict.fromkeys(
+                    first_sentence[phrase]
+                    for phrase in _SIGNPOST_PHRASES
+                    if phrase in first_sentence
+                )
+            )
+
+        # Engagement questions (examples)
+        if need_questions:
+            engagement_questions.extend(
+                sentence.strip() for sentence in sentences if "?" in sentence
+            )
+
+        # Personalization examples (name usage)
         # Look for patterns like "Hi [Name]" or addressing customer by name
-        if any(greeting in msg for greeting in ["Hi ", "Hello ", "Thank you "]):
-            sentences = msg.split(". ")
+        if need_greetings:
             for sentence in sentences:
-                if any(greeting in sentence for greeting in ["Hi ", "Hello ", "Thank you "]):
+                if any(greeting in sentence for greeting in _GREETINGS):
                     personalization_examples.append(sentence.strip())
                     break
 
     techniques = {
         "quality_score": quality_score,
-        "signposting_examples": signposting_examples[:3],  # Top 3 examples
-        "engagement_questions": engagement_questions[:3],  # Top 3 examples
-        "personalization_examples": personalization_examples[:2],  # Top 2 examples
+        "signposting_examples": signposting_examples[:_MAX_SIGNPOSTING_EXAMPLES],
+        "engagement_questions": engagement_questions[:_MAX_ENGAGEMENT_QUESTIONS],
+        "personalization_examples": personalization_examples[:_MAX_PERSONALIZATION_EXAMPLES],
         "total_advisor_messages": len(advisor_messages),
-        "avg_message_length": sum(len(msg) for msg in advisor_messages) // len(advisor_messages) if advisor_messages else 0,
+        "avg_message_length": total_length // len(advisor_messages),
     }
 
     return techniques
@@ -311,19 +413,57 @@ def learn_from_successful_consultation(
     )
 
     # Add to case base
-    metadata = {
-        "task_type": case_data["task_type"],
-        "customer_situation": case_data["customer_situation"],
-        "guidance_provided": case_data["guidance_provided"],
-        "outcome": case_data["outcome"],
-    }
-
-    # Include dialogue techniques if available
-    if "dialogue_techniques" in case_data:
-        metadata["dialogue_techniques"] = case_data["dialogue_techniques"]
-
     case_base.add(
         id=case_data["id"],
         embedding=case_data["embedding"],
-        metadata=metadata,
+        metadata=_case_metadata(case_data),
     )
+
+
+def learn_from_successful_consultations(
+    case_base: CaseBase,
+    consultations: Iterable[Mapping[str, Any]],
+) -> int:
+    """Learn from many consultations, embedding their situations in one batch.
+
+    Equivalent to calling learn_from_successful_consultation for each
+    consultation, but the customer situations are embedded together with
+    embed_batch (each distinct summary once) rather than one model call per
+    case. Useful when replaying or simulating many consultations.
+
+    Args:
+        case_base: Case base to add the cases to
+        consultations: Mappings of learn_from_successful_consultation keyword
+            arguments: customer_profile, guidance_provided, outcome and
+            optionally conversational_quality and conversation_history
+
+    Returns:
+        Number of cases added; unsuccessful consultations are skipped
+
+    Example:
+        >>> added = learn_from_successful_consultations(
+        ...     case_base,
+        ...     [{"customer_profile": profile, "guidance_provided": guidance, "outcome": outcome}],
+        ... )
+    """
+    cases = [
+        _build_case(
+            customer_situation=summarise_customer_situation(consultation["customer_profile"]),
+            **consultation,
+        )
+        for consultation in consultations
+        if consultation["outcome"].successful
+    ]
+    if not cases:
+        return 0
+
+    situations = list(dict.fromkeys(case["customer_situation"] for case in cases))
+    embeddings = dict(zip(situations, embed_batch(situations)))
+
+    for case_data in cases:
+        case_base.add(
+            id=case_data["id"],
+            embedding=list(embeddings[case_data["customer_situation"]]),
+            metadata=_case_metadata(case_data),
+        )
+    return len(cases)
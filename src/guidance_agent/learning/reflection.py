@@ -7,6 +7,7 @@ validates it, refines it, and potentially adds it as a rule to the rules base.
 
 import re
 import os
+from collections.abc import Iterable, Mapping
 from typing import Any
 from uuid import uuid4
 
@@ -14,9 +15,19 @@ from litellm import completion
 
 from guidance_agent.core.types import OutcomeResult, CustomerProfile
 from guidance_agent.retrieval.retriever import RulesBase
-from guidance_agent.retrieval.embeddings import embed
+from guidance_agent.retrieval.embeddings import embed, embed_batch
 from guidance_agent.core.template_engine import render_template
 
+# Patterns for parsing the labelled fields of LLM responses, compiled once
+_PRINCIPLE_RE = re.compile(r"Principle:\s*(.+?)(?=\n\n|Domain:|$)", re.DOTALL)
+_DOMAIN_RE = re.compile(r"Domain:\s*(.+?)(?=\n|$)")
+_VALID_RE = re.compile(r"Valid:\s*(True|False)", re.IGNORECASE)
+_CONFIDENCE_RE = re.compile(r"Confidence:\s*(0\.\d+|1\.0|\d+)")
+_REASON_RE = re.compile(r"Reason:\s*(.+?)(?=\n\n|$)", re.DOTALL)
+_REFINED_PREFIX_RE = re.compile(r"^Refined [Pp]rinciple:\s*")
+_VALUABLE_RE = re.compile(r"Valuable:\s*(True|False)", re.IGNORECASE)
+_SCORE_RE = re.compile(r"Score:\s*(0\.\d+|1\.0|\d+)")
+
 
 def reflect_on_failure(
     customer_profile: CustomerProfile,
@@ -62,8 +73,8 @@ def reflect_on_failure(
     content = response.choices[0].message.content
 
     # Parse response
-    principle_match = re.search(r"Principle:\s*(.+?)(?=\n\n|Domain:|$)", content, re.DOTALL)
-    domain_match = re.search(r"Domain:\s*(.+?)(?=\n|$)", content)
+    principle_match = _PRINCIPLE_RE.search(content)
+    domain_match = _DOMAIN_RE.search(content)
 
     principle = principle_match.group(1).strip() if principle_match else "Unknown principle"
     domain = domain_match.group(1).strip() if domain_match else "general"
@@ -105,9 +116,9 @@ def validate_principle(principle: str) -> dict[str, Any]:
     content = response.choices[0].message.content
 
     # Parse response
-    valid_match = re.search(r"Valid:\s*(True|False)", content, re.IGNORECASE)
-    confidence_match = re.search(r"Confidence:\s*(0\.\d+|1\.0|\d+)", content)
-    reason_match = re.search(r"Reason:\s*(.+?)(?=\n\n|$)", content, re.DOTALL)
+    valid_match = _VALID_RE.search(content)
+    confidence_match = _CONFIDENCE_RE.search(content)
+    reason_match = _REASON_RE.search(content)
 
     valid = valid_match.group(1).lower() == "true" if valid_match else False
     confidence = float(confidence_match.group(1)) if confidence_match else 0.5
@@ -149,7 +160,7 @@ def refine_principle(principle: str, domain: str) -> str:
     refined = response.choices[0].message.content.strip()
 
     # Remove any "Refined principle:" prefix
-    refined = re.sub(r"^Refined [Pp]rinciple:\s*", "", refined)
+    refined = _REFINED_PREFIX_RE.sub("", refined)
 
     return refined
 
@@ -187,8 +198,8 @@ def judge_rule_value(rule_principle: str, domain: str) -> bool:
     content = response.choices[0].message.content
 
     # Parse response
-    valuable_match = re.search(r"Valuable:\s*(True|False)", content, re.IGNORECASE)
-    score_match = re.search(r"Score:\s*(0\.\d+|1\.0|\d+)", content)
+    valuable_match = _VALUABLE_RE.search(content)
+    score_match = _SCORE_RE.search(content)
 
     is_valuable = valuable_match.group(1).lower() == "true" if valuable_match else False
     score = float(score_match.group(1)) if score_match else 0.0
@@ -233,6 +244,68 @@ def learn_from_failure(
     if outcome.successful:
         return
 
+    rule = _derive_rule(customer_profile, guidance_provided, outcome)
+    if rule is None:
+        return
+
+    # Step 5: Add to rules base
+    # Create embedding for similarity search
+    embedding = embed(rule["principle"])
+
+    # Add rule with confidence from validation
+    rules_base.add(id=uuid4(), embedding=embedding, metadata=rule)
+
+
+def learn_from_failures(
+    rules_base: RulesBase,
+    consultations: Iterable[Mapping[str, Any]],
+) -> int:
+    """Learn from many failed consultations, embedding their rules in one batch.
+
+    Equivalent to calling learn_from_failure for each consultation, but the
+    principles that pass validation and judging are embedded together with
+    embed_batch rather than one model call per rule. Useful when replaying
+    historical consultations.
+
+    Args:
+        rules_base: Rules base to add the rules to
+        consultations: Mappings of learn_from_failure keyword arguments:
+            customer_profile, guidance_provided and outcome
+
+    Returns:
+        Number of rules added; successful consultations are skipped
+
+    Example:
+        >>> added = learn_from_failures(
+        ...     rules_base,
+        ...     [{"customer_profile": profile, "guidance_provided": guidance, "outcome": outcome}],
+        ... )
+    """
+    rules = [
+        rule
+        for consultation in consultations
+        if not consultation["outcome"].successful
+        and (rule := _derive_rule(**consultation)) is not None
+    ]
+    if not rules:
+        return 0
+
+    embeddings = embed_batch([rule["principle"] for rule in rules])
+    for rule, embedding in zip(rules, embeddings):
+        rules_base.add(id=uuid4(), embedding=embedding, metadata=rule)
+    return len(rules)
+
+
+def _derive_rule(
+    customer_profile: CustomerProfile,
+    guidance_provided: str,
+    outcome: OutcomeResult,
+) -> dict[str, Any] | None:
+    """Reflect on, validate, refine and judge a failure's principle.
+
+    Returns:
+        Rule metadata for the rules base, or None if the principle was rejected
+    """
     # Step 1: Reflect on failure to extract principle
     reflection = reflect_on_failure(
         customer_profile=customer_profile,
@@ -248,7 +321,7 @@ def learn_from_failure(
 
     if not validation["valid"]:
         # Principle rejected - doesn't align with FCA guidelines
-        return
+        return None
 
     # Step 3: Refine principle
     refined_principle = refine_principle(principle, domain)
@@ -256,20 +329,11 @@ def learn_from_failure(
     # Step 4: Judge if rule is valuable
     if not judge_rule_value(refined_principle, domain):
         # Rule not valuable enough to store
-        return
-
-    # Step 5: Add to rules base
-    # Create embedding for similarity search
-    embedding = embed(refined_principle)
-
-    # Add rule with confidence from validation
-    rules_base.add(
-        id=uuid4(),
-        embedding=embedding,
-        metadata={
-            "principle": refined_principle,
-            "domain": domain,
-            "confidence": validation["confidence"],
-            "supporting_evidence": [],  # Start with empty evidence
-        },
-    )
+        return None
+
+    return {
+        "principle": refined_principle,
+        "domain": domain,
+        "confidence": validation["confidence"],
+        "supporting_evidence": [],  # Start with empty evidence
+    }
@@ -1,8 +1,13 @@
 """Embedding utilities using LiteLLM for provider flexibility."""
 
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import numpy as np
 from litellm import embedding
 from dotenv import load_dotenv
 
@@ -11,6 +16,19 @@ from guidance_agent.core.provider_config import get_embedding_dimension as get_d
 # Load environment variables
 load_dotenv()
 
+# Recently embedded texts, keyed by (model, dimensions sent, text), so a text
+# embedded again skips the API round-trip. Vectors are kept as tuples so
+# callers cannot mutate a cached entry through the lists they are given.
+EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", "4096"))
+_embed_cache: OrderedDict[tuple[str, Optional[int], str], tuple[float, ...]] = OrderedDict()
+_embed_cache_lock = threading.Lock()
+
+
+def clear_embed_cache() -> None:
+    """Forget every cached embedding."""
+    with _embed_cache_lock:
+        _embed_cache.clear()
+
 
 def embed(
     text: str | list[str],
@@ -19,6 +37,9 @@ def embed(
 ) -> list[float] | list[list[float]]:
     """Generate embeddings using LiteLLM (supports multiple providers).
 
+    The most recent EMBED_CACHE_SIZE distinct texts (per model and dimensions)
+    are cached in process, so repeated texts are not sent to the provider.
+
     Args:
         text: Single text string or list of texts to embed
         model: Model to use, defaults to LITELLM_MODEL_EMBEDDINGS env var
@@ -47,16 +68,39 @@ def embed(
     # Check if we should drop unsupported parameters
     drop_params = os.getenv("LITELLM_DROP_PARAMS", "false").lower() == "true"
 
-    # Generate embeddings
-    if drop_params:
-        # Don't pass dimensions parameter when drop_params is enabled
-        response = embedding(model=model, input=texts)
-    else:
-        # Pass dimensions parameter for models that support it
-        response = embedding(model=model, input=texts, dimensions=dimensions)
-
-    # Extract embeddings from response
-    embeddings = [data["embedding"] for data in response.data]
+    # Serve recently embedded texts from the cache; only the rest are sent
+    keys = [(model, None if drop_params else dimensions, t) for t in texts]
+    vectors: dict[tuple[str, Optional[int], str], tuple[float, ...]] = {}
+    with _embed_cache_lock:
+        for key in keys:
+            if key in _embed_cache:
+                _embed_cache.move_to_end(key)
+                vectors[key] = _embed_cache[key]
+    missing = list(dict.fromkeys(key for key in keys if key not in vectors))
+
+    if missing:
+        uncached = [key[2] for key in missing]
+
+        # Generate embeddings
+        if drop_params:
+            # Don't pass dimensions parameter when drop_params is enabled
+            response = embedding(model=model, input=uncached)
+        else:
+            # Pass dimensions parameter for models that support it
+            response = embedding(model=model, input=uncached, dimensions=dimensions)
+
+        # Extract embeddings from response
+        for key, data in zip(missing, response.data):
+            vectors[key] = tuple(data["embedding"])
+
+        if EMBED_CACHE_SIZE > 0:
+            with _embed_cache_lock:
+                for key in missing:
+                    _embed_cache[key] = vectors[key]
+                while len(_embed_cache) > EMBED_CACHE_SIZE:
+                    _embed_cache.popitem(last=False)
+
+    embeddings = [list(vectors[key]) for key in keys]
 
     # Return single embedding if input was single string
     return embeddings[0] if is_single else embeddings
@@ -67,33 +111,44 @@ def embed_batch(
     model: Optional[str] = None,
     dimensions: Optional[int] = None,
     batch_size: int = 100,
+    max_workers: int = 8,
 ) -> list[list[float]]:
     """Generate embeddings for a batch of texts with batching support.
 
-    Useful for processing large numbers of texts efficiently.
+    Useful for processing large numbers of texts efficiently. When the texts
+    span several API calls, the calls are made concurrently.
 
     Args:
         texts: List of texts to embed
         model: Model to use, defaults to LITELLM_MODEL_EMBEDDINGS env var
         dimensions: Embedding dimensions
         batch_size: Number of texts to process per API call
+        max_workers: Maximum number of API calls in flight at once
 
     Returns:
-        List of embedding vectors
+        List of embedding vectors, in the order of texts
     """
-    all_embeddings = []
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    if len(batches) <= 1 or max_workers <= 1:
+        results = [embed(batch, model=model, dimensions=dimensions) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            results = list(
+                executor.map(lambda batch: embed(batch, model=model, dimensions=dimensions), batches)
+            )
 
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        batch_embeddings = embed(batch, model=model, dimensions=dimensions)
+    all_embeddings = []
+    for batch_embeddings in results:
         all_embeddings.extend(batch_embeddings)
 
     return all_embeddings
 
 
-def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
+def cosine_similarity(vec1: Sequence[float] | np.ndarray, vec2: Sequence[float] | np.ndarray) -> float:
     """Calculate cosine similarity between two vectors.
 
+    Computed in float32 with NumPy; float32 arrays are used without copying.
+
     Args:
         vec1: First vector
         vec2: Second vector
@@ -101,17 +156,18 @@ def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     Returns:
         Cosine similarity score between -1 and 1
     """
-    if len(vec1) != len(vec2):
-        raise ValueError(f"Vectors must have same length: {len(vec1)} != {len(vec2)}")
+    a = np.asarray(vec1, dtype=np.float32)
+    b = np.asarray(vec2, dtype=np.float32)
+    if a.shape != b.shape:
+        raise ValueError(f"Vectors must have same length: {len(a)} != {len(b)}")
 
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = sum(a * a for a in vec1) ** 0.5
-    magnitude2 = sum(b * b for b in vec2) ** 0.5
+    magnitude1 = np.linalg.norm(a)
+    magnitude2 = np.linalg.norm(b)
 
     if magnitude1 == 0 or magnitude2 == 0:
         return 0.0
 
-    return dot_product / (magnitude1 * magnitude2)
+    return float(np.dot(a, b) / (magnitude1 * magnitude2))
 
 
 def get_embedding_dimension(model: Optional[str] = None) -> int:
@@ -1,5 +1,7 @@
 """Shared pytest fixtures for tests."""
 
+import sys
+
 import pytest
 from guidance_agent.core import AgentConfig
 from guidance_agent.core.database import engine, SessionLocal
@@ -37,6 +39,16 @@ def transactional_db_session():
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_embed_cache():
+    """Clear cached embeddings so each test sees its own embedding mock."""
+    yield
+    # Only if already imported, so tests that never use it skip importing LiteLLM
+    embeddings = sys.modules.get("guidance_agent.retrieval.embeddings")
+    if embeddings is not None:
+        embeddings.clear_embed_cache()
+
+
 @pytest.fixture
 def agent_config():
     """Create a sample agent configuration."""
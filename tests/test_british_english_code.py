@@ -22,7 +22,7 @@ Files tested:
 6. src/guidance_agent/evaluation/__init__.py
 7. src/guidance_agent/evaluation/judge_validation.py
 8. src/guidance_agent/api/routers/admin.py
-9. src/guidance_agent/knowledge/pension_knowledge.py
+9. src/guidance_agent/knowledge/pension_knowledge/
 """
 
 import ast
@@ -407,8 +407,17 @@ class TestBritishEnglishInAdminRouter:
             )
 
 
+def _pension_knowledge_source():
+    """Read the source of every module in the pension_knowledge package."""
+    from pathlib import Path
+    from guidance_agent.knowledge import pension_knowledge
+
+    package_dir = Path(pension_knowledge.__file__).parent
+    return "\n".join(path.read_text() for path in sorted(package_dir.glob("*.py")))
+
+
 class TestBritishEnglishInPensionKnowledge:
-    """Test knowledge/pension_knowledge.py uses British spelling."""
+    """Test the knowledge/pension_knowledge package uses British spelling."""
 
     def test_pension_knowledge_uses_maximise_income(self):
         """Test pension knowledge uses 'maximise_income' not 'maximize_income'.
@@ -417,12 +426,7 @@ class TestBritishEnglishInPensionKnowledge:
 
         This test will FAIL initially until the code is updated.
         """
-        from guidance_agent.knowledge import pension_knowledge
-        import inspect
-
-        source_file = inspect.getsourcefile(pension_knowledge)
-        with open(source_file, "r") as f:
-            source = f.read()
+        source = _pension_knowledge_source()
 
         assert "maximise_income" in source.lower(), (
             "pension_knowledge.py should use British spelling 'maximise_income'"
@@ -438,12 +442,7 @@ class TestBritishEnglishInPensionKnowledge:
 
         This test will FAIL initially until the code is updated.
         """
-        from guidance_agent.knowledge import pension_knowledge
-        import inspect
-
-        source_file = inspect.getsourcefile(pension_knowledge)
-        with open(source_file, "r") as f:
-            source = f.read()
+        source = _pension_knowledge_source()
 
         assert "favoured" in source.lower(), (
             "pension_knowledge.py should use British spelling 'favoured'"
@@ -3,12 +3,18 @@
 Following TDD approach: Write tests FIRST, then implement.
 """
 
+import logging
+from concurrent.futures import Future
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime
 from uuid import uuid4
 
 from guidance_agent.evaluation.experiments import (
+    CUSTOMER_GENERATION_WORKERS,
+    _generate_customers,
+    _record_progress_checkpoint,
     run_training_experiment,
     store_experiment_outcomes,
     load_experiment_outcomes,
@@ -36,10 +42,19 @@ class TestStoreExperimentOutcomes:
         mock_session.close.assert_called_once()
 
     @patch("guidance_agent.evaluation.experiments.get_session")
-    @patch("guidance_agent.evaluation.experiments.Consultation")
-    def test_store_experiment_outcomes_single_outcome(
-        self, mock_consultation_class, mock_get_session
+    def test_store_experiment_outcomes_empty_list_skips_insert(
+        self, mock_get_session
     ):
+        """Test storing empty outcomes list issues no insert."""
+        mock_session = Mock()
+        mock_get_session.return_value = mock_session
+
+        store_experiment_outcomes("test_experiment", [])
+
+        mock_session.execute.assert_not_called()
+
+    @patch("guidance_agent.evaluation.experiments.get_session")
+    def test_store_experiment_outcomes_single_outcome(self, mock_get_session):
         """Test storing single outcome."""
         mock_session = Mock()
         mock_get_session.return_value = mock_session
@@ -53,16 +68,17 @@ class TestStoreExperimentOutcomes:
         # Store outcome
         store_experiment_outcomes("exp1", [outcome])
 
-        # Should create one Consultation record
-        assert mock_consultation_class.call_count == 1
-        mock_session.add.assert_called_once()
+        # Should insert one Consultation row
+        mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert len(rows) == 1
+        assert rows[0]["outcome"] == outcome.to_dict()
+        assert rows[0]["meta"] == {"experiment": "exp1"}
+        assert rows[0]["start_time"] == outcome.timestamp
         mock_session.commit.assert_called_once()
 
     @patch("guidance_agent.evaluation.experiments.get_session")
-    @patch("guidance_agent.evaluation.experiments.Consultation")
-    def test_store_experiment_outcomes_multiple_outcomes(
-        self, mock_consultation_class, mock_get_session
-    ):
+    def test_store_experiment_outcomes_multiple_outcomes(self, mock_get_session):
         """Test storing multiple outcomes."""
         mock_session = Mock()
         mock_get_session.return_value = mock_session
@@ -76,11 +92,29 @@ class TestStoreExperimentOutcomes:
         # Store outcomes
         store_experiment_outcomes("exp2", outcomes)
 
-        # Should create three Consultation records
-        assert mock_consultation_class.call_count == 3
-        assert mock_session.add.call_count == 3
+        # Should insert all three rows in a single bulk statement
+        mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert len(rows) == 3
+        assert len({row["id"] for row in rows}) == 3
+        mock_session.add.assert_not_called()
         mock_session.commit.assert_called_once()
 
+    @patch("guidance_agent.evaluation.experiments.get_session")
+    def test_store_experiment_outcomes_reuses_provided_session(
+        self, mock_get_session
+    ):
+        """Test a caller-provided session is used without committing or closing."""
+        session = Mock()
+
+        store_experiment_outcomes("exp3", [OutcomeResult()], session=session)
+
+        mock_get_session.assert_not_called()
+        session.execute.assert_called_once()
+        session.flush.assert_called_once()
+        session.commit.assert_not_called()
+        session.close.assert_not_called()
+
 
 class TestLoadExperimentOutcomes:
     """Test load_experiment_outcomes function."""
@@ -90,7 +124,7 @@ class TestLoadExperimentOutcomes:
         """Test loading outcomes for non-existent experiment."""
         mock_session = Mock()
         mock_get_session.return_value = mock_session
-        mock_session.query.return_value.filter.return_value.all.return_value = []
+        mock_session.execute.return_value.scalars.return_value = iter([])
 
         outcomes = load_experiment_outcomes("nonexistent")
 
@@ -103,24 +137,58 @@ class TestLoadExperimentOutcomes:
         mock_session = Mock()
         mock_get_session.return_value = mock_session
 
-        # Mock consultation records
-        mock_consultation = Mock()
-        mock_consultation.outcome = {
-            "successful": True,
-            "customer_satisfaction": 8.0,
-            "comprehension": 7.5,
-        }
-        mock_session.query.return_value.filter.return_value.all.return_value = [
-            mock_consultation
-        ]
+        # Mock stored outcome JSON rows
+        stored = OutcomeResult(
+            successful=True,
+            customer_satisfaction=8.0,
+            comprehension=7.5,
+        ).to_dict()
+        mock_session.execute.return_value.scalars.return_value = iter(
+            [stored, {"successful": False, "customer_satisfaction": 4.0}]
+        )
 
         outcomes = load_experiment_outcomes("exp1")
 
-        # Should return empty list (simplified implementation)
-        # In production, this would deserialize properly
-        assert outcomes == []
+        # Should deserialise each stored outcome
+        assert len(outcomes) == 2
+        assert outcomes[0].successful is True
+        assert outcomes[0].customer_satisfaction == 8.0
+        assert outcomes[0].comprehension == 7.5
+        assert str(outcomes[0].outcome_id) == stored["outcome_id"]
+        assert outcomes[1].successful is False
+        assert outcomes[1].customer_satisfaction == 4.0
         mock_session.close.assert_called_once()
 
+    @patch("guidance_agent.evaluation.experiments.get_session")
+    def test_load_experiment_outcomes_selects_outcome_column_only(
+        self, mock_get_session
+    ):
+        """Test that only the outcome column is selected, not full rows."""
+        mock_session = Mock()
+        mock_get_session.return_value = mock_session
+        mock_session.execute.return_value.scalars.return_value = iter([])
+
+        load_experiment_outcomes("exp1")
+
+        stmt = mock_session.execute.call_args[0][0]
+        selected = [column.name for column in stmt.selected_columns]
+        assert selected == ["outcome"]
+        mock_session.query.assert_not_called()
+
+    @patch("guidance_agent.evaluation.experiments.get_session")
+    def test_load_experiment_outcomes_reuses_provided_session(
+        self, mock_get_session
+    ):
+        """Test a caller-provided session is used and left open."""
+        session = Mock()
+        session.execute.return_value.scalars.return_value = iter([])
+
+        load_experiment_outcomes("exp1", session=session)
+
+        mock_get_session.assert_not_called()
+        session.execute.assert_called_once()
+        session.close.assert_not_called()
+
 
 class TestRunTrainingExperiment:
     """Test run_training_experiment function."""
@@ -291,6 +359,11 @@ class TestRunTrainingExperiment:
         ]
         assert len(add_event_calls) >= 2  # At least 2 checkpoints
 
+        # Checkpoints are recorded (off-thread) in order with their metrics
+        progress = [call.kwargs["attributes"]["progress"] for call in add_event_calls]
+        assert progress == [100, 200]
+        assert add_event_calls[0].kwargs["attributes"]["avg_satisfaction"] == 8.0
+
     @patch("guidance_agent.evaluation.experiments.store_experiment_outcomes")
     @patch("guidance_agent.evaluation.experiments.run_consultation")
     @patch("guidance_agent.evaluation.experiments.generate_customer_profile")
@@ -361,3 +434,126 @@ class TestRunTrainingExperiment:
         call_args = mock_store.call_args
         assert call_args[0][0] == "test_exp"  # Experiment name
         assert len(call_args[0][1]) == 2  # Two outcomes
+
+    @patch("guidance_agent.evaluation.experiments.store_experiment_outcomes")
+    @patch("guidance_agent.evaluation.experiments.run_consultation")
+    @patch("guidance_agent.evaluation.experiments.generate_customer_profile")
+    @patch("guidance_agent.evaluation.experiments.trace")
+    def test_run_training_experiment_emits_array_attributes(
+        self, mock_trace, mock_generate, mock_run_consultation, mock_store
+    ):
+        """Test per-consultation evaluations are emitted as array attributes."""
+        # Setup mock span
+        mock_span = Mock()
+        mock_trace.get_tracer.return_value.start_as_current_span.return_value.__enter__.return_value = (
+            mock_span
+        )
+
+        # Setup mocks
+        mock_generate.return_value = CustomerProfile()
+        mock_run_consultation.side_effect = [
+            OutcomeResult(customer_satisfaction=8.0, fca_compliant=True),
+            OutcomeResult(customer_satisfaction=6.0, fca_compliant=False),
+            OutcomeResult(customer_satisfaction=7.0, fca_compliant=True),
+        ]
+
+        advisor = AdvisorAgent(profile=AdvisorProfile(name="Test", description="Test"))
+
+        # Run experiment
+        run_training_experiment("test_exp", advisor, [], num_customers=3)
+
+        attributes = {
+            call[0][0]: call[0][1] for call in mock_span.set_attribute.call_args_list
+        }
+
+        # One sequence attribute per metric, no per-index attributes
+        assert attributes["consultations.index"] == [0, 1, 2]
+        assert attributes["consultations.satisfaction"] == [8.0, 6.0, 7.0]
+        assert attributes["consultations.compliance"] == [1.0, 0.0, 1.0]
+        assert not any(name.startswith("consultation.") for name in attributes)
+
+    @patch("guidance_agent.evaluation.experiments.store_experiment_outcomes")
+    @patch("guidance_agent.evaluation.experiments.run_consultation")
+    @patch("guidance_agent.evaluation.experiments.generate_customer_profile")
+    @patch("guidance_agent.evaluation.experiments.trace")
+    def test_run_training_experiment_samples_span_attributes(
+        self, mock_trace, mock_generate, mock_run_consultation, mock_store
+    ):
+        """Test only early and non-compliant consultations are kept when sampling is off."""
+        # Setup mock span
+        mock_span = Mock()
+        mock_trace.get_tracer.return_value.start_as_current_span.return_value.__enter__.return_value = (
+            mock_span
+        )
+
+        # Setup mocks: consultation 25 is the only violation
+        mock_generate.return_value = CustomerProfile()
+        mock_run_consultation.side_effect = [
+            OutcomeResult(customer_satisfaction=8.0, fca_compliant=(i != 25))
+            for i in range(30)
+        ]
+
+        advisor = AdvisorAgent(profile=AdvisorProfile(name="Test", description="Test"))
+
+        # Run experiment with sampling disabled
+        run_training_experiment(
+            "test_exp", advisor, [], num_customers=30, span_sample_rate=0.0
+        )
+
+        attributes = {
+            call[0][0]: call[0][1] for call in mock_span.set_attribute.call_args_list
+        }
+        assert attributes["consultations.index"] == list(range(20)) + [25]
+        assert len(attributes["consultations.satisfaction"]) == 21
+
+        # Violation is always recorded as an event
+        violation_events = [
+            call for call in mock_span.add_event.call_args_list
+            if call[0][0] == "violation"
+        ]
+        assert len(violation_events) == 1
+        assert violation_events[0].kwargs["attributes"]["consultation"] == 25
+
+
+class TestRecordProgressCheckpoint:
+    """Test progress checkpoint events on the experiment span."""
+
+    def test_failed_checkpoint_is_logged_and_recorded(self, caplog):
+        """Test a metrics failure is surfaced instead of silently dropped."""
+        error = ValueError("bad outcome")
+        checkpoint = Future()
+        checkpoint.set_exception(error)
+        span = Mock()
+
+        with caplog.at_level(logging.ERROR, logger="guidance_agent.evaluation.experiments"):
+            _record_progress_checkpoint(span, 100, checkpoint)
+
+        span.add_event.assert_not_called()
+        span.record_exception.assert_called_once_with(error, attributes={"progress": 100})
+        assert "Progress checkpoint at 100 failed" in caplog.text
+        assert caplog.records[0].exc_info[1] is error
+
+
+class TestGenerateCustomers:
+    """Test background customer generation for experiment runs."""
+
+    @patch("guidance_agent.evaluation.experiments._generate_customer")
+    def test_generate_customers_bounds_in_flight_work(self, mock_generate):
+        """Test only a worker's worth of generations is queued ahead."""
+        mock_generate.side_effect = lambda index: index
+        pool = Mock()
+
+        def submit(fn, index):
+            future = Future()
+            future.set_result(fn(index))
+            return future
+
+        pool.submit.side_effect = submit
+
+        customers = _generate_customers(pool, 100)
+        first = next(customers)
+
+        assert first == 0
+        assert pool.submit.call_count == CUSTOMER_GENERATION_WORKERS
+        assert [first, *customers] == list(range(100))
+        assert pool.submit.call_count == 100
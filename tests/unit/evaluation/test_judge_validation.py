@@ -8,10 +8,13 @@ from unittest.mock import Mock, patch
 from dataclasses import dataclass
 
 from guidance_agent.evaluation.judge_validation import (
+    JUDGES,
+    LLMJudge,
     ValidationReport,
     validate_llm_judges,
     calculate_cohens_kappa,
     calculate_fn_rate,
+    compute_consensus,
     calculate_fp_rate,
     analyse_confidence_calibration,
 )
@@ -50,6 +53,126 @@ class TestValidationReport:
         assert report.confidence_calibration == {"mean_error": 0.05}
 
 
+JUDGES_PATH = "guidance_agent.evaluation.judge_validation.JUDGES"
+
+
+def _mock_response(content: str | None) -> Mock:
+    """Build a mock LiteLLM completion response."""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = content
+    return response
+
+
+class TestLLMJudge:
+    """Test LLMJudge class."""
+
+    def test_build_prompt_includes_transcript(self):
+        """Test prompt is built from the template and transcript."""
+        judge = LLMJudge("gpt-4")
+
+        prompt = judge._build_prompt("Customer: {hello}")
+
+        assert "Customer: {hello}" in prompt
+        assert prompt.startswith("Evaluate if this pension guidance")
+
+    @patch("guidance_agent.evaluation.judge_validation.batch_completion")
+    def test_evaluate_many_batches_requests(self, mock_batch_completion):
+        """Test evaluate_many issues one batched call for all transcripts."""
+        mock_batch_completion.return_value = [
+            _mock_response("PASS|0.9|Good"),
+            _mock_response("FAIL|0.7|Bad"),
+        ]
+        judge = LLMJudge("gpt-4")
+
+        results = judge.evaluate_many(["First", "Second"])
+
+        mock_batch_completion.assert_called_once()
+        messages = mock_batch_completion.call_args.kwargs["messages"]
+        assert len(messages) == 2
+        assert "First" in messages[0][0]["content"]
+        assert [r["passed"] for r in results] == [True, False]
+
+    @patch("guidance_agent.evaluation.judge_validation.completion")
+    def test_evaluate_parses_structured_response(self, mock_completion):
+        """Test PASS/FAIL, confidence and reasoning are parsed from the response."""
+        mock_completion.return_value = _mock_response("FAIL|0.65|Missed DB warning")
+        judge = LLMJudge("gpt-4")
+
+        result = judge.evaluate("Transcript")
+
+        assert result["passed"] is False
+        assert result["confidence"] == pytest.approx(0.65)
+        assert result["reasoning"] == "Missed DB warning"
+
+    @patch("guidance_agent.evaluation.judge_validation.completion")
+    def test_evaluate_falls_back_on_unstructured_response(self, mock_completion):
+        """Test responses not in the expected format use the keyword fallback."""
+        mock_completion.return_value = _mock_response("This consultation would PASS.")
+        judge = LLMJudge("gpt-4")
+
+        result = judge.evaluate("Transcript")
+
+        assert result["passed"] is True
+        assert result["confidence"] == 0.8
+
+    @patch("guidance_agent.evaluation.judge_validation.completion")
+    def test_evaluate_handles_empty_content(self, mock_completion):
+        """Test a reply with no content gives the conservative error result."""
+        mock_completion.return_value = _mock_response(None)
+        judge = LLMJudge("gpt-4")
+
+        result = judge.evaluate("Transcript")
+
+        assert result["passed"] is False
+        assert result["confidence"] == 0.5
+        assert result["reasoning"].startswith("Error:")
+
+    @patch("guidance_agent.evaluation.judge_validation.batch_completion")
+    def test_evaluate_many_handles_empty_content(self, mock_batch_completion):
+        """Test replies with no content or no choices don't abort the batch."""
+        no_choices = Mock()
+        no_choices.choices = []
+        mock_batch_completion.return_value = [
+            _mock_response("PASS|0.9|Good"),
+            _mock_response(None),
+            no_choices,
+        ]
+        judge = LLMJudge("gpt-4")
+
+        results = judge.evaluate_many(["First", "Second", "Third"])
+
+        assert results[0]["passed"] is True
+        for result in results[1:]:
+            assert result["passed"] is False
+            assert result["confidence"] == 0.5
+            assert result["reasoning"].startswith("Error:")
+
+    @patch("guidance_agent.evaluation.judge_validation.batch_completion")
+    def test_evaluate_many_handles_failed_requests(self, mock_batch_completion):
+        """Test failed requests in a batch fall back to conservative results."""
+        mock_batch_completion.return_value = [
+            _mock_response("PASS|0.9|Good"),
+            Exception("Rate limited"),
+        ]
+        judge = LLMJudge("gpt-4")
+
+        results = judge.evaluate_many(["First", "Second"])
+
+        assert results[0]["passed"] is True
+        assert results[1]["passed"] is False
+        assert results[1]["confidence"] == 0.5
+        assert "Rate limited" in results[1]["reasoning"]
+
+    @patch("guidance_agent.evaluation.judge_validation.batch_completion")
+    def test_evaluate_many_empty_list(self, mock_batch_completion):
+        """Test evaluate_many with no transcripts makes no calls."""
+        judge = LLMJudge("gpt-4")
+
+        assert judge.evaluate_many([]) == []
+        mock_batch_completion.assert_not_called()
+
+
 class TestCalculateCohensKappa:
     """Test calculate_cohens_kappa function."""
 
@@ -94,6 +217,49 @@ class TestCalculateCohensKappa:
         # Partial agreement should give kappa between 0 and 1
         assert 0.0 < kappa < 1.0
 
+    def test_calculate_cohens_kappa_constant_agreement(self):
+        """Test kappa is 1.0 when both raters give the same label throughout."""
+        results = [
+            {"expert_label": True, "judge_consensus": True},
+            {"expert_label": True, "judge_consensus": True},
+            {"expert_label": True, "judge_consensus": True},
+        ]
+
+        assert calculate_cohens_kappa(results) == 1.0
+
+    def test_calculate_cohens_kappa_single_result(self):
+        """Test kappa is 0.0 when there are too few results to compare."""
+        results = [{"expert_label": True, "judge_consensus": True}]
+
+        assert calculate_cohens_kappa(results) == 0.0
+
+
+class TestComputeConsensus:
+    """Test compute_consensus function."""
+
+    def test_compute_consensus_majority(self):
+        """Test majority vote and averaged confidence."""
+        results = [
+            {"passed": True, "confidence": 0.9},
+            {"passed": True, "confidence": 0.8},
+            {"passed": False, "confidence": 0.6},
+        ]
+
+        consensus = compute_consensus(results)
+
+        assert consensus["passed"] is True
+        assert consensus["confidence"] == pytest.approx(0.7666, abs=1e-3)
+
+    def test_compute_consensus_single_judge(self):
+        """Test a single judge result is returned as the consensus."""
+        consensus = compute_consensus([{"passed": False, "confidence": 0.4}])
+
+        assert consensus == {"passed": False, "confidence": 0.4}
+
+    def test_compute_consensus_empty(self):
+        """Test empty judge results give a failing zero-confidence consensus."""
+        assert compute_consensus([]) == {"passed": False, "confidence": 0.0}
+
 
 class TestCalculateFnRate:
     """Test calculate_fn_rate (false negative rate) function."""
@@ -237,12 +403,33 @@ class TestAnalyseConfidenceCalibration:
         assert "rmse" in calibration
         assert calibration["rmse"] > 0
 
+    def test_analyse_confidence_calibration_values(self):
+        """Test mean error and RMSE values are computed correctly."""
+        results = [
+            {"expert_confidence": 0.9, "judge_confidence": 0.6},
+            {"expert_confidence": 0.5, "judge_confidence": 0.9},
+        ]
+
+        calibration = analyse_confidence_calibration(results)
+
+        # Errors are 0.3 and 0.4
+        assert calibration["mean_error"] == pytest.approx(0.35)
+        assert calibration["rmse"] == pytest.approx((0.125) ** 0.5)
+
 
 class TestValidateLLMJudges:
     """Test validate_llm_judges function."""
 
-    @patch("guidance_agent.evaluation.judge_validation.LLMJudge")
-    def test_validate_llm_judges_empty_list(self, mock_judge_class):
+    def test_judge_panel_is_module_level(self):
+        """Test the judge panel is built once and shared across runs."""
+        assert len(JUDGES) == 3
+        assert [judge.model for judge in JUDGES] == [
+            "gpt-4",
+            "claude-3-5-sonnet",
+            "gpt-4",
+        ]
+
+    def test_validate_llm_judges_empty_list(self):
         """Test validation with empty consultation list."""
         report = validate_llm_judges([])
 
@@ -250,17 +437,13 @@ class TestValidateLLMJudges:
         assert report.total_consultations == 0
         assert report.agreement_rate == 0.0
 
-    @patch("guidance_agent.evaluation.judge_validation.LLMJudge")
-    def test_validate_llm_judges_single_consultation(self, mock_judge_class):
+    def test_validate_llm_judges_single_consultation(self):
         """Test validation with single consultation."""
         # Setup mock judge
         mock_judge = Mock()
-        mock_judge.evaluate.return_value = {
-            "passed": True,
-            "confidence": 0.9,
-            "reasoning": "Test",
-        }
-        mock_judge_class.return_value = mock_judge
+        mock_judge.evaluate_many.return_value = [
+            {"passed": True, "confidence": 0.9, "reasoning": "Test"}
+        ]
 
         # Expert labeled consultation
         consultation = ExpertLabeledConsultation(
@@ -271,7 +454,8 @@ class TestValidateLLMJudges:
             expert_reasoning="Compliant guidance provided",
         )
 
-        report = validate_llm_judges([consultation])
+        with patch(JUDGES_PATH, (mock_judge,) * 3):
+            report = validate_llm_judges([consultation])
 
         # Should have 1 consultation
         assert report.total_consultations == 1
@@ -279,17 +463,13 @@ class TestValidateLLMJudges:
         # Should have perfect agreement (both True)
         assert report.agreement_rate == 1.0
 
-    @patch("guidance_agent.evaluation.judge_validation.LLMJudge")
-    def test_validate_llm_judges_uses_multiple_judges(self, mock_judge_class):
+    def test_validate_llm_judges_uses_multiple_judges(self):
         """Test that validation uses multiple judge models."""
         # Setup mock judge
         mock_judge = Mock()
-        mock_judge.evaluate.return_value = {
-            "passed": True,
-            "confidence": 0.9,
-            "reasoning": "Test",
-        }
-        mock_judge_class.return_value = mock_judge
+        mock_judge.evaluate_many.return_value = [
+            {"passed": True, "confidence": 0.9, "reasoning": "Test"}
+        ]
 
         consultation = ExpertLabeledConsultation(
             consultation_id="test1",
@@ -299,22 +479,21 @@ class TestValidateLLMJudges:
             expert_reasoning="Test",
         )
 
-        report = validate_llm_judges([consultation])
+        with patch(JUDGES_PATH, (mock_judge,) * 3):
+            report = validate_llm_judges([consultation])
 
-        # Should create 3 judges (gpt-4, claude, gpt-4-v2)
-        assert mock_judge_class.call_count == 3
+        # Should evaluate with all 3 judges (gpt-4, claude, gpt-4-v2)
+        assert mock_judge.evaluate_many.call_count == 3
 
-    @patch("guidance_agent.evaluation.judge_validation.LLMJudge")
-    def test_validate_llm_judges_computes_consensus(self, mock_judge_class):
+    def test_validate_llm_judges_computes_consensus(self):
         """Test that validation computes consensus across judges."""
         # Setup mock judges with different results
         mock_judge = Mock()
-        mock_judge.evaluate.side_effect = [
-            {"passed": True, "confidence": 0.9, "reasoning": "Test1"},
-            {"passed": True, "confidence": 0.8, "reasoning": "Test2"},
-            {"passed": False, "confidence": 0.6, "reasoning": "Test3"},
+        mock_judge.evaluate_many.side_effect = [
+            [{"passed": True, "confidence": 0.9, "reasoning": "Test1"}],
+            [{"passed": True, "confidence": 0.8, "reasoning": "Test2"}],
+            [{"passed": False, "confidence": 0.6, "reasoning": "Test3"}],
         ]
-        mock_judge_class.return_value = mock_judge
 
         consultation = ExpertLabeledConsultation(
             consultation_id="test1",
@@ -324,42 +503,46 @@ class TestValidateLLMJudges:
             expert_reasoning="Test",
         )
 
-        report = validate_llm_judges([consultation])
+        with patch(JUDGES_PATH, (mock_judge,) * 3):
+            report = validate_llm_judges([consultation])
 
         # Consensus should be computed (2/3 say True, so consensus is True)
         # Agreement should be True (consensus matches expert)
         assert report.total_consultations == 1
 
-    @patch("guidance_agent.evaluation.judge_validation.LLMJudge")
-    def test_validate_llm_judges_realistic_scenario(self, mock_judge_class):
+    def test_validate_llm_judges_realistic_scenario(self):
         """Test validation with realistic mixed results."""
         # Setup mock judge with varying results
         mock_judge = Mock()
 
-        # For each consultation, return 3 judge results (one per judge model)
+        # Each judge returns one result per consultation (judge-major)
         # Consultation 1: all agree True (expert: True) - agreement
         # Consultation 2: all agree False (expert: False) - agreement
         # Consultation 3: majority True (expert: False) - disagreement (FP)
         # Consultation 4: majority False (expert: True) - disagreement (FN)
-        mock_judge.evaluate.side_effect = [
-            # Consultation 1
-            {"passed": True, "confidence": 0.9, "reasoning": "T1"},
-            {"passed": True, "confidence": 0.85, "reasoning": "T2"},
-            {"passed": True, "confidence": 0.88, "reasoning": "T3"},
-            # Consultation 2
-            {"passed": False, "confidence": 0.7, "reasoning": "T4"},
-            {"passed": False, "confidence": 0.75, "reasoning": "T5"},
-            {"passed": False, "confidence": 0.72, "reasoning": "T6"},
-            # Consultation 3 (FP)
-            {"passed": True, "confidence": 0.6, "reasoning": "T7"},
-            {"passed": True, "confidence": 0.65, "reasoning": "T8"},
-            {"passed": False, "confidence": 0.5, "reasoning": "T9"},
-            # Consultation 4 (FN)
-            {"passed": False, "confidence": 0.55, "reasoning": "T10"},
-            {"passed": False, "confidence": 0.6, "reasoning": "T11"},
-            {"passed": True, "confidence": 0.5, "reasoning": "T12"},
+        mock_judge.evaluate_many.side_effect = [
+            # Judge 1
+            [
+                {"passed": True, "confidence": 0.9, "reasoning": "T1"},
+                {"passed": False, "confidence": 0.7, "reasoning": "T4"},
+                {"passed": True, "confidence": 0.6, "reasoning": "T7"},
+                {"passed": False, "confidence": 0.55, "reasoning": "T10"},
+            ],
+            # Judge 2
+            [
+                {"passed": True, "confidence": 0.85, "reasoning": "T2"},
+                {"passed": False, "confidence": 0.75, "reasoning": "T5"},
+                {"passed": True, "confidence": 0.65, "reasoning": "T8"},
+                {"passed": False, "confidence": 0.6, "reasoning": "T11"},
+            ],
+            # Judge 3
+            [
+                {"passed": True, "confidence": 0.88, "reasoning": "T3"},
+                {"passed": False, "confidence": 0.72, "reasoning": "T6"},
+                {"passed": False, "confidence": 0.5, "reasoning": "T9"},
+                {"passed": True, "confidence": 0.5, "reasoning": "T12"},
+            ],
         ]
-        mock_judge_class.return_value = mock_judge
 
         consultations = [
             ExpertLabeledConsultation(
@@ -392,7 +575,8 @@ class TestValidateLLMJudges:
             ),
         ]
 
-        report = validate_llm_judges(consultations)
+        with patch(JUDGES_PATH, (mock_judge,) * 3):
+            report = validate_llm_judges(consultations)
 
         # 4 consultations
         assert report.total_consultations == 4
@@ -404,3 +588,7 @@ class TestValidateLLMJudges:
         assert report.cohens_kappa >= 0
         assert 0 <= report.false_negative_rate <= 1
         assert 0 <= report.false_positive_rate <= 1
+
+        # One FN out of two positives, one FP out of two negatives
+        assert report.false_negative_rate == pytest.approx(0.5)
+        assert report.false_positive_rate == pytest.approx(0.5)
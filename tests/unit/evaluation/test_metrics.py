@@ -46,6 +46,25 @@ class TestAdvisorMetrics:
         with pytest.raises(TypeError):
             AdvisorMetrics()
 
+    def test_advisor_metrics_is_slotted_and_frozen(self):
+        """Test metrics instances carry no __dict__ and cannot be mutated."""
+        metrics = AdvisorMetrics(
+            risk_assessment_accuracy=0.9,
+            guidance_appropriateness=0.9,
+            compliance_rate=1.0,
+            satisfaction=8.0,
+            comprehension=8.0,
+            goal_alignment=8.0,
+            understanding_verification_rate=0.9,
+            signposting_rate=0.9,
+            db_warning_rate=1.0,
+            overall_quality=0.9,
+        )
+
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            metrics.compliance_rate = 0.5
+
 
 class TestCalculateMetrics:
     """Test calculate_metrics function."""
@@ -0,0 +1,56 @@
+"""Tests for knowledge-derived pension calculators."""
+
+import pytest
+
+from guidance_agent.knowledge.calculators import (
+    estimate_annual_fees,
+    estimate_annuity_income,
+    estimate_cetv_range,
+)
+
+
+class TestEstimateAnnuityIncome:
+    """Test annuity income estimates."""
+
+    def test_listed_age(self):
+        """Test a listed age uses its typical rate."""
+        assert estimate_annuity_income(100000, 65) == pytest.approx(6500)
+
+    def test_interpolates_between_ages(self):
+        """Test ages between listed rates are interpolated."""
+        assert estimate_annuity_income(100000, 67) == pytest.approx(7020)
+
+    def test_clamps_outside_listed_ages(self):
+        """Test ages outside the table use the nearest listed rate."""
+        assert estimate_annuity_income(100000, 55) == pytest.approx(5500)
+        assert estimate_annuity_income(100000, 80) == pytest.approx(7800)
+
+    def test_uses_exact_pot(self):
+        """Test the pot is not rounded before the rate is applied."""
+        assert estimate_annuity_income(100020, 65) == pytest.approx(6501.3)
+
+
+class TestEstimateCetvRange:
+    """Test CETV range estimates."""
+
+    def test_uses_typical_multiples(self):
+        """Test the range is 20-40 times the annual pension."""
+        assert estimate_cetv_range(10000) == (200000.0, 400000.0)
+
+    def test_uses_exact_annual_pension(self):
+        """Test the annual pension is not rounded before the multiples apply."""
+        assert estimate_cetv_range(8449) == (168980.0, 337960.0)
+
+
+class TestEstimateAnnualFees:
+    """Test annual fee estimates."""
+
+    def test_fee_range_for_dc(self):
+        """Test fees scale the DC typical fee bounds."""
+        low, high = estimate_annual_fees(100000, "defined_contribution")
+        assert low == pytest.approx(300)
+        assert high == pytest.approx(1500)
+
+    def test_type_without_fee_bounds(self):
+        """Test types without min/max fees return None."""
+        assert estimate_annual_fees(100000, "sipp") is None
@@ -0,0 +1,50 @@
+"""Tests for keyword search over the knowledge base."""
+
+from guidance_agent.knowledge.keyword_index import KeywordHit, _keyword_index, search_knowledge
+
+
+class TestSearchKnowledge:
+    """Test keyword lookups through the inverted index."""
+
+    def test_finds_string_leaf(self):
+        """Test a string value is found by its words, ignoring case."""
+        hits = search_knowledge("COLD calling")
+        assert KeywordHit(
+            "transfer_mechanics.pension_scams.protection.cold_calling_ban",
+            "Cold calling about pensions is illegal since 2019",
+        ) in hits
+
+    def test_finds_list_entry(self):
+        """Test list entries are indexed under the path of their list."""
+        assert search_knowledge("gilt yields") == (
+            KeywordHit("transfer_mechanics.cetv.factors_affecting", "Gilt yields"),
+        )
+
+    def test_finds_risk_levels_by_label(self):
+        """Test risk levels are indexed by their display label."""
+        assert KeywordHit("investment_concepts.asset_classes.cash.risk", "Very low") in (
+            search_knowledge("very low")
+        )
+
+    def test_requires_every_word(self):
+        """Test only entries containing all query words match."""
+        hits = search_knowledge("cold calling")
+        assert hits
+        assert all({"cold", "calling"} <= set(hit.text.lower().split()) for hit in hits)
+        assert search_knowledge("cold xylophone") == ()
+
+    def test_empty_query(self):
+        """Test a query without words returns nothing."""
+        assert search_knowledge("  -- ") == ()
+
+    def test_index_is_built_once(self):
+        """Test the index is cached between searches."""
+        search_knowledge("annuity")
+        search_knowledge("drawdown")
+        assert _keyword_index.cache_info().misses <= 1
+
+    def test_results_are_memoised(self):
+        """Test repeated queries are served from the cache."""
+        first = search_knowledge("state pension age")
+        assert search_knowledge("state pension age") is first
+        assert search_knowledge.cache_info().hits >= 1
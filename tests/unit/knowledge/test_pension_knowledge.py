@@ -1,5 +1,10 @@
 """Tests for pension knowledge module."""
 
+import json
+import sys
+from collections.abc import Mapping
+
+import numpy as np
 import pytest
 from guidance_agent.knowledge.pension_knowledge import (
     PENSION_KNOWLEDGE,
@@ -7,8 +12,36 @@ from guidance_agent.knowledge.pension_knowledge import (
     get_regulation_info,
     get_typical_scenario,
     get_fee_structure,
+    get_new_state_pension,
+    get_cetv,
+    get_apta,
+    get_age_bands,
+    get_pension_knowledge,
+    get_logic_view,
+    get_description,
+    get_value,
+    get_path,
+    pension_types_for_provider,
+    pension_types_with_feature,
+    providers_for,
+    get_fee_bounds,
+    get_value_bounds,
+    get_numeric_ranges,
+    get_range,
+    get_numeric_constants,
+    get_constant,
+    AgeBand,
+    CETV,
+    FeeRange,
+    NewStatePension,
+    Provider,
+    RiskLevel,
+    TaxBand,
     validate_pension_value_for_age,
+    validate_many,
+    validate_many_sql,
     parse_age_range,
+    thaw,
 )
 
 
@@ -18,12 +51,12 @@ class TestPensionKnowledgeStructure:
     def test_pension_knowledge_exists(self):
         """Test that PENSION_KNOWLEDGE dictionary exists."""
         assert PENSION_KNOWLEDGE is not None
-        assert isinstance(PENSION_KNOWLEDGE, dict)
+        assert isinstance(PENSION_KNOWLEDGE, Mapping)
 
     def test_pension_types_exist(self):
         """Test that pension types are defined."""
         assert "pension_types" in PENSION_KNOWLEDGE
-        assert isinstance(PENSION_KNOWLEDGE["pension_types"], dict)
+        assert isinstance(PENSION_KNOWLEDGE["pension_types"], Mapping)
 
     def test_defined_contribution_pension_type(self):
         """Test DC pension type has required fields."""
@@ -33,7 +66,7 @@ class TestPensionKnowledgeStructure:
         assert "common_features" in dc
         assert "typical_fees" in dc
         assert "fca_considerations" in dc
-        assert isinstance(dc["typical_providers"], list)
+        assert isinstance(dc["typical_providers"], tuple)
         assert len(dc["typical_providers"]) > 0
 
     def test_defined_benefit_pension_type(self):
@@ -42,6 +75,7 @@ class TestPensionKnowledgeStructure:
         assert "description" in db
         assert "calculation" in db
         assert "typical_accrual_rates" in db
+        assert db["typical_accrual_rates"] == (1 / 60, 1 / 80)
         assert "fca_warning" in db
         assert "special_features" in db
         assert "transfer_value_multiple" in db
@@ -99,6 +133,11 @@ class TestPensionKnowledgeAccessors:
         info = get_pension_type_info("nonexistent_type")
         assert info is None
 
+    def test_get_pension_type_info_takes_only_the_type(self):
+        """Test the lookup accepts the pension type and nothing else."""
+        with pytest.raises(TypeError):
+            get_pension_type_info("defined_contribution", {})
+
     def test_get_regulation_info_db_transfers(self):
         """Test getting DB transfer regulation info."""
         info = get_regulation_info("db_transfers")
@@ -141,6 +180,13 @@ class TestPensionKnowledgeAccessors:
         assert "platform_fee" in fees
         assert "fund_fees" in fees
 
+    def test_fixed_record_accessors(self):
+        """Test record accessors return the cached records from their sections."""
+        assert get_new_state_pension().full_amount_2024_25 == 221.20
+        assert get_cetv() is PENSION_KNOWLEDGE["transfer_mechanics"]["cetv"]
+        assert get_cetv() is get_cetv()
+        assert get_apta().cost == (1500, 5000)
+
 
 class TestParseAgeRange:
     """Test age range parsing."""
@@ -164,6 +210,180 @@ class TestParseAgeRange:
         assert max_age == 9
 
 
+class TestProseSplit:
+    """Test the prose-free logic view and description lookup."""
+
+    def test_logic_view_strips_prose(self):
+        """Test prose fields are removed at every level and other fields kept."""
+        pension_types = get_logic_view("pension_types")
+        dc = pension_types["defined_contribution"]
+        assert "description" not in dc
+        assert "fca_considerations" not in dc
+        assert dc["min_value_range"] == (100, 500000)
+        assert "fca_warning" not in pension_types["defined_benefit"]
+        assert get_logic_view("pension_types") is pension_types
+
+    def test_logic_view_unknown_section(self):
+        """Test an unknown section raises KeyError."""
+        with pytest.raises(KeyError):
+            get_logic_view("unknown_section")
+
+    def test_get_description(self):
+        """Test prose is fetched by dotted path."""
+        assert get_description("pension_types.defined_benefit.fca_warning").startswith(
+            "Valuable guarantees lost"
+        )
+
+    def test_get_description_missing_path(self):
+        """Test paths that do not lead to text return None."""
+        assert get_description("pension_types.unknown.description") is None
+        assert get_description("pension_types.defined_contribution") is None
+        assert get_description("unknown_section.description") is None
+
+    def test_get_value(self):
+        """Test any value is fetched by dotted path."""
+        multiples = get_value("transfer_mechanics.cetv.typical_multiples")
+        assert multiples is PENSION_KNOWLEDGE["transfer_mechanics"]["cetv"]["typical_multiples"]
+        assert get_value("transfer_mechanics.cetv.typical_multiples") is multiples
+        assert get_value("pension_types") is PENSION_KNOWLEDGE["pension_types"]
+
+    def test_missing_paths_are_not_cached(self):
+        """Test unknown paths fall back to the default without filling the cache."""
+        from guidance_agent.knowledge.pension_knowledge import _resolve
+
+        _resolve.cache_clear()
+        assert get_value("glossary.unknown_term", "n/a") == "n/a"
+        assert get_value("unknown_section.key") is None
+        assert get_value("transfer_mechanics.apta.cost.min") is None
+        assert get_description("glossary.unknown_term") is None
+        assert _resolve.cache_info().currsize == 0
+
+        assert get_value("transfer_mechanics.apta.cost") == (1500, 5000)
+        assert _resolve.cache_info().currsize == 1
+
+    def test_get_path(self):
+        """Test values are fetched from the flat path index."""
+        assert get_path("transfer_mechanics", "cetv", "typical_multiples", "range") == (20, 40)
+        assert get_path("state_pension") is PENSION_KNOWLEDGE["state_pension"]
+        assert get_path("pension_types", "sipp") is PENSION_KNOWLEDGE["pension_types"]["sipp"]
+        with pytest.raises(KeyError):
+            get_path("pension_types", "unknown")
+
+    def test_get_value_missing_path(self):
+        """Test missing paths return the default."""
+        assert get_value("pension_types.unknown") is None
+        assert get_value("pension_types.sipp.description.x", default=0) == 0
+        assert get_value("unknown_section", default="n/a") == "n/a"
+
+
+class TestReverseIndices:
+    """Test provider and feature reverse lookups."""
+
+    def test_pension_types_for_provider(self):
+        """Test providers map to every pension type listing them."""
+        assert pension_types_for_provider("NEST") == {
+            "defined_contribution",
+            "stakeholder",
+            "master_trust",
+        }
+        assert pension_types_for_provider("Fidelity") == {"sipp"}
+
+    def test_pension_types_with_feature(self):
+        """Test features map to every pension type listing them."""
+        assert pension_types_with_feature("employer_contributions") == {"group_personal_pension"}
+        assert pension_types_with_feature("default_investment") == {"stakeholder", "master_trust"}
+
+    def test_unknown_values_return_empty(self):
+        """Test unknown providers and features return an empty frozenset."""
+        assert pension_types_for_provider("Unknown Ltd") == frozenset()
+        assert pension_types_with_feature("time_travel") == frozenset()
+
+
+class TestNumericBounds:
+    """Test array accessors for numeric ranges."""
+
+    def test_fee_bounds(self):
+        """Test fee bounds come from typical_fees min/max."""
+        bounds = get_fee_bounds("defined_contribution")
+        assert bounds.dtype == np.float64
+        assert bounds.tolist() == [0.003, 0.015]
+        assert get_fee_bounds("master_trust").tolist() == [0.003, 0.008]
+
+    def test_fee_bounds_missing(self):
+        """Test types without min/max fees have no fee bounds."""
+        assert get_fee_bounds("sipp") is None
+        assert get_fee_bounds("unknown_type") is None
+
+    def test_value_bounds(self):
+        """Test value bounds come from min_value_range."""
+        assert get_value_bounds("defined_contribution").tolist() == [100, 500000]
+        assert get_value_bounds("defined_benefit") is None
+
+    def test_bounds_are_shared_and_read_only(self):
+        """Test the same read-only array is returned on every call."""
+        bounds = get_fee_bounds("defined_contribution")
+        assert get_fee_bounds("defined_contribution") is bounds
+        with pytest.raises(ValueError):
+            bounds[0] = 0
+
+    def test_numeric_ranges_registry(self):
+        """Test every numeric pair is gathered into one read-only (n, 2) array."""
+        index, ranges = get_numeric_ranges()
+        assert ranges.shape == (len(index), 2)
+        assert ranges.flags.c_contiguous
+        assert ranges[index["transfer_mechanics.apta.cost"]].tolist() == [1500, 5000]
+        assert "pension_types.defined_contribution.typical_fees" in index
+        with pytest.raises(ValueError):
+            ranges[0, 0] = 1
+
+    def test_get_range(self):
+        """Test single pairs are fetched by dotted path."""
+        assert get_range("transfer_mechanics.cetv.typical_multiples.range").tolist() == [20, 40]
+        assert get_range("transfer_mechanics.cetv.validity") is None
+        assert get_range("unknown.path") is None
+
+    def test_numeric_constants_registry(self):
+        """Test scalar numbers are gathered into one read-only array."""
+        index, values = get_numeric_constants()
+        assert values.shape == (len(index),)
+        assert values[index["state_pension.new_state_pension.full_amount_2024_25"]] == 221.20
+        assert "pension_types.defined_contribution.min_value_range" not in index
+        with pytest.raises(ValueError):
+            values[0] = 1
+
+    def test_get_constant(self):
+        """Test single scalars are fetched by dotted path."""
+        assert get_constant("state_pension.new_state_pension.qualifying_years_needed") == 35.0
+        with pytest.raises(KeyError):
+            get_constant("state_pension.new_state_pension.triple_lock")
+
+
+class TestAgeBands:
+    """Test parsed age bands."""
+
+    def test_dc_age_bands(self):
+        """Test DC bands are parsed from typical_by_age and ordered by age."""
+        bands = get_age_bands("defined_contribution")
+        assert type(bands) is tuple
+        assert bands == (
+            AgeBand(25, 35, 1000, 15000),
+            AgeBand(35, 50, 10000, 100000),
+            AgeBand(50, 67, 50000, 300000),
+        )
+
+    def test_age_band_is_frozen(self):
+        """Test age bands are immutable slotted records."""
+        band = get_age_bands("defined_contribution")[0]
+        assert not hasattr(band, "__dict__")
+        with pytest.raises(AttributeError):
+            band.min_age = 0
+
+    def test_type_without_age_data_has_no_bands(self):
+        """Test types without typical_by_age return no bands."""
+        assert get_age_bands("sipp") == ()
+        assert get_age_bands("unknown_type") == ()
+
+
 class TestValidatePensionValue:
     """Test pension value validation for age."""
 
@@ -196,6 +416,277 @@ class TestValidatePensionValue:
         is_valid = validate_pension_value_for_age(30, 50000, "unknown_type")
         assert is_valid is True
 
+    def test_validate_boundary_age_uses_first_matching_range(self):
+        """Test a boundary age is checked against the earlier of two ranges."""
+        # 35 sits in both "25-35" and "35-50"; the 25-35 max (x2) is £30,000
+        assert validate_pension_value_for_age(35, 30000, "defined_contribution") is True
+        assert validate_pension_value_for_age(35, 30001, "defined_contribution") is False
+
+    def test_validate_age_outside_known_ranges(self):
+        """Test validation passes when age is outside every typical range."""
+        assert validate_pension_value_for_age(18, 1000000, "defined_contribution") is True
+        assert validate_pension_value_for_age(70, 1000000, "defined_contribution") is True
+
+    def test_validate_type_without_age_data(self):
+        """Test validation passes for known types with no typical_by_age data."""
+        assert validate_pension_value_for_age(30, 10000000, "sipp") is True
+
+
+class TestValidateMany:
+    """Test vectorised pension value validation."""
+
+    def test_matches_scalar_validation(self):
+        """Test batch results match the scalar function for every pair."""
+        ages = np.repeat(np.arange(15, 80), 8)
+        values = np.tile([0, 999, 1000, 30000, 30001, 200000, 600000, 600001], 65)
+        result = validate_many(ages, values, "defined_contribution")
+        expected = [
+            validate_pension_value_for_age(int(age), float(value), "defined_contribution")
+            for age, value in zip(ages, values)
+        ]
+        assert result.dtype == bool
+        assert result.tolist() == expected
+
+    def test_unknown_type_is_all_valid(self):
+        """Test types without age data validate everything."""
+        result = validate_many([30, 40], [1e9, 0], "unknown_type")
+        assert result.tolist() == [True, True]
+
+    def test_empty_batch(self):
+        """Test an empty batch returns an empty result."""
+        assert validate_many([], [], "defined_contribution").shape == (0,)
+
+
+class TestKnowledgeSQL:
+    """Test SQL batch validation against the in-memory age bands."""
+
+    def test_validate_many_sql_matches_scalar_validation(self):
+        """Test SQL batch validation matches the scalar function across types."""
+        rows = [
+            (age, value, pension_type)
+            for age in (20, 25, 35, 36, 50, 67, 70)
+            for value in (999, 30000, 30001, 600001)
+            for pension_type in ("defined_contribution", "sipp", "unknown_type")
+        ]
+        expected = [validate_pension_value_for_age(*row) for row in rows]
+        assert validate_many_sql(rows) == expected
+
+    def test_validate_many_sql_matches_validate_many(self):
+        """Test SQL batch validation matches validate_many for each pension type."""
+        ages = list(range(18, 76))
+        values = [1000.0 * (i % 40) ** 2 for i in range(len(ages))]
+        for pension_type in ("defined_contribution", "defined_benefit", "sipp", "unknown_type"):
+            rows = [(age, value, pension_type) for age, value in zip(ages, values)]
+            expected = validate_many(ages, values, pension_type).tolist()
+            assert validate_many_sql(rows) == expected
+
+    def test_validate_many_sql_empty(self):
+        """Test an empty batch returns no results and leaves no rows behind."""
+        validate_many_sql([(30, 1e9, "defined_contribution")])
+        assert validate_many_sql([]) == []
+
+
+class TestFrozenKnowledge:
+    """Test the knowledge is read-only and can be thawed for serialisation."""
+
+    def test_sections_are_built_on_first_access(self):
+        """Test sections are cached once built and membership does not build them."""
+        from guidance_agent.knowledge.pension_knowledge import _section
+
+        assert "glossary" in PENSION_KNOWLEDGE
+        assert "unknown_section" not in PENSION_KNOWLEDGE
+        assert PENSION_KNOWLEDGE["glossary"] is PENSION_KNOWLEDGE["glossary"]
+        assert _section.cache_info().currsize <= len(PENSION_KNOWLEDGE)
+        with pytest.raises(KeyError):
+            PENSION_KNOWLEDGE["unknown_section"]
+
+    def test_import_only_builds_pension_types(self):
+        """Test importing the package loads no section other than pension_types."""
+        import subprocess
+
+        code = (
+            "import sys, guidance_agent.knowledge.pension_knowledge as pk; "
+            "print(sorted(m.rsplit('.', 1)[1] for m in sys.modules "
+            "if m.startswith(pk.__name__ + '._')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "['_pension_types', '_records']"
+
+    def test_sections_are_module_attributes(self):
+        """Test each section is available as a lazily built module attribute."""
+        import guidance_agent.knowledge.pension_knowledge as pension_knowledge
+
+        assert pension_knowledge.state_pension is PENSION_KNOWLEDGE["state_pension"]
+        assert "regulatory_timeline" in dir(pension_knowledge)
+        with pytest.raises(AttributeError):
+            pension_knowledge.unknown_section
+
+    def test_all_sections_listed_in_order(self):
+        """Test iteration lists every top-level section."""
+        sections = list(PENSION_KNOWLEDGE)
+        assert sections[:4] == ["pension_types", "regulations", "typical_scenarios", "fee_structures"]
+        assert len(sections) == len(PENSION_KNOWLEDGE) == 19
+
+    def test_get_pension_knowledge_builds_every_section(self):
+        """Test the loader returns one cached, fully built read-only mapping."""
+        knowledge = get_pension_knowledge()
+        assert get_pension_knowledge() is knowledge
+        assert list(knowledge) == list(PENSION_KNOWLEDGE)
+        assert knowledge["glossary"] is PENSION_KNOWLEDGE["glossary"]
+        with pytest.raises(TypeError):
+            knowledge["glossary"] = {}
+
+    def test_knowledge_cannot_be_mutated(self):
+        """Test nested mappings reject item assignment."""
+        dc = PENSION_KNOWLEDGE["pension_types"]["defined_contribution"]
+        with pytest.raises(TypeError):
+            dc["description"] = "changed"
+        with pytest.raises(TypeError):
+            dc["typical_fees"]["min"] = 0
+
+    def test_keys_are_interned(self):
+        """Test string keys are interned, including non-identifier keys."""
+        typical_by_age = PENSION_KNOWLEDGE["pension_types"]["defined_contribution"]["typical_by_age"]
+        for key in typical_by_age:
+            assert sys.intern("".join(key)) is key
+
+    def test_repeated_string_values_are_shared(self):
+        """Test string values repeated across sections are one interned object."""
+        trust_providers = PENSION_KNOWLEDGE["pension_types"]["master_trust"]["typical_providers"]
+        young_providers = PENSION_KNOWLEDGE["typical_scenarios"]["young_worker_22_30"]["typical_providers"]
+        assert trust_providers[1] == young_providers[2] == "The People's Pension"
+        assert trust_providers[1] is young_providers[2]
+
+    def test_providers_are_enum_members(self):
+        """Test typical provider names freeze to Provider members equal to their names."""
+        providers = PENSION_KNOWLEDGE["pension_types"]["defined_contribution"]["typical_providers"]
+        assert providers[0] is Provider.NEST
+        assert providers == ("NEST", "Aviva", "Royal London", "Standard Life")
+        assert all(isinstance(provider, Provider) for provider in providers)
+        assert type(thaw(providers)[0]) is str
+        assert Provider.from_str("Aviva") is Provider.AVIVA
+        with pytest.raises(ValueError):
+            Provider.from_str("Unknown Provider")
+
+    def test_provider_examples_share_enum_members(self):
+        """Test provider landscape examples use the same Provider members."""
+        trusts = providers_for("master_trusts")
+        assert trusts[0] is Provider.NEST
+        assert trusts[0] is PENSION_KNOWLEDGE["pension_types"]["master_trust"]["typical_providers"][0]
+        assert providers_for("platforms") == ("Hargreaves Lansdown", "AJ Bell", "Interactive Investor", "Fidelity")
+        assert providers_for("workplace_schemes") == ()
+        assert providers_for("unknown_category") == ()
+
+    def test_risk_labels_are_ordered_levels(self):
+        """Test asset class risk labels freeze to ordered RiskLevel members."""
+        asset_classes = PENSION_KNOWLEDGE["investment_concepts"]["asset_classes"]
+        assert asset_classes["cash"]["risk"] is RiskLevel.VERY_LOW
+        assert asset_classes["bonds_gilts"]["risk"] < asset_classes["equities"]["risk"]
+        assert str(asset_classes["equities"]["risk"]) == "Medium to high"
+        assert get_value("investment_concepts.asset_classes.cash.risk") == "Very low"
+        assert RiskLevel.VERY_LOW.level == 0
+        assert RiskLevel.HIGH.level == 5
+        assert RiskLevel.LOW_TO_MEDIUM < RiskLevel.MEDIUM
+        assert sorted(RiskLevel, reverse=True)[0] is RiskLevel.HIGH
+        assert asset_classes["alternatives"]["risk"] == "Varies - often high"
+        assert thaw(asset_classes["cash"])["risk"] == "Very low"
+
+    def test_unknown_providers_stay_strings(self):
+        """Test provider names missing from the enum freeze to plain strings."""
+        from guidance_agent.knowledge.pension_knowledge import _freeze
+
+        providers = _freeze({"typical_providers": ["NEST", "New Provider"]})["typical_providers"]
+        assert providers == (Provider.NEST, "New Provider")
+        assert not isinstance(providers[1], Provider)
+
+    def test_min_max_leaves_are_fee_ranges(self):
+        """Test {"min", "max"} leaves become FeeRange with key access kept."""
+        fees = PENSION_KNOWLEDGE["pension_types"]["defined_contribution"]["typical_fees"]
+        assert fees == FeeRange(0.003, 0.015)
+        assert fees["min"] == fees.min == 0.003
+        assert fees["max"] == fees[1] == 0.015
+        with pytest.raises(KeyError):
+            fees["count"]
+
+    def test_rate_band_leaves_are_tax_bands(self):
+        """Test {"rate", "bands"} leaves become TaxBand with key access kept."""
+        rates = PENSION_KNOWLEDGE["tax_rules"]["income_tax_on_pensions"]["rates_england_wales_ni"]
+        band = rates["additional_rate"]
+        assert band == TaxBand(0.45, (125141, None))
+        assert band["rate"] == band.rate == 0.45
+        with pytest.raises(KeyError):
+            band["description"]
+
+    def test_fixed_schema_subtrees_are_slotted_records(self):
+        """Test fixed-schema sub-trees become slotted records that still read as mappings."""
+        state = PENSION_KNOWLEDGE["state_pension"]["new_state_pension"]
+        cetv = PENSION_KNOWLEDGE["transfer_mechanics"]["cetv"]
+        assert isinstance(state, NewStatePension) and isinstance(cetv, CETV)
+        assert not hasattr(cetv, "__dict__")
+        assert state.qualifying_years_needed == state["qualifying_years_needed"] == 35
+        assert cetv.typical_multiples["range"] == (20, 40)
+        assert isinstance(cetv, Mapping) and "validity" in cetv
+        with pytest.raises(KeyError):
+            cetv["unknown_field"]
+        with pytest.raises(AttributeError):
+            cetv.validity = "Forever"
+
+    def test_thaw_converts_slotted_records(self):
+        """Test thaw turns slotted records into plain dicts."""
+        apta = thaw(PENSION_KNOWLEDGE["transfer_mechanics"])["apta"]
+        assert type(apta) is dict
+        assert apta["cost"] == [1500, 5000]
+
+    def test_thaw_restores_record_leaves(self):
+        """Test thaw turns records back into their original dict form."""
+        income_tax = thaw(PENSION_KNOWLEDGE["tax_rules"]["income_tax_on_pensions"])
+        assert income_tax["rates_scotland"]["top_rate"] == {"rate": 0.48, "bands": [125141, None]}
+        assert json.loads(json.dumps(income_tax)) == income_tax
+
+    def test_tag_lists_are_shared_frozensets(self):
+        """Test tag vocabularies freeze to frozensets shared across sections."""
+        dc_types = PENSION_KNOWLEDGE["typical_scenarios"]["young_worker_22_30"]["common_types"]
+        features = PENSION_KNOWLEDGE["pension_types"]["master_trust"]["common_features"]
+        assert dc_types == frozenset({"defined_contribution"})
+        assert "auto_enrollment_compliant" in features
+        ordered = PENSION_KNOWLEDGE["pension_types"]["master_trust"]["typical_providers"]
+        assert isinstance(ordered, tuple)
+
+    def test_identical_tag_sets_are_one_object(self):
+        """Test identical tag sets are canonicalised to a single instance."""
+        from guidance_agent.knowledge.pension_knowledge import _freeze
+
+        first = _freeze({"common_features": ["b", "a"]})["common_features"]
+        second = _freeze({"restrictions": ["a", "b"]})["restrictions"]
+        assert first is second
+
+    def test_thaw_sorts_tag_sets(self):
+        """Test tag sets thaw to sorted lists."""
+        thawed = thaw(PENSION_KNOWLEDGE["pension_types"]["defined_contribution"])
+        assert thawed["common_features"] == ["death_benefits", "flexible_access", "investment_choice"]
+
+    def test_accessor_returns_read_only_mapping(self):
+        """Test accessors return the shared frozen mapping."""
+        info = get_pension_type_info("defined_contribution")
+        assert info is PENSION_KNOWLEDGE["pension_types"]["defined_contribution"]
+        with pytest.raises(TypeError):
+            info["description"] = "changed"
+
+    def test_accessors_are_cached(self):
+        """Test repeated accessor calls are served from the cache."""
+        get_regulation_info.cache_clear()
+        first = get_regulation_info("small_pots")
+        assert get_regulation_info("small_pots") is first
+        assert get_regulation_info.cache_info().hits == 1
+
+    def test_thaw_returns_json_serialisable_copy(self):
+        """Test thaw converts mappings to dicts and tuples to lists."""
+        dc = thaw(PENSION_KNOWLEDGE["pension_types"]["defined_contribution"])
+        assert isinstance(dc, dict)
+        assert isinstance(dc["typical_fees"], dict)
+        assert dc["typical_by_age"]["25-35"] == [1000, 15000]
+        assert json.loads(json.dumps(dc)) == dc
+
 
 class TestPensionKnowledgeConsistency:
     """Test consistency and data quality of pension knowledge."""
@@ -222,7 +713,7 @@ class TestPensionKnowledgeConsistency:
         """Test fee structures have valid percentage values."""
         fees = PENSION_KNOWLEDGE["fee_structures"]
         for category, fee_info in fees.items():
-            if isinstance(fee_info, dict):
+            if isinstance(fee_info, Mapping):
                 for key, value in fee_info.items():
                     if isinstance(value, (int, float)):
                         assert 0 <= value <= 0.05, f"{category}.{key} fee {value} seems unrealistic"
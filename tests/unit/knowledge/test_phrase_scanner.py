@@ -0,0 +1,36 @@
+"""Tests for scanning text for knowledge phrases."""
+
+from guidance_agent.knowledge.phrase_scanner import scan_text
+
+
+class TestScanText:
+    """Test phrase scanning over free text."""
+
+    def test_finds_providers_case_insensitively(self):
+        """Test provider names are found regardless of case."""
+        hits = scan_text("I have pots with nest and Hargreaves Lansdown.")
+        assert [hit.phrase for hit in hits] == ["NEST", "Hargreaves Lansdown"]
+        assert hits[0].start == 17
+        assert "pension_types.defined_contribution.typical_providers" in hits[0].sources
+
+    def test_finds_red_flags(self):
+        """Test scam warning phrases are found with their sources."""
+        hits = scan_text("Someone called with UPFRONT FEES and time pressure")
+        assert [hit.phrase for hit in hits] == ["Upfront fees", "Time pressure"]
+        assert hits[0].sources == (
+            "regulations.pension_scams_regulations.red_flags",
+            "transfer_mechanics.pension_scams.warning_signs",
+        )
+
+    def test_matches_whole_words_only(self):
+        """Test phrases inside longer words are not matched."""
+        assert scan_text("The nesting box and the avivarium") == []
+
+    def test_prefers_longest_phrase(self):
+        """Test the longest phrase wins where phrases overlap."""
+        hits = scan_text("Unsolicited contact about pension from a stranger")
+        assert [hit.phrase for hit in hits] == ["Unsolicited contact about pension"]
+
+    def test_no_hits(self):
+        """Test text without any phrases returns no hits."""
+        assert scan_text("What is my state pension age?") == []
@@ -0,0 +1,36 @@
+"""Tests for vectorised income tax bands."""
+
+import numpy as np
+import pytest
+
+from guidance_agent.knowledge.tax_bands import apply_income_tax
+
+
+class TestApplyIncomeTax:
+    """Test marginal income tax over arrays of incomes."""
+
+    def test_england_bands(self):
+        """Test tax at and across the England, Wales and NI band boundaries."""
+        incomes = np.array([0, 12570, 20000, 50270, 60000, 150000])
+        tax = apply_income_tax(incomes)
+        expected = [0, 0, 1486, 7540, 11432, 48675]
+        assert tax == pytest.approx(expected)
+
+    def test_scotland_bands(self):
+        """Test Scottish starter and basic rate bands."""
+        tax = apply_income_tax([14876, 20000], "scotland")
+        assert tax == pytest.approx([438.14, 1462.94])
+
+    def test_negative_income_is_untaxed(self):
+        """Test negative incomes are treated as zero."""
+        assert apply_income_tax([-500]).tolist() == [0.0]
+
+    def test_preserves_shape(self):
+        """Test the result has the same shape as the input."""
+        incomes = np.full((2, 3), 30000.0)
+        assert apply_income_tax(incomes).shape == (2, 3)
+
+    def test_unknown_jurisdiction(self):
+        """Test an unknown jurisdiction raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown tax jurisdiction"):
+            apply_income_tax([30000], "wales_only")
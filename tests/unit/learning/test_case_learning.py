@@ -1,14 +1,16 @@
 """Unit tests for learning from successful consultations."""
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 from datetime import datetime
 
 from tests.fixtures.embeddings import EMBEDDING_DIMENSION as EMBEDDING_DIM
 
 from guidance_agent.learning.case_learning import (
+    _extract_dialogue_techniques,
     learn_from_successful_consultation,
+    learn_from_successful_consultations,
     extract_case_from_consultation,
     classify_task_type,
     summarise_customer_situation,
@@ -191,6 +193,64 @@ class TestClassifyTaskType:
         task_type = classify_task_type(question)
         assert task_type == TaskType.GENERAL_INQUIRY
 
+    def test_classify_db_transfer(self):
+        """Test a DB keyword with a transfer outranks the tax and transfer checks."""
+        question = "Should I transfer my DB pension and what tax would I pay?"
+        assert classify_task_type(question) == TaskType.DEFINED_BENEFIT_TRANSFER
+        assert classify_task_type("What is a defined benefit scheme?") == TaskType.GENERAL_INQUIRY
+
+    def test_classify_matches_keywords_inside_words(self):
+        """Test keywords match as substrings, as in "accessing" and "inflexible"."""
+        assert classify_task_type("Can I start accessing it?") == TaskType.WITHDRAWAL_OPTIONS
+        assert classify_task_type("Is my plan too inflexible?") == TaskType.DRAWDOWN_STRATEGY
+        assert classify_task_type("Is an ANNUITY right for me?") == TaskType.ANNUITY_OPTIONS
+
+
+class TestExtractDialogueTechniques:
+    """Tests for _extract_dialogue_techniques function."""
+
+    def test_signposts_in_phrase_order_per_message(self):
+        """Test each phrase yields its first sentence once, in phrase-list order."""
+        history = [
+            {"role": "customer", "content": "Let me explain my situation."},
+            {
+                "role": "advisor",
+                "content": "It depends on your goals. Let Me Explain the options. "
+                "Here's what this means for you",
+            },
+        ]
+        techniques = _extract_dialogue_techniques(history, 0.9)
+        assert techniques["signposting_examples"] == [
+            "Let Me Explain the options",
+            "Here's what this means for you",
+            "It depends on your goals",
+        ]
+
+    def test_stops_scanning_once_examples_are_full(self):
+        """Test later messages are not scanned once every example list is full."""
+        class Unscanned(str):
+            def split(self, *args, **kwargs):
+                raise AssertionError("message scanned after every example list was full")
+
+        full = {
+            "role": "advisor",
+            "content": "Hi Sam. Let me explain, does that help? Good. "
+            "One option is drawdown. Is that clear?",
+        }
+        history = [full, full, {"role": "advisor", "content": Unscanned("Let me help?")}]
+        techniques = _extract_dialogue_techniques(history, 0.9)
+        assert len(techniques["signposting_examples"]) == 3
+        assert techniques["personalization_examples"] == ["Hi Sam", "Hi Sam"]
+
+    def test_questions_and_greetings(self):
+        """Test engagement questions and greeting sentences are collected."""
+        history = [
+            {"role": "advisor", "content": "Hi Sam, thanks for coming. What matters most to you?"},
+        ]
+        techniques = _extract_dialogue_techniques(history, 0.9)
+        assert techniques["engagement_questions"] == ["What matters most to you?"]
+        assert techniques["personalization_examples"] == ["Hi Sam, thanks for coming"]
+
 
 class TestSummariseCustomerSituation:
     """Tests for summarise_customer_situation function."""
@@ -216,6 +276,27 @@ class TestSummariseCustomerSituation:
         summary = summarise_customer_situation(sample_customer_profile)
         assert "medium" in summary.lower() or "moderate" in summary.lower()
 
+    def test_summarise_formats_amounts(self, sample_customer_profile):
+        """Test amounts are rounded to whole pounds with thousands separators."""
+        sample_customer_profile.financial.annual_income = 54999.7
+        sample_customer_profile.pensions.append(
+            PensionPot(
+                pot_id="pot-456",
+                provider="XYZ Scheme",
+                pot_type="defined_benefit",
+                current_value=1250.4,
+                projected_value=1500.0,
+                age_accessible=60,
+                is_db_scheme=True,
+            )
+        )
+
+        summary = summarise_customer_situation(sample_customer_profile)
+
+        assert "Annual income £55,000, total assets £200,000" in summary
+        assert "2 pension pot(s) worth £151,250 total" in summary
+        assert "Includes 1 defined benefit pension(s)" in summary
+
 
 class TestExtractCaseFromConsultation:
     """Tests for extract_case_from_consultation function."""
@@ -418,3 +499,66 @@ class TestLearnFromSuccessfulConsultation:
         # Should still add case for partial success
         case_count = db_session.query(Case).count()
         assert case_count == 1
+
+
+class TestLearnFromSuccessfulConsultations:
+    """Tests for learn_from_successful_consultations function."""
+
+    @patch("guidance_agent.learning.case_learning.embed")
+    @patch("guidance_agent.learning.case_learning.embed_batch")
+    def test_embeds_situations_in_one_batch(
+        self,
+        mock_embed_batch,
+        mock_embed,
+        sample_customer_profile,
+        sample_guidance,
+        successful_outcome,
+        failed_outcome,
+    ):
+        """Test distinct situations are embedded together and failures skipped."""
+        mock_embed_batch.side_effect = lambda texts: [[0.1] * EMBEDDING_DIM for _ in texts]
+        case_base = MagicMock()
+
+        added = learn_from_successful_consultations(
+            case_base,
+            [
+                {
+                    "customer_profile": sample_customer_profile,
+                    "guidance_provided": f"{sample_guidance} ({i})",
+                    "outcome": outcome,
+                }
+                for i, outcome in enumerate([successful_outcome, failed_outcome, successful_outcome])
+            ],
+        )
+
+        assert added == 2
+        mock_embed.assert_not_called()
+        mock_embed_batch.assert_called_once()
+        # Both successful cases share one situation summary
+        assert len(mock_embed_batch.call_args.args[0]) == 1
+        assert case_base.add.call_count == 2
+        metadata = case_base.add.call_args.kwargs["metadata"]
+        assert metadata["guidance_provided"] == f"{sample_guidance} (2)"
+        assert len(case_base.add.call_args.kwargs["embedding"]) == EMBEDDING_DIM
+
+    @patch("guidance_agent.learning.case_learning.embed_batch")
+    def test_no_successful_consultations(
+        self, mock_embed_batch, sample_customer_profile, sample_guidance, failed_outcome
+    ):
+        """Test nothing is embedded when every consultation failed."""
+        case_base = MagicMock()
+
+        added = learn_from_successful_consultations(
+            case_base,
+            [
+                {
+                    "customer_profile": sample_customer_profile,
+                    "guidance_provided": sample_guidance,
+                    "outcome": failed_outcome,
+                }
+            ],
+        )
+
+        assert added == 0
+        mock_embed_batch.assert_not_called()
+        case_base.add.assert_not_called()
@@ -13,6 +13,7 @@ from guidance_agent.learning.reflection import (
     refine_principle,
     judge_rule_value,
     learn_from_failure,
+    learn_from_failures,
 )
 from guidance_agent.core.types import (
     OutcomeResult,
@@ -542,3 +543,92 @@ class TestLearnFromFailure:
         # Should not add rules for successful outcomes
         final_count = db_session.query(Rule).count()
         assert final_count == initial_count
+
+
+class TestLearnFromFailures:
+    """Tests for learn_from_failures function."""
+
+    @patch("guidance_agent.learning.reflection.embed")
+    @patch("guidance_agent.learning.reflection.embed_batch")
+    @patch("guidance_agent.learning.reflection.judge_rule_value")
+    @patch("guidance_agent.learning.reflection.refine_principle")
+    @patch("guidance_agent.learning.reflection.validate_principle")
+    @patch("guidance_agent.learning.reflection.reflect_on_failure")
+    def test_embeds_accepted_rules_in_one_batch(
+        self,
+        mock_reflect,
+        mock_validate,
+        mock_refine,
+        mock_judge,
+        mock_embed_batch,
+        mock_embed,
+        sample_customer_profile,
+        sample_guidance,
+        failed_outcome,
+    ):
+        """Test accepted principles are embedded together and rejected ones skipped."""
+        mock_reflect.return_value = {"principle": "Check understanding", "domain": "communication"}
+        mock_validate.return_value = {"valid": True, "confidence": 0.8, "reason": "Good"}
+        mock_refine.side_effect = ["Rule one", "Rule two", "Rule three"]
+        mock_judge.side_effect = [True, False, True]
+        mock_embed_batch.side_effect = lambda texts: [[0.1] * EMBEDDING_DIM for _ in texts]
+        successful_outcome = OutcomeResult(
+            status=OutcomeStatus.SUCCESS,
+            successful=True,
+            customer_satisfaction=9.0,
+        )
+        rules_base = MagicMock()
+
+        added = learn_from_failures(
+            rules_base,
+            [
+                {
+                    "customer_profile": sample_customer_profile,
+                    "guidance_provided": sample_guidance,
+                    "outcome": outcome,
+                }
+                for outcome in [failed_outcome, successful_outcome, failed_outcome, failed_outcome]
+            ],
+        )
+
+        assert added == 2
+        assert mock_reflect.call_count == 3
+        mock_embed.assert_not_called()
+        mock_embed_batch.assert_called_once_with(["Rule one", "Rule three"])
+        assert [call.kwargs["metadata"]["principle"] for call in rules_base.add.call_args_list] == [
+            "Rule one",
+            "Rule three",
+        ]
+        assert rules_base.add.call_args.kwargs["metadata"]["confidence"] == 0.8
+
+    @patch("guidance_agent.learning.reflection.embed_batch")
+    @patch("guidance_agent.learning.reflection.validate_principle")
+    @patch("guidance_agent.learning.reflection.reflect_on_failure")
+    def test_no_accepted_rules(
+        self,
+        mock_reflect,
+        mock_validate,
+        mock_embed_batch,
+        sample_customer_profile,
+        sample_guidance,
+        failed_outcome,
+    ):
+        """Test nothing is embedded when every principle is rejected."""
+        mock_reflect.return_value = {"principle": "Bad idea", "domain": "general"}
+        mock_validate.return_value = {"valid": False, "confidence": 0.2, "reason": "Not compliant"}
+        rules_base = MagicMock()
+
+        added = learn_from_failures(
+            rules_base,
+            [
+                {
+                    "customer_profile": sample_customer_profile,
+                    "guidance_provided": sample_guidance,
+                    "outcome": failed_outcome,
+                }
+            ],
+        )
+
+        assert added == 0
+        mock_embed_batch.assert_not_called()
+        rules_base.add.assert_not_called()
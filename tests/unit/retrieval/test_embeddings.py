@@ -1,9 +1,14 @@
 """Tests for embedding utilities."""
 
+import importlib
+import sys
+
 import pytest
 from unittest.mock import patch, MagicMock
 
-from guidance_agent.retrieval.embeddings import embed, embed_batch
+import numpy as np
+
+from guidance_agent.retrieval.embeddings import cosine_similarity, embed, embed_batch
 from tests.fixtures.embeddings import EMBEDDING_DIMENSION as EMBEDDING_DIM
 
 
@@ -97,3 +102,116 @@ class TestEmbeddings:
         assert result[0] == [0.1, 0.2]
         assert result[1] == [0.3, 0.4]
         assert result[2] == [0.5, 0.6]
+
+
+class TestEmbedBatch:
+    """Test batched embedding over several API calls."""
+
+    @patch("guidance_agent.retrieval.embeddings.embedding")
+    def test_chunks_keep_input_order(self, mock_embedding, monkeypatch):
+        """Test texts split across concurrent calls come back in input order."""
+        monkeypatch.setenv("LITELLM_DROP_PARAMS", "true")
+        mock_embedding.side_effect = lambda model, input: MagicMock(
+            data=[{"embedding": [float(text)]} for text in input]
+        )
+        texts = [str(i) for i in range(25)]
+
+        result = embed_batch(texts, batch_size=4)
+
+        assert result == [[float(i)] for i in range(25)]
+        assert mock_embedding.call_count == 7
+        assert all(len(call.kwargs["input"]) <= 4 for call in mock_embedding.call_args_list)
+
+
+class TestEmbedCache:
+    """Test repeated texts are served from the embedding cache."""
+
+    @staticmethod
+    def _respond(mock_embedding):
+        """Answer each request with one vector per input text."""
+        mock_embedding.side_effect = lambda model, input, **kwargs: MagicMock(
+            data=[{"embedding": [float(len(text)), 1.0]} for text in input]
+        )
+
+    @patch("guidance_agent.retrieval.embeddings.embedding")
+    def test_repeated_text_skips_api(self, mock_embedding, monkeypatch):
+        """Test a text embedded before is not sent again."""
+        monkeypatch.setenv("LITELLM_DROP_PARAMS", "false")
+        self._respond(mock_embedding)
+
+        first = embed("same text")
+        second = embed("same text")
+
+        assert first == second == [9.0, 1.0]
+        mock_embedding.assert_called_once()
+
+    @patch("guidance_agent.retrieval.embeddings.embedding")
+    def test_batch_sends_only_uncached_texts(self, mock_embedding, monkeypatch):
+        """Test a batch only requests texts missing from the cache, once each."""
+        monkeypatch.setenv("LITELLM_DROP_PARAMS", "false")
+        self._respond(mock_embedding)
+
+        embed("a")
+        result = embed(["a", "bb", "bb", "ccc"])
+
+        assert result == [[1.0, 1.0], [2.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        assert mock_embedding.call_args.kwargs["input"] == ["bb", "ccc"]
+
+    @patch("guidance_agent.retrieval.embeddings.embedding")
+    def test_cache_is_per_dimension(self, mock_embedding, monkeypatch):
+        """Test the same text at another dimension is embedded again."""
+        monkeypatch.setenv("LITELLM_DROP_PARAMS", "false")
+        self._respond(mock_embedding)
+
+        embed("text", dimensions=256)
+        embed("text", dimensions=512)
+
+        assert mock_embedding.call_count == 2
+
+    @patch("guidance_agent.retrieval.embeddings.embedding")
+    def test_returned_vectors_are_copies(self, mock_embedding, monkeypatch):
+        """Test mutating a returned vector does not change the cached one."""
+        monkeypatch.setenv("LITELLM_DROP_PARAMS", "false")
+        self._respond(mock_embedding)
+
+        embed("text")[0] = 99.0
+
+        assert embed("text") == [4.0, 1.0]
+
+
+class TestCosineSimilarity:
+    """Test cosine similarity between vectors."""
+
+    def test_matches_definition(self):
+        """Test the score is the normalised dot product."""
+        assert cosine_similarity([1.0, 0.0], [1.0, 1.0]) == pytest.approx(0.5**0.5)
+        assert cosine_similarity([1.0, 2.0], [-1.0, -2.0]) == pytest.approx(-1.0)
+
+    def test_accepts_arrays(self):
+        """Test NumPy arrays and lists give the same score."""
+        vec1 = np.linspace(-1, 1, EMBEDDING_DIM, dtype=np.float32)
+        vec2 = np.cos(vec1)
+        assert cosine_similarity(vec1, vec2) == pytest.approx(
+            cosine_similarity(vec1.tolist(), vec2.tolist())
+        )
+
+    def test_zero_vector(self):
+        """Test a zero vector has no similarity."""
+        assert cosine_similarity([0.0, 0.0], [1.0, 2.0]) == 0.0
+
+    def test_length_mismatch(self):
+        """Test vectors of different lengths are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            cosine_similarity([1.0, 2.0], [1.0, 2.0, 3.0])
+
+
+def test_module_imports_without_circular_import():
+    """Test the module imports first, from a clean package state, without a cycle."""
+    with patch.dict(sys.modules):
+        for name in [name for name in sys.modules if name.split(".")[0] == "guidance_agent"]:
+            del sys.modules[name]
+
+        module = importlib.import_module("guidance_agent.retrieval.embeddings")
+
+    assert callable(module.embed)
+    assert callable(module.cosine_similarity)
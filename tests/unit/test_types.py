@@ -82,6 +82,28 @@ class TestOutcomeResult:
         assert isinstance(data["outcome_id"], str)
         assert data["status"] == "success"
 
+    def test_outcome_from_dict_round_trip(self):
+        """Test reconstructing an outcome from its dictionary form."""
+        outcome = OutcomeResult(
+            status=OutcomeStatus.PARTIAL_SUCCESS,
+            customer_satisfaction=6.5,
+            fca_compliant=False,
+            issues=["No signposting"],
+        )
+
+        restored = OutcomeResult.from_dict(outcome.to_dict())
+
+        assert restored == outcome
+
+    def test_outcome_from_partial_dict_uses_defaults(self):
+        """Test missing keys fall back to field defaults."""
+        restored = OutcomeResult.from_dict({"customer_satisfaction": 7.0})
+
+        assert restored.customer_satisfaction == 7.0
+        assert restored.status == OutcomeStatus.SUCCESS
+        assert restored.fca_compliant is True
+        assert isinstance(restored.outcome_id, UUID)
+
 
 class TestCustomerProfile:
     """Tests for CustomerProfile and related types."""